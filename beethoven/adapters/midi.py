@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from typing import Any, Dict, Protocol, Tuple, Union
+from typing import Any, Dict, Iterable, List, NamedTuple, Protocol, Tuple, Union
 
 from mido import Message, MetaMessage, get_input_names, open_input, open_output
-from mido.backends.rtmidi import Input, Output
+
+try:
+    from mido.backends.rtmidi import Input, Output
+
+    RTMIDI_BACKEND = True
+except ImportError:  # pragma: no cover
+    # Offline rendering doesn't need a real-time backend
+    Input = Output = Any
+
+    RTMIDI_BACKEND = False
 
 from beethoven.models import Duration, Note
+from beethoven.utils.cache import cache
 
 #from beethoven.sequencer.players import Message as PlayerMessage
 
@@ -50,6 +60,9 @@ class MidiMessage:
     def to_mido(self) -> Message:
         return Message(self.type, note=self.note, channel=self.channel, velocity=self.velocity)
 
+    def to_bytes(self) -> bytes:
+        return encode_message(self.type, self.channel, self.note, self.velocity)  # type: ignore[no-any-return]
+
     @classmethod
     def get_tuple_from_message(cls, message: PlayerMessageProtocol, output: Output) -> Tuple[MidiMessage, MidiMessage]:
         midi_message_kwargs = {
@@ -69,6 +82,29 @@ class MidiMessage:
         # )
 
 
+class MidiEvent(NamedTuple):
+    """Note message with every field resolved, as scheduled by the sequencer"""
+
+    type: str
+    channel: int
+    note: int
+    velocity: int
+    output: Output | None = None
+
+    def to_mido(self) -> Message:
+        return Message(self.type, note=self.note, channel=self.channel, velocity=self.velocity)
+
+    def to_bytes(self) -> bytes:
+        return encode_message(self.type, self.channel, self.note, self.velocity)  # type: ignore[no-any-return]
+
+
+@cache(maxsize=4096)
+def encode_message(type: str, channel: int, note: int | None, velocity: int) -> bytes:
+    """Raw bytes of a channel message, checked by mido the first time only"""
+
+    return bytes(Message(type, note=note, channel=channel, velocity=velocity).bytes())
+
+
 @dataclass
 class MidiMetaMessage:
     output: Output
@@ -79,7 +115,7 @@ class MidiMetaMessage:
         return MetaMessage(self.type, text=self.text)
 
 
-MidiMessageType = Union[MidiMessage, MidiMetaMessage]
+MidiMessageType = Union[MidiMessage, MidiEvent, MidiMetaMessage]
 Inputs = Dict[str, Input]
 Outputs = Dict[str, Output]
 
@@ -128,11 +164,63 @@ class MidiAdapter:
             self.close_output(name)
 
     def send_message(self, message: MidiMessageType) -> None:
-        if message.type == "text":
+        if isinstance(message, MidiMetaMessage):
             message.output._send(message.to_mido())
         else:
+            assert message.output, "Output must be set"
+
             message.output.send(message.to_mido())
 
+    def send_messages(self, messages: Iterable[MidiMessageType]) -> None:
+        """Send messages sharing a deadline, encoded from cache and written in a row per output.
+
+        Meta messages are sent after the messages coming before them, keeping their order.
+        """
+
+        batches: Dict[int, Tuple[Output, List[bytes]]] = {}
+
+        for message in messages:
+            if isinstance(message, MidiMetaMessage):
+                self.send_batches(batches)
+                batches.clear()
+
+                self.send_message(message)
+                continue
+
+            if (batch := batches.get(id(message.output))) is None:
+                batch = batches[id(message.output)] = (message.output, [])
+
+            batch[1].append(message.to_bytes())
+
+        self.send_batches(batches)
+
+    def send_batches(self, batches: Dict[int, Tuple[Output, List[bytes]]]) -> None:
+        for output, encoded_messages in batches.values():
+            self.send_bytes(output, encoded_messages)
+
+    @staticmethod
+    def send_bytes(output: Output, encoded_messages: List[bytes]) -> None:
+        if output.closed:
+            raise ValueError("send() called on closed port")
+
+        # Raw bytes only go straight to ports of the rtmidi backend, whose port and send
+        # lock are internals of mido, any other output gets messages through send
+        if not (
+            RTMIDI_BACKEND and
+            isinstance(output, Output) and
+            hasattr(output, "_rt") and
+            hasattr(output, "_send_lock")
+        ):
+            for encoded_message in encoded_messages:
+                output.send(Message.from_bytes(encoded_message))
+
+            return
+
+        # Taken once for the whole batch
+        with output._send_lock:
+            for encoded_message in encoded_messages:
+                output._rt.send_message(encoded_message)
+
     def reset(self) -> None:
         for output in self.outputs.values():
             output.reset()
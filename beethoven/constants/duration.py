@@ -1,4 +1,5 @@
 from fractions import Fraction
+from math import lcm
 
 whole_value = Fraction(4)
 half_value = Fraction(2)
@@ -13,3 +14,6 @@ base_values = {
     "E": eighth_value,
     "S": sixteenth_value,
 }
+
+# Tick resolution of a quarter, sixteenths divided in up to 10 tuplets stay exact
+ticks_per_quarter = 4 * lcm(*range(1, 11))
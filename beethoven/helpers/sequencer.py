@@ -1,11 +1,19 @@
+from __future__ import annotations
+
 import logging
+from dataclasses import dataclass
+from heapq import heapify, heappop, heappush, heapreplace
+from itertools import count
 from logging import Logger
-from typing import Any, Dict, Generator, Tuple
+from math import lcm
+from typing import Any, Dict, Generator, List, NamedTuple, Sequence, Tuple
 
-from beethoven.models import (Chord, ChordItem,  # Scale,; TimeSignature,
-                              Duration, HarmonyItem, Note, TimeSection)
+from beethoven.models import (Chord, ChordItem,  # Scale,
+                              Duration, HarmonyItem, Note, TimeSection,
+                              TimeSignature)
 # from beethoven.sequencer.players import BasePlayer
 from beethoven.ui.exceptions import PlayerStopPlaying  # , SystemPlayer
+from beethoven.utils.cache import cache
 
 # from beethoven.ui.exceptions import PlayerStopPlaying
 
@@ -43,27 +51,115 @@ def note_sequencer(step: Duration, messages, round_robin: str):
         i += 1
 
 
+def tick_repeater(
+    cycle_ticks: int, messages: Sequence[Any], offset_ticks: int = 0
+) -> Generator[Tuple[int, Any], None, None]:
+    """note_repeater on integer ticks"""
+
+    timeline = offset_ticks
+
+    while 1:
+        for message in messages:
+            yield timeline, message
+
+        timeline += cycle_ticks
+
+
+def tick_sequencer(
+    step_ticks: int, messages: Sequence[Any], round_robin: str
+) -> Generator[Tuple[int, Any], None, None]:
+    """note_sequencer on integer ticks"""
+
+    timeline = 0
+    i = 0
+
+    while 1:
+        if round_robin[i % len(round_robin)] == "+":
+            for message in messages:
+                yield timeline, message
+
+        timeline += step_ticks
+        i += 1
+
+
+class PatternVoice(NamedTuple):
+    name: str
+    step: Duration
+    round_robin: str
+    velocity: int = 127
+
+
+@dataclass(frozen=True)
+class RhythmPattern:
+    """One cycle of note_sequencer like voices merged into a table of (tick, voice index)
+    events, sorted as a NoteSorter would merge them
+
+    The cycle is laid over whole bars of the time signature, so a pattern shorter than a
+    bar is repeated within it and one that doesn't fill its last bar restarts on the bar.
+    """
+
+    cycle_ticks: int
+    events: Tuple[Tuple[int, int], ...]
+
+    def __copy__(self) -> RhythmPattern:
+        return self
+
+    @classmethod
+    @cache(maxsize=128)
+    def compile(cls, voices: Tuple[PatternVoice, ...], time_signature: TimeSignature) -> RhythmPattern:
+        steps_ticks = [voice.step.to_ticks() for voice in voices]
+        pattern_ticks = lcm(
+            *(step_ticks * len(voice.round_robin) for step_ticks, voice in zip(steps_ticks, voices))
+        )
+        bar_ticks = time_signature.get_ticks()
+        cycle_ticks = max(pattern_ticks // bar_ticks, 1) * bar_ticks
+
+        events = []
+        for voice_index, (step_ticks, voice) in enumerate(zip(steps_ticks, voices)):
+            for step_index in range(-(-cycle_ticks // step_ticks)):
+                if voice.round_robin[step_index % len(voice.round_robin)] == "+":
+                    events.append((step_index * step_ticks, voice_index))
+
+        events.sort()
+
+        return cls(cycle_ticks=cycle_ticks, events=tuple(events))
+
+
 def sort_generator_outputs(generators: NoteGenerators) -> NoteGenerator:
-    values: Dict[str, Any] = {}
+    """Merge generators on their cursors, ties going to the first declared generator"""
 
-    for name, generator in generators.items():
+    heap: List[Tuple[Any, int, str, Any]] = []
+
+    for order, (name, generator) in enumerate(generators.items()):
         try:
-            values[name] = next(generator)
+            item = next(generator)
         except StopIteration:
-            pass
+            continue
+
+        heap.append((item[0], order, name, item))
 
-    while values:
-        key, item = sorted(values.items(), key=lambda x: x[1][0])[0]
+    heapify(heap)
+
+    while heap:
+        _, order, name, item = heap[0]
 
         yield item
 
         try:
-            values[key] = next(generators[key])
+            item = next(generators[name])
         except StopIteration:
-            del values[key]
+            heappop(heap)
+        else:
+            heapreplace(heap, (item[0], order, name, item))
 
 
 class BaseSorter:
+    """Merge named generators on their cursors through a heap.
+
+    Ties go to the generator added first; values pushed back with refeed are
+    queued after the generators already present.
+    """
+
     def __init__(self, generators: NoteGenerators | None = None, refeed_enabled: bool = False):
         self.generators = generators or {}
 
@@ -71,25 +167,62 @@ class BaseSorter:
 
         self.start_cursor: Duration
         self.end_cursor: Duration
-        self.values: Dict[str, Any] = {}
+        self.values: Dict[str, List[Any]] = {}
+        self.heap: List[List[Any]] = []
+        self.orders = count()
+        self.serials = count()
 
     def clear(self):
         self.values = {}
+        self.heap = []
+
+    def push(self, key: str, item: Tuple[Any, Any]) -> None:
+        """Set the pending item of key, keeping its place among ties if it already has one"""
+
+        if previous_entry := self.values.get(key):
+            order = previous_entry[1]
+        else:
+            order = next(self.orders)
+
+        # The serial keeps entries comparable when a stale one shares cursor and order
+        entry = [item[0], order, next(self.serials), key, item]
+
+        self.values[key] = entry
+        heappush(self.heap, entry)
+
+    def add_generator(self, name: str, generator: NoteGenerator) -> None:
+        self.generators[name] = generator
+
+        try:
+            self.push(name, next(generator))
+        except StopIteration:
+            pass
+
+    def remove_generator(self, name: str) -> None:
+        self.generators.pop(name, None)
+        self.values.pop(name, None)
 
     def refeed(self, key, item):
-        self.values[key + "_refeed"] = item
+        self.push(key + "_refeed", item)
+
+    def pop(self) -> List[Any]:
+        while self.heap:
+            entry = heappop(self.heap)
+
+            # Entries replaced or removed since they were pushed are skipped
+            if self.values.get(entry[3]) is entry:
+                return entry
+
+        raise StopIteration()
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if not self.values:
-            raise StopIteration()
-
-        key, [cursor, data] = sorted(self.values.items(), key=lambda x: x[1][0])[0]
+        _, _, _, key, [cursor, data] = self.pop()
 
         try:
-            self.values[key] = next(self.generators[key])
+            self.push(key, next(self.generators[key]))
         except (StopIteration, KeyError, PlayerStopPlaying):
             del self.values[key]
 
@@ -103,17 +236,10 @@ class BaseSorter:
 
 class NoteSorter(BaseSorter):
     def __init__(self, **generators):
-        super(NoteSorter, self).__init__()  # **kwargs)
-
-        self.values: Dict[str, Any] = {}
+        super(NoteSorter, self).__init__()
 
-        self.generators = generators
-        for name, generator in self.generators.items():
-            # print("#######", name, generator)
-            try:
-                self.values[name] = next(generator)
-            except StopIteration:
-                pass
+        for name, generator in generators.items():
+            self.add_generator(name, generator)
 
 
 """
@@ -2,10 +2,12 @@ from beethoven.indexes.data import (chords_index_data, degrees_index_data,
                                     intervals_index_data, notes_index_data,
                                     scales_index_data)
 from beethoven.indexes.objects import (ChordIndex, DegreeIndex, IntervalIndex,
-                                       NoteIndex, ScaleIndex)
+                                       NoteIndex, ScaleIndex,
+                                       TranspositionIndex)
 
 note_index = NoteIndex(notes_index_data)
 interval_index = IntervalIndex(intervals_index_data)
-chord_index = ChordIndex(chords_index_data)
-scale_index = ScaleIndex(scales_index_data)
+chord_index = ChordIndex(chords_index_data, interval_index=interval_index)
+scale_index = ScaleIndex(scales_index_data, interval_index=interval_index)
 degree_index = DegreeIndex(degrees_index_data)
+transposition_index = TranspositionIndex(note_index, interval_index)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 
 @dataclass
@@ -46,4 +46,46 @@ class ScaleData:
     names: List[str]
 
 
+@dataclass(frozen=True)
+class IntervalsTable:
+    intervals: Tuple[Tuple[str, int], ...]
+    semitones: Tuple[int, ...]
+    degrees: Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class ChordMatch:
+    root: int
+    name: str
+    inversion: int = 0
+    base: int | None = None
+    omitted_fifth: bool = False
+
+
+@dataclass(frozen=True)
+class ScaleMatch:
+    tonic: int
+    name: str
+    mask: int
+
+
+@dataclass(frozen=True)
+class Transposition:
+    """Destination spelling of a note name moved by an interval name,
+    the alterations of both are added to alteration_offset"""
+
+    name: str
+    alteration_offset: int
+    octave_gap: int
+
+
+@dataclass(frozen=True)
+class IntervalSpelling:
+    """Interval between two note names, the alterations of both are added to
+    alteration_offset"""
+
+    name: str
+    alteration_offset: int
+
+
 IndexDataModels = (NoteData, IntervalData, ChordData, ScaleData)
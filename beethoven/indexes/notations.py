@@ -6,6 +6,11 @@ class NoteNotationEnum(Enum):
     SYLLABIC = auto()
 
 
+class NoteSpellingEnum(Enum):
+    FLAT = auto()
+    SHARP = auto()
+
+
 class IntervalNotationEnum(Enum):
     SHORT = auto()
     LONG = auto()
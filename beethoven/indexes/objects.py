@@ -1,10 +1,16 @@
-from typing import Dict, List
-
-from beethoven.indexes.models import (ChordData, IntervalData, NoteData,
-                                      ScaleData)
+from itertools import product
+from typing import Dict, Iterable, List, Tuple
+
+from beethoven import parser
+from beethoven.indexes.models import (ChordData, ChordMatch, IntervalData,
+                                      IntervalSpelling, IntervalsTable,
+                                      NoteData, ScaleData, ScaleMatch,
+                                      Transposition)
 from beethoven.indexes.notations import (ChordNotationEnum,
                                          IntervalNotationEnum,
                                          NoteNotationEnum)
+from beethoven.utils.alterations import get_interval_alteration_int_from_str
+from beethoven.utils.pitch_class import PITCH_CLASS_COUNT, PitchClassSet
 
 
 class NoteIndex:
@@ -79,22 +85,50 @@ class IntervalIndex:
         else:  # notation == IntervalNotationEnum.LONG:
             return self.index_directory[index].long_name
 
+    def build_intervals_table(self, intervals_string: str) -> IntervalsTable:
+        intervals = []
+        semitones = []
+        degrees = []
+
+        for interval_string in intervals_string.split(","):
+            parsed = parser.parse(parser.interval_pattern, interval_string)
+
+            name = parsed["name"]
+            alteration = get_interval_alteration_int_from_str(parsed["alteration"], int(name))
+
+            intervals.append((name, alteration))
+            semitones.append(self.get_semitones(name) + alteration)
+            degrees.append(int(name) - 1)
+
+        return IntervalsTable(
+            intervals=tuple(intervals),
+            semitones=tuple(semitones),
+            degrees=tuple(degrees),
+        )
+
 
 class ChordIndex:
     directory: Dict[str, ChordData]
     interval_directory: Dict[str, ChordData]
     label_directory: Dict[str, List[ChordData]]
+    intervals_tables: Dict[str, IntervalsTable]
+    pitch_class_directory: Dict[Tuple[int, int], Tuple[ChordMatch, ...]]
 
-    def __init__(self, chords_data: List[ChordData]) -> None:
+    def __init__(self, chords_data: List[ChordData], interval_index: IntervalIndex) -> None:
         self.directory = {}
         self.interval_directory = {}
         self.label_directory = {}
+        self.intervals_tables = {}
+        self.pitch_class_directory = {}
 
         for chord_data in chords_data:
             for name in chord_data.names:
                 self.directory[name] = chord_data
 
             self.interval_directory[chord_data.intervals_string] = chord_data
+            self.intervals_tables[chord_data.intervals_string] = interval_index.build_intervals_table(
+                chord_data.intervals_string
+            )
 
             for label in chord_data.labels:
                 if not self.label_directory.get(label):
@@ -102,6 +136,69 @@ class ChordIndex:
 
                 self.label_directory[label].append(chord_data)
 
+        self.build_pitch_class_directory(chords_data)
+
+    def build_pitch_class_directory(self, chords_data: List[ChordData]) -> None:
+        """Index every chord of every root by (pitch class mask, bass pitch class)
+
+        Inversions, voicings omitting the fifth and slash chords with a bass outside the chord
+        are indexed as well.
+        """
+
+        directory: Dict[Tuple[int, int], List[ChordMatch]] = {}
+
+        def add(mask: int, bass: int, match: ChordMatch) -> None:
+            directory.setdefault((mask, bass), []).append(match)
+
+        for chord_data in chords_data:
+            intervals_table = self.intervals_tables[chord_data.intervals_string]
+
+            fifth_position = (
+                intervals_table.degrees.index(4)
+                if 4 in intervals_table.degrees and len(intervals_table.degrees) > 2
+                else None
+            )
+
+            for root in range(PITCH_CLASS_COUNT):
+                pitch_classes = [
+                    (root + semitones) % PITCH_CLASS_COUNT for semitones in intervals_table.semitones
+                ]
+                mask = PitchClassSet.from_indexes(pitch_classes).mask
+
+                no_fifth_mask = None
+                if fifth_position is not None:
+                    no_fifth_mask = PitchClassSet.from_indexes(
+                        pitch_classes[:fifth_position] + pitch_classes[fifth_position + 1:]
+                    ).mask
+
+                for inversion, bass in enumerate(pitch_classes):
+                    add(mask, bass, ChordMatch(root, chord_data.short_name, inversion=inversion))
+
+                    if no_fifth_mask is not None and inversion != fifth_position:
+                        no_fifth_match = ChordMatch(
+                            root, chord_data.short_name, inversion=inversion, omitted_fifth=True
+                        )
+
+                        add(no_fifth_mask, bass, no_fifth_match)
+
+                for base in range(PITCH_CLASS_COUNT):
+                    if base in pitch_classes:
+                        continue
+
+                    add(
+                        mask | 1 << base,
+                        base,
+                        ChordMatch(root, chord_data.short_name, base=base),
+                    )
+
+        def match_rank(match: ChordMatch) -> Tuple[bool, bool, int]:
+            return match.base is not None, match.omitted_fifth, match.inversion
+
+        # Plain chords come first, then the ones without fifth and finally the slash chords
+        self.pitch_class_directory = {
+            key: tuple(sorted(matches, key=match_rank)) for key, matches in directory.items()
+        }
+
     def is_valid(self, name: str) -> bool:
         return name in self.directory
 
@@ -111,6 +208,20 @@ class ChordIndex:
     def get_intervals(self, name: str) -> str:
         return self.directory[name].intervals_string
 
+    def get_intervals_table(self, name: str) -> IntervalsTable:
+        return self.intervals_tables[self.directory[name].intervals_string]
+
+    def identify(self, pitch_class_mask: int, bass: int) -> Tuple[ChordMatch, ...]:
+        return self.pitch_class_directory.get((pitch_class_mask, bass % PITCH_CLASS_COUNT), ())
+
+    def identify_midi_indexes(self, midi_indexes: Iterable[int]) -> Tuple[ChordMatch, ...]:
+        midi_indexes = list(midi_indexes)
+
+        if not midi_indexes:
+            return ()
+
+        return self.identify(PitchClassSet.from_indexes(midi_indexes).mask, min(midi_indexes))
+
     def get_name_from_intervals(
         self, intervals: str, notation: ChordNotationEnum = ChordNotationEnum.SHORT
     ) -> str:
@@ -137,21 +248,64 @@ class ChordIndex:
 class ScaleIndex:
     directory: Dict[str, ScaleData]
     label_directory: Dict[str, List[ScaleData]]
+    intervals_tables: Dict[str, IntervalsTable]
+    scale_matches: Tuple[ScaleMatch, ...]
+    subset_directory: Dict[int, Tuple[ScaleMatch, ...]]
+    closest_directory: Dict[int, Tuple[ScaleMatch, ...]]
 
-    def __init__(self, scales_data: List[ScaleData]) -> None:
+    def __init__(self, scales_data: List[ScaleData], interval_index: IntervalIndex) -> None:
         self.directory = {}
         self.label_directory = {}
+        self.intervals_tables = {}
+        self.scale_matches = ()
+        self.subset_directory = {}
+        self.closest_directory = {}
 
         for scale_data in scales_data:
             for name in scale_data.names:
                 self.directory[name] = scale_data
 
+            self.intervals_tables[scale_data.intervals_string] = interval_index.build_intervals_table(
+                scale_data.intervals_string
+            )
+
             for label in scale_data.labels:
                 if not self.label_directory.get(label):
                     self.label_directory[label] = []
 
                 self.label_directory[label].append(scale_data)
 
+        self.build_pitch_class_directories(scales_data)
+
+    def build_pitch_class_directories(self, scales_data: List[ScaleData]) -> None:
+        """Index every scale of every tonic by pitch class mask and by any subset of it"""
+
+        scale_matches = []
+        subset_directory: Dict[int, List[ScaleMatch]] = {}
+
+        for scale_data, tonic in product(scales_data, range(PITCH_CLASS_COUNT)):
+            intervals_table = self.intervals_tables[scale_data.intervals_string]
+
+            mask = PitchClassSet.from_indexes(
+                tonic + semitones for semitones in intervals_table.semitones
+            ).mask
+            scale_match = ScaleMatch(tonic=tonic, name=scale_data.names[0], mask=mask)
+
+            scale_matches.append(scale_match)
+
+            # Walk through every submask, down to the empty one
+            submask = mask
+            while True:
+                subset_directory.setdefault(submask, []).append(scale_match)
+
+                if not submask:
+                    break
+
+                submask = (submask - 1) & mask
+
+        self.scale_matches = tuple(scale_matches)
+        self.subset_directory = {mask: tuple(matches) for mask, matches in subset_directory.items()}
+
     def is_valid(self, name: str) -> bool:
         return name in self.directory
 
@@ -161,6 +315,28 @@ class ScaleIndex:
     def get_intervals(self, name: str) -> str:
         return self.directory[name].intervals_string
 
+    def get_intervals_table(self, name: str) -> IntervalsTable:
+        return self.intervals_tables[self.directory[name].intervals_string]
+
+    def get_scales_containing(self, pitch_class_mask: int) -> Tuple[ScaleMatch, ...]:
+        return self.subset_directory.get(pitch_class_mask, ())
+
+    def get_closest_scales(self, pitch_class_mask: int, limit: int = 5) -> List[ScaleMatch]:
+        """Return the scales with the lowest Hamming distance to the given pitch class mask,
+        the ranking of every scale being sorted once per mask and kept in closest_directory"""
+
+        closest_matches = self.closest_directory.get(pitch_class_mask)
+
+        if closest_matches is None:
+            closest_matches = self.closest_directory[pitch_class_mask] = tuple(
+                sorted(
+                    self.scale_matches,
+                    key=lambda scale_match: (scale_match.mask ^ pitch_class_mask).bit_count(),
+                )
+            )
+
+        return list(closest_matches[:limit])
+
     def get_scales_label_data(self) -> Dict[str, List[ScaleData]]:
         return self.label_directory
 
@@ -188,3 +364,92 @@ class DegreeIndex:
 
     def get_index(self, name: str) -> int:
         return self.directory.index(name.lower())
+
+
+class TranspositionIndex:
+    """Note and interval arithmetic precomputed for every note name and
+    interval name, alterations being linear they're left out of the keys"""
+
+    transpositions: Dict[Tuple[str, str, bool], Transposition]
+    interval_spellings: Dict[Tuple[str, str, int | None], IntervalSpelling]
+
+    max_octave_gap = 10
+
+    def __init__(self, note_index: NoteIndex, interval_index: IntervalIndex) -> None:
+        self.note_index = note_index
+        self.interval_index = interval_index
+
+        self.transpositions = {}
+        self.interval_spellings = {}
+
+        note_names = list(note_index.directory.keys())
+        interval_names = [
+            interval_data.short_name for interval_data in interval_index.index_directory.values()
+        ]
+
+        for note_name, interval_name, reverse in product(note_names, interval_names, (False, True)):
+            self.transpositions[(note_name, interval_name, reverse)] = self.build_transposition(
+                note_name, interval_name, reverse
+            )
+
+        octave_gaps = [None, *range(-self.max_octave_gap, self.max_octave_gap + 1)]
+
+        for note_name_1, note_name_2, octave_gap in product(note_names, note_names, octave_gaps):
+            if interval_spelling := self.build_interval_spelling(note_name_1, note_name_2, octave_gap):
+                self.interval_spellings[(note_name_1, note_name_2, octave_gap)] = interval_spelling
+
+    def build_transposition(self, note_name: str, interval_name: str, reverse: bool) -> Transposition:
+        degree_gap = int(interval_name) - 1
+        semitone_gap = self.interval_index.get_semitones(interval_name)
+
+        if reverse:
+            degree_gap *= -1
+            semitone_gap *= -1
+
+        origin_index = self.note_index.get_index(note_name)
+        octave_gap, target_degree = divmod(degree_gap + origin_index, 7)
+
+        origin_semitones = self.note_index.get_semitones(note_name)
+        destination_name = self.note_index.get_name_from_index(target_degree)
+        destination_semitones = self.note_index.get_semitones(destination_name)
+
+        return Transposition(
+            name=destination_name,
+            alteration_offset=(
+                origin_semitones + semitone_gap - destination_semitones - (12 * octave_gap)
+            ),
+            octave_gap=octave_gap,
+        )
+
+    def build_interval_spelling(
+        self, note_name_1: str, note_name_2: str, octave_gap: int | None
+    ) -> IntervalSpelling | None:
+        index_diff = self.note_index.get_index(note_name_2) - self.note_index.get_index(note_name_1)
+        semitones_diff = self.note_index.get_semitones(note_name_2) - self.note_index.get_semitones(
+            note_name_1
+        )
+
+        if octave_gap is None:
+            index_diff %= 7
+            semitones_diff %= 12
+        else:
+            index_diff += octave_gap * 7
+            semitones_diff += octave_gap * 12
+
+        if index_diff not in self.interval_index.index_directory:
+            return None
+
+        name = self.interval_index.get_name_from_index(index_diff)
+
+        return IntervalSpelling(
+            name=name,
+            alteration_offset=semitones_diff - self.interval_index.get_semitones(name),
+        )
+
+    def get_transposition(self, note_name: str, interval_name: str, reverse: bool = False) -> Transposition:
+        return self.transpositions[(note_name, interval_name, reverse)]
+
+    def get_interval_spelling(
+        self, note_name_1: str, note_name_2: str, octave_gap: int | None = None
+    ) -> IntervalSpelling:
+        return self.interval_spellings[(note_name_1, note_name_2, octave_gap)]
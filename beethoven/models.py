@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from copy import copy
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, fields, replace
 from fractions import Fraction
-# from functools import lru_cache
-from itertools import product
-from typing import Any, Dict, Generator, List, Sequence, Tuple, Union
+from itertools import count, product
+from math import lcm
+from typing import (Any, ClassVar, Dict, Generator, Iterable, List, Sequence,
+                    Tuple, Union)
 from uuid import UUID, uuid4
 
 from pyparsing import ParseException
@@ -13,28 +13,59 @@ from pyparsing import ParseException
 from beethoven import parser
 from beethoven.constants import duration as duration_constants
 from beethoven.indexes import (chord_index, degree_index, interval_index,
-                               note_index, scale_index)
+                               note_index, scale_index, transposition_index)
+from beethoven.indexes.notations import NoteSpellingEnum
 from beethoven.utils.alterations import (get_degree_alteration_int_from_str,
                                          get_degree_alteration_str_from_int,
                                          get_interval_alteration_int_from_str,
                                          get_interval_alteration_str_from_int,
                                          get_note_alteration_int_from_str,
                                          get_note_alteration_str_from_int)
-
-# cache = lru_cache(maxsize=None)
-
-
-def cache(f: Any) -> Any:
-    def swrapper(*args: Any, **kwargs: Any) -> Any:
-        return f(*args, **kwargs)
-    return swrapper
-
-
-@dataclass
+from beethoven.utils.cache import cache, copy_model
+from beethoven.utils.pitch_class import (MIDI_NOTE_COUNT, PITCH_CLASS_COUNT,
+                                         MidiNoteSet, PitchClassSet)
+
+PITCH_CLASS_SPELLINGS: Dict[NoteSpellingEnum, Tuple[Tuple[str, int], ...]] = {
+    NoteSpellingEnum.FLAT: (
+        ("C", 0),
+        ("D", -1),
+        ("D", 0),
+        ("E", -1),
+        ("E", 0),
+        ("F", 0),
+        ("G", -1),
+        ("G", 0),
+        ("A", -1),
+        ("A", 0),
+        ("B", -1),
+        ("B", 0),
+    ),
+    NoteSpellingEnum.SHARP: (
+        ("C", 0),
+        ("C", 1),
+        ("D", 0),
+        ("D", 1),
+        ("E", 0),
+        ("F", 0),
+        ("F", 1),
+        ("G", 0),
+        ("G", 1),
+        ("A", 0),
+        ("A", 1),
+        ("B", 0),
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Degree:
     name: str
     alteration: int = 0
 
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    interned: ClassVar[Dict[Tuple[str, int], Degree]] = {}
+
     def __post_init__(self) -> None:
         if not degree_index.is_valid(self.name):
             raise ValueError(f"Invalid name: {self.name}")
@@ -42,18 +73,35 @@ class Degree:
         if self.alteration < -3 or self.alteration > 3:
             raise ValueError(f"Invalid alteration: {self.alteration}, must be between -3 and 3")
 
+        object.__setattr__(self, "_hash", hash((self.name, self.alteration)))
+
     def __str__(self) -> str:
         return f"{get_degree_alteration_str_from_int(self.alteration)}{self.name}"
 
     def __hash__(self) -> int:
-        return hash(self.name + str(self.alteration))
+        return self._hash
+
+    def __copy__(self) -> Degree:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Degree:
+        return self
+
+    @classmethod
+    def intern(cls, name: str, alteration: int = 0) -> Degree:
+        key = (name, alteration)
+
+        if (degree := cls.interned.get(key)) is None:
+            degree = cls.interned[key] = cls(name=name, alteration=alteration)
+
+        return degree
 
     @property
     def index(self) -> int:
         return degree_index.get_index(self.name)
 
     @classmethod
-    @cache
+    @cache(maxsize=128)
     def parse(cls, string: str) -> Degree:
         parsed = parser.parse(parser.degree_pattern, string)
 
@@ -64,28 +112,34 @@ class Degree:
         return [cls.parse(degree_string) for degree_string in degrees_string.split(",")]
 
     @classmethod
-    @cache
+    @cache(maxsize=128)
     def build(cls, name: str, alteration: str | None = None) -> Degree:
-        return cls(
+        return cls.intern(
             name=name,
             alteration=get_degree_alteration_int_from_str(alteration) if alteration else 0,
         )
 
     def to_interval(self) -> Interval:
-        return Interval(name=str(degree_index.get_index(self.name) + 1), alteration=self.alteration)
+        return Interval.intern(name=str(degree_index.get_index(self.name) + 1), alteration=self.alteration)
 
     def remove_alteration(self) -> Degree:
-        return replace(self, alteration=0)
+        return Degree.intern(name=self.name)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Note:
     name: str
     alteration: int = 0
     octave: int | None = None
 
+    _hash: int = field(init=False, repr=False, compare=False)
+    _midi_index: int = field(init=False, repr=False, compare=False)
+
+    interned: ClassVar[Dict[Tuple[str, int, int | None], Note]] = {}
+    midi_notes_tables: ClassVar[Dict[NoteSpellingEnum, Tuple[Note, ...]]] = {}
+
     def __hash__(self) -> int:
-        return hash(self.name + str(self.alteration) + str(self.octave))
+        return self._hash
 
     def __str__(self) -> str:
         return f"{self.name}{get_note_alteration_str_from_int(self.alteration)}{self.octave if self.octave is not None else ''}"
@@ -100,16 +154,36 @@ class Note:
         if self.octave is not None and (self.octave < 0 or self.octave > 10):
             raise ValueError(f"Invalid octave: {self.octave}, must be between 0 and 10")
 
+        if not self.octave:
+            midi_index = (note_index.get_semitones(self.name) + self.alteration) % 12
+        else:
+            midi_index = 24 + note_index.get_semitones(self.name) + self.alteration + self.octave * 12
+
+        object.__setattr__(self, "_hash", hash((self.name, self.alteration, self.octave)))
+        object.__setattr__(self, "_midi_index", midi_index)
+
+    def __copy__(self) -> Note:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Note:
+        return self
+
+    @classmethod
+    def intern(cls, name: str, alteration: int = 0, octave: int | None = None) -> Note:
+        key = (name, alteration, octave)
+
+        if (note := cls.interned.get(key)) is None:
+            note = cls.interned[key] = cls(name=name, alteration=alteration, octave=octave)
+
+        return note
+
     @property
     def index(self) -> int:
-        return self.midi_index % 12
+        return self._midi_index % 12
 
     @property
     def midi_index(self) -> int:
-        if not self.octave:
-            return (note_index.get_semitones(self.name) + self.alteration) % 12
-
-        return 24 + note_index.get_semitones(self.name) + self.alteration + self.octave * 12
+        return self._midi_index
 
     # TODO: move to utils, setup a customized exception
     def check_octave_states(self, other: Note) -> None:
@@ -140,7 +214,7 @@ class Note:
         return self.midi_index >= other.midi_index
 
     @classmethod
-    @cache
+    @cache(maxsize=1024)
     def parse(cls, string: str) -> Note:
         parsed = parser.parse(parser.note_pattern, string)
 
@@ -151,98 +225,114 @@ class Note:
         return [cls.parse(note_string) for note_string in notes_string.split(",")]
 
     @classmethod
-    @cache
+    @cache(maxsize=1024)
     def build(cls, name: str, alteration: str | None = None, octave: int | None = None) -> Note:
-        return cls(
+        return cls.intern(
             name=name,
             alteration=get_note_alteration_int_from_str(alteration) if alteration else 0,
             octave=octave,
         )
 
     @classmethod
-    def from_midi_index(cls, index: int) -> Note:
-        octave, rest_index = divmod(index, 12)
-
-        note = cls.parse("C" + str(octave))
+    def from_midi_index(
+        cls,
+        index: int,
+        spelling: NoteSpellingEnum = NoteSpellingEnum.FLAT,
+        scale: Scale | None = None,
+    ) -> Note:
+        return cls.get_midi_notes_table(spelling=spelling, scale=scale)[index]
 
-        intervals = {
-            0: "1",
-            2: "2",
-            4: "3",
-            5: "4",
-            7: "5",
-            9: "6",
-            11: "7",
-        }
+    @classmethod
+    def get_midi_notes_table(
+        cls, spelling: NoteSpellingEnum = NoteSpellingEnum.FLAT, scale: Scale | None = None
+    ) -> Tuple[Note, ...]:
+        """Notes of all MIDI indexes, spelled as the scale notes when given,
+        falling back on the spelling policy"""
 
-        for semitones, interval_name in intervals.items():
-            if semitones >= rest_index:
-                interval = Interval.parse(interval_name)
-                interval.alteration = rest_index - semitones
+        if scale is None:
+            if (table := cls.midi_notes_tables.get(spelling)) is None:
+                table = cls.midi_notes_tables[spelling] = cls._build_midi_notes_table(spelling, None, None)
 
-                break
+            return table
 
-        return note.add_interval(interval)  # type: ignore[no-any-return]
+        return cls._build_midi_notes_table(spelling, scale.tonic, scale.name)  # type: ignore[no-any-return]
 
-    def add_interval(self, interval: Interval, reverse: bool = False) -> Note:
-        degree_gap = int(interval.name) - 1
-        semitone_gap = interval_index.get_semitones(interval.name) + interval.alteration
+    @classmethod
+    @cache(maxsize=64)
+    def _build_midi_notes_table(
+        cls, spelling: NoteSpellingEnum, tonic: Note | None, scale_name: str | None
+    ) -> Tuple[Note, ...]:
+        pitch_class_spellings = list(PITCH_CLASS_SPELLINGS[spelling])
 
-        if reverse:
-            degree_gap *= -1
-            semitone_gap *= -1
+        if tonic is not None and scale_name is not None:
+            for note in Scale(tonic=tonic, name=scale_name).notes:
+                pitch_class_spellings[note.index] = (note.name, note.alteration)
 
-        origin_index = note_index.get_index(self.name)
-        octave_gap, target_degree = divmod(degree_gap + origin_index, 7)
+        notes = []
+        for index in range(MIDI_NOTE_COUNT):
+            name, alteration = pitch_class_spellings[index % PITCH_CLASS_COUNT]
+            octave = (index - note_index.get_semitones(name) - alteration) // PITCH_CLASS_COUNT
 
-        origin_semitones = note_index.get_semitones(self.name)
-        destination_note = note_index.get_name_from_index(target_degree % 7)
-        destination_semitones = note_index.get_semitones(destination_note)
+            if not 0 <= octave <= 10:
+                name, alteration = PITCH_CLASS_SPELLINGS[spelling][index % PITCH_CLASS_COUNT]
+                octave = index // PITCH_CLASS_COUNT
 
-        destination_alteration = (
-            origin_semitones + semitone_gap + self.alteration - destination_semitones - (12 * octave_gap)
-        )
+            notes.append(cls.intern(name=name, alteration=alteration, octave=octave))
 
-        destination_octave = None
-        if self.octave is not None:
-            destination_octave = self.octave + octave_gap
+        return tuple(notes)
 
-        return Note(
-            name=destination_note,
-            alteration=destination_alteration,
-            octave=destination_octave,
-        )
+    @classmethod
+    def from_pitch_class(cls, index: int) -> Note:
+        return cls.from_midi_index(index % 12).remove_octave()
 
-    def get_interval(self, note: Note) -> Interval:
-        index_1 = note_index.get_index(self.name)
-        index_2 = note_index.get_index(note.name)
-        index_diff = index_2 - index_1
+    def add_interval(self, interval: Interval, reverse: bool = False) -> Note:
+        transposition = transposition_index.get_transposition(self.name, interval.name, reverse)
 
-        semitones_1 = note_index.get_semitones(self.name)
-        semitones_2 = note_index.get_semitones(note.name)
+        if reverse:
+            alteration = transposition.alteration_offset + self.alteration - interval.alteration
+        else:
+            alteration = transposition.alteration_offset + self.alteration + interval.alteration
 
-        octave_diff = 0
-        if self.octave and note.octave:
-            semitones_1 += self.octave * 12
-            semitones_2 += note.octave * 12
+        return Note.intern(
+            name=transposition.name,
+            alteration=alteration,
+            octave=self.octave + transposition.octave_gap if self.octave is not None else None,
+        )
 
-            semitones_diff = semitones_2 - semitones_1
+    @staticmethod
+    def transpose_many(notes: Iterable[Note], interval: Interval, reverse: bool = False) -> List[Note]:
+        transpositions = transposition_index.transpositions
+        interval_alteration = -interval.alteration if reverse else interval.alteration
+
+        transposed = []
+        for note in notes:
+            transposition = transpositions[(note.name, interval.name, reverse)]
+
+            transposed.append(
+                Note.intern(
+                    transposition.name,
+                    transposition.alteration_offset + note.alteration + interval_alteration,
+                    note.octave + transposition.octave_gap if note.octave is not None else None,
+                )
+            )
 
-            octave_diff = note.octave - self.octave
+        return transposed
 
-            index_diff += octave_diff * 7
-        else:
-            semitones_diff = (semitones_2 - semitones_1) % 12
-            index_diff %= 7
+    def get_interval(self, note: Note) -> Interval:
+        octave_gap = note.octave - self.octave if self.octave and note.octave else None
 
-        name = interval_index.get_name_from_index(index_diff)
-        semitones = interval_index.get_semitones(name)
-        alteration = semitones_diff - semitones - self.alteration + note.alteration
+        interval_spelling = transposition_index.get_interval_spelling(self.name, note.name, octave_gap)
 
-        return Interval(name=name, alteration=alteration)
+        return Interval.intern(
+            name=interval_spelling.name,
+            alteration=interval_spelling.alteration_offset - self.alteration + note.alteration,
+        )
 
     def remove_octave(self) -> Note:
-        return replace(self, octave=None)
+        return Note.intern(name=self.name, alteration=self.alteration)
+
+    def set_octave(self, octave: int | None) -> Note:
+        return Note.intern(name=self.name, alteration=self.alteration, octave=octave)
 
     @staticmethod
     def remove_notes_octave(notes: List[Note]) -> List[Note]:
@@ -256,12 +346,25 @@ class NotesList:
     def __hash__(self) -> int:
         return hash("_".join(map(str, self.notes)))
 
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        return PitchClassSet.from_notes(self.notes)
 
-@dataclass
+    @property
+    def midi_note_set(self) -> MidiNoteSet:
+        return MidiNoteSet.from_notes(self.notes)
+
+
+@dataclass(frozen=True, slots=True)
 class Interval:
     name: str
     alteration: int = 0
 
+    _hash: int = field(init=False, repr=False, compare=False)
+    _semitones: int = field(init=False, repr=False, compare=False)
+
+    interned: ClassVar[Dict[Tuple[str, int], Interval]] = {}
+
     def __post_init__(self) -> None:
         if not interval_index.is_valid(self.name):
             raise ValueError(f"Invalid name: {self.name}")
@@ -269,17 +372,35 @@ class Interval:
         if self.alteration < -3 or self.alteration > 3:
             raise ValueError(f"Invalid alteration: {self.alteration}, must be between -3 and 3")
 
+        object.__setattr__(self, "_hash", hash((self.name, self.alteration)))
+        object.__setattr__(self, "_semitones", interval_index.get_semitones(self.name) + self.alteration)
+
     def __hash__(self) -> int:
-        return hash(self.name + str(self.alteration))
+        return self._hash
 
     def __str__(self) -> str:
         alteration_str = get_interval_alteration_str_from_int(self.alteration, int(self.name))
 
         return f"{self.name}{alteration_str}"
 
+    def __copy__(self) -> Interval:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Interval:
+        return self
+
+    @classmethod
+    def intern(cls, name: str, alteration: int = 0) -> Interval:
+        key = (name, alteration)
+
+        if (interval := cls.interned.get(key)) is None:
+            interval = cls.interned[key] = cls(name=name, alteration=alteration)
+
+        return interval
+
     @property
     def semitones(self) -> int:
-        return interval_index.get_semitones(self.name) + self.alteration
+        return self._semitones
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Interval):
@@ -297,7 +418,7 @@ class Interval:
         return f"{get_degree_alteration_str_from_int(self.alteration)}{self.name}"
 
     @classmethod
-    @cache
+    @cache(maxsize=256)
     def parse(cls, string: str) -> Interval:
         parsed = parser.parse(parser.interval_pattern, string)
 
@@ -308,13 +429,13 @@ class Interval:
         return [cls.parse(interval_string) for interval_string in intervals_string.split(",")]
 
     @classmethod
-    @cache
+    @cache(maxsize=256)
     def build(
         cls,
         name: str,
-        alteration: Optistr | None = None,
+        alteration: str | None = None,
     ) -> Interval:
-        return cls(
+        return cls.intern(
             name=name,
             alteration=get_interval_alteration_int_from_str(alteration=alteration, interval=int(name))
             if alteration
@@ -349,14 +470,14 @@ class Chord:
         return f"{self.degree or self.root} {self.name}"
 
     @classmethod
-    @cache
+    @cache(maxsize=1024, copier=copy_model)
     def parse(cls, string: str) -> Chord:
         parsed = parser.parse(parser.chord_pattern, string)
 
         return cls.build(**parsed)
 
     @classmethod
-    @cache
+    @cache(maxsize=1024, copier=copy_model)
     def parse_with_scale_context(cls, string: str, scale: Scale) -> Chord:
         parsed = parser.parse(parser.chord_pattern, string)
 
@@ -395,8 +516,7 @@ class Chord:
             root = scale.get_note_from_degree(degree)
 
             if not name:
-                chords = scale.get_diatonic_chords()
-                name = chords[degree.index].name
+                name, _ = Scale.get_diatonic_chords_table(scale.name)[degree.index]
 
             if base_degree:
                 root = root.add_interval(base_degree.to_interval())
@@ -425,49 +545,121 @@ class Chord:
 
     @property
     def intervals(self) -> List[Interval]:
-        intervals_string = chord_index.get_intervals(self.name or "maj")
-        intervals = Interval.parse_list(intervals_string)
+        intervals_table = chord_index.get_intervals_table(self.name or "maj")
 
-        return intervals
+        return [
+            Interval.intern(name=name, alteration=alteration) for name, alteration in intervals_table.intervals
+        ]
 
     @property
     def notes(self) -> List[Note]:
-        notes = [self.root.add_interval(interval) for interval in self.intervals]
+        return list(self.voicing)
 
-        if self.inversion:
-            notes = notes[self.inversion :] + [
-                note.add_interval(Interval(name="8")) for note in notes[: self.inversion]
-            ]
+    @property
+    def voicing(self) -> Tuple[Note, ...]:
+        return self.get_voicing(  # type: ignore[no-any-return]
+            self.root,
+            self.name,
+            self.inversion,
+            self.base_note,
+            tuple(self.extensions) if self.extensions else None,
+        )
 
-        if self.base_note:
-            base_note = copy(self.base_note)
+    @staticmethod
+    def get_voicings(chords: Iterable[Chord]) -> List[Tuple[Note, ...]]:
+        return [chord.voicing for chord in chords]
+
+    @staticmethod
+    @cache(maxsize=4096)
+    def get_voicing(
+        root: Note,
+        name: str,
+        inversion: int | None = None,
+        base_note: Note | None = None,
+        extensions: Tuple[Interval, ...] | None = None,
+    ) -> Tuple[Note, ...]:
+        intervals_table = chord_index.get_intervals_table(name or "maj")
+
+        notes = [
+            root.add_interval(Interval.intern(name=interval_name, alteration=alteration))
+            for interval_name, alteration in intervals_table.intervals
+        ]
+
+        if inversion:
+            notes = notes[inversion:] + Note.transpose_many(notes[:inversion], Interval.intern(name="8"))
 
-            if self.root.octave and not base_note.octave:
+        if base_note:
+            if root.octave and not base_note.octave:
                 if notes[0].octave:
-                    base_note.octave = notes[0].octave
+                    base_note = base_note.set_octave(notes[0].octave)
 
                     if base_note > notes[0]:
-                        base_note.octave -= 1
+                        base_note = base_note.set_octave(notes[0].octave - 1)
 
             elif base_note.octave and not notes[0].octave:
                 last_note = base_note
+                octave_notes = []
                 for note in notes:
-                    note.octave = base_note.octave
+                    note = note.set_octave(base_note.octave)
 
                     if note < last_note:
-                        note.octave += 1
+                        note = note.set_octave(base_note.octave + 1)
 
+                    octave_notes.append(note)
                     last_note = note
 
+                notes = octave_notes
+
             notes.insert(0, base_note)
 
-        if self.extensions:
-            notes += [self.root.add_interval(interval) for interval in self.extensions]
+        if extensions:
+            notes += [root.add_interval(interval) for interval in extensions]
 
-        if self.extensions and self.root.octave:
+        if extensions and root.octave:
             notes = sorted(notes)
 
-        return notes
+        return tuple(notes)
+
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        root_index = self.root.index
+        intervals_table = chord_index.get_intervals_table(self.name or "maj")
+
+        indexes = [root_index + semitones for semitones in intervals_table.semitones]
+
+        if self.base_note:
+            indexes.append(self.base_note.index)
+
+        if self.extensions:
+            indexes += [root_index + extension.semitones for extension in self.extensions]
+
+        return PitchClassSet.from_indexes(indexes)
+
+    @property
+    def midi_note_set(self) -> MidiNoteSet:
+        return MidiNoteSet.from_notes(self.notes)
+
+    @staticmethod
+    def identify(midi_indexes: Iterable[int]) -> List[Chord]:
+        """Return every chord candidate matching the given MIDI notes, the lowest one being the bass"""
+
+        chords = []
+
+        for match in chord_index.identify_midi_indexes(midi_indexes):
+            base_note = None
+            if match.base is not None:
+                base_note = Note.from_pitch_class(match.base)
+
+            chords.append(
+                Chord(
+                    root=Note.from_pitch_class(match.root),
+                    name=match.name,
+                    inversion=match.inversion,
+                    base_note=base_note,
+                )
+            )
+
+        return chords
 
     @staticmethod
     def chord_product(roots: List[Note], chord_names: List[str]) -> List[Chord]:
@@ -476,7 +668,7 @@ class Chord:
         ]
 
     def set_root_octave(self, octave: int) -> Chord:
-        return replace(self, root=replace(self.root, octave=octave))
+        return replace(self, root=Note.intern(self.root.name, self.root.alteration, octave))
 
 
 @dataclass
@@ -496,13 +688,13 @@ class Scale:
 
     @property
     def is_diatonic(self) -> bool:
-        return len(self.notes) == 7
+        return len(scale_index.get_intervals_table(self.name).intervals) == 7
 
     def to_log_string(self) -> str:
         return f"{self.tonic} {self.name}"
 
     @classmethod
-    @cache
+    @cache(maxsize=512, copier=copy_model)
     def parse(cls, string: str) -> Scale:
         parsed = parser.parse(parser.scale_pattern, string)
 
@@ -517,15 +709,42 @@ class Scale:
 
     @property
     def intervals(self) -> List[Interval]:
-        intervals_string = scale_index.get_intervals(self.name)
-        intervals = Interval.parse_list(intervals_string)
+        intervals_table = scale_index.get_intervals_table(self.name)
 
-        return intervals
+        return [
+            Interval.intern(name=name, alteration=alteration) for name, alteration in intervals_table.intervals
+        ]
 
     @property
     def notes(self) -> List[Note]:
         return [self.tonic.add_interval(interval) for interval in self.intervals]
 
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        tonic_index = self.tonic.index
+
+        return PitchClassSet.from_indexes(
+            tonic_index + semitones for semitones in scale_index.get_intervals_table(self.name).semitones
+        )
+
+    @property
+    def midi_note_set(self) -> MidiNoteSet:
+        return MidiNoteSet.from_notes(self.notes)
+
+    @staticmethod
+    def get_scales_containing(pitch_class_set: PitchClassSet) -> List[Scale]:
+        return [
+            Scale(tonic=Note.from_pitch_class(match.tonic), name=match.name)
+            for match in scale_index.get_scales_containing(pitch_class_set.mask)
+        ]
+
+    @staticmethod
+    def get_closest_scales(pitch_class_set: PitchClassSet, limit: int = 5) -> List[Scale]:
+        return [
+            Scale(tonic=Note.from_pitch_class(match.tonic), name=match.name)
+            for match in scale_index.get_closest_scales(pitch_class_set.mask, limit=limit)
+        ]
+
     @staticmethod
     def scale_product(tonics: List[Note], scale_names: List[str]) -> List[Scale]:
         return [
@@ -536,30 +755,75 @@ class Scale:
     def get_note_from_degree(self, degree: Degree) -> Note:
         note = self.notes[degree.index]
 
-        return replace(note, alteration=note.alteration + degree.alteration)
+        return Note.intern(note.name, note.alteration + degree.alteration, note.octave)
 
-    def get_diatonic_chords(self) -> List[Chord]:
-        chords = []
+    def get_diatonic_chords(self, size: int = 4) -> List[Chord]:
+        """Chords stacked in thirds on each degree, size being 3 for triads,
+        4 for seventh chords and 5 for ninth chords"""
 
-        two_octave_notes = self.notes + [note.add_interval(Interval(name="8")) for note in self.notes]
+        return self._build_diatonic_chords(self.tonic, self.name, size)  # type: ignore[no-any-return]
 
-        for degree_num in range(7):
-            root = two_octave_notes[degree_num]
+    @classmethod
+    def get_all_diatonic_chords(cls, name: str, size: int = 4) -> Dict[Note, List[Chord]]:
+        return {
+            tonic: cls._build_diatonic_chords(tonic, name, size)
+            for tonic in map(Note.from_pitch_class, range(PITCH_CLASS_COUNT))
+        }
+
+    @classmethod
+    @cache(maxsize=512, copier=copy_model)
+    def _build_diatonic_chords(cls, tonic: Note, name: str, size: int) -> List[Chord]:
+        chords_table = cls.get_diatonic_chords_table(name, size)
+        roots = cls(tonic=tonic, name=name).notes
+
+        return [
+            Chord(root=root, name=chord_name, extensions=list(extensions) if extensions else None)
+            for root, (chord_name, extensions) in zip(roots, chords_table)
+        ]
+
+    @staticmethod
+    @cache(maxsize=256)
+    def get_diatonic_chords_table(name: str, size: int = 4) -> Tuple[Tuple[str, Tuple[Interval, ...]], ...]:
+        """Chord name and extensions on each degree of a scale, independently of its tonic.
+
+        Chord names only go up to seventh chords, ninths are set as extension.
+        """
+
+        if size not in (3, 4, 5):
+            raise ValueError(f"Invalid size: {size}, must be 3, 4 or 5")
+
+        intervals_table = scale_index.get_intervals_table(name)
+        scale_length = len(intervals_table.intervals)
 
-            notes = []
+        chords_table = []
+        for degree_num in range(scale_length):
             intervals = []
-            for chord_degree in [1, 3, 5, 7]:
-                note = two_octave_notes[degree_num + chord_degree - 1]
 
-                notes.append(note)
-                intervals.append(root.get_interval(note))
+            for chord_degree in range(0, size * 2, 2):
+                octave, position = divmod(degree_num + chord_degree, scale_length)
 
-            intervals_str = ",".join([str(i) for i in intervals])
+                degree_gap = (
+                    intervals_table.degrees[position] - intervals_table.degrees[degree_num] + octave * 7
+                )
+                semitones_gap = (
+                    intervals_table.semitones[position]
+                    - intervals_table.semitones[degree_num]
+                    + octave * 12
+                )
 
-            chord = Chord(root=root, name=chord_index.get_name_from_intervals(intervals_str))
-            chords.append(chord)
+                interval_name = str(degree_gap + 1)
+                intervals.append(
+                    Interval.intern(
+                        name=interval_name,
+                        alteration=semitones_gap - interval_index.get_semitones(interval_name),
+                    )
+                )
 
-        return chords
+            chord_name = chord_index.get_name_from_intervals(",".join(map(str, intervals[:4])))
+
+            chords_table.append((chord_name, tuple(intervals[4:])))
+
+        return tuple(chords_table)
 
 
 @dataclass
@@ -574,14 +838,14 @@ class Bpm:
             raise ValueError(f"Invalid value: {self.value}, must be between 0 and 600")
 
     @classmethod
-    @cache
+    @cache(maxsize=64)
     def parse(cls, string: str) -> Bpm:
         parsed = parser.parse(parser.bpm_pattern, string)
 
         return cls(**parsed)
 
     @classmethod
-    @cache
+    @cache(maxsize=64)
     def _build(cls, value: int) -> Bpm:
         return cls(value=value)
 
@@ -675,13 +939,25 @@ class Duration:
     def __repr__(self) -> str:
         return str(self)
 
+    def to_ticks(self) -> int:
+        ticks, rest = divmod(self.value.numerator * duration_constants.ticks_per_quarter, self.value.denominator)
+
+        if rest:
+            raise ValueError(f"Invalid duration: {self.value}, can't be expressed in ticks")
+
+        return ticks
+
     @classmethod
-    @cache
+    def from_ticks(cls, ticks: int) -> Duration:
+        return cls(value=Fraction(ticks, duration_constants.ticks_per_quarter))
+
+    @classmethod
+    @cache(maxsize=256)
     def parse(cls, string: str) -> Duration:
         return cls.build(**parser.parse(parser.duration_pattern, string))  # type: ignore[no-any-return]
 
     @classmethod
-    @cache
+    @cache(maxsize=256)
     def build(
         cls,
         base_duration: str | None = None,
@@ -721,7 +997,7 @@ class TimeSignature:
             raise ValueError(f"Invalid beat_unit: {self.beat_unit}, must be a multiple of 2")
 
     @classmethod
-    @cache
+    @cache(maxsize=64)
     def parse(cls, string: str) -> TimeSignature:
         parsed = parser.parse(parser.time_signature_pattern, string)
 
@@ -734,15 +1010,39 @@ class TimeSignature:
         return cls(beats_per_bar=beats_per_bar, beat_unit=beat_unit)
     """
 
-    @cache
+    @cache(maxsize=64)
     def get_duration(self) -> Duration:
         return Duration(value=Fraction(self.beats_per_bar * 4, self.beat_unit))
 
+    @cache(maxsize=64)
+    def get_ticks(self) -> int:
+        return self.beats_per_bar * self.get_beat_ticks()
+
+    def get_beat_ticks(self) -> int:
+        return duration_constants.ticks_per_quarter * 4 // self.beat_unit
+
+    def get_time_section_from_ticks(self, ticks: int, bar_offset: int = 0) -> TimeSection:
+        beat_ticks = self.get_beat_ticks()
+
+        bar, bar_rest = divmod(ticks, beat_ticks * self.beats_per_bar)
+        measure, rest = divmod(bar_rest, beat_ticks)
+
+        return TimeSection(bar=bar_offset + bar + 1, measure=measure + 1, rest=Fraction(rest, beat_ticks))
+
+    @cache(maxsize=64)
+    def get_time_grid(self, step: Duration) -> TimeGrid:
+        return TimeGrid.build(self, step.to_ticks())
+
     def get_time_section(self, cursor: Duration, bar_offset: int = 0) -> TimeSection:
+        try:
+            return self.get_time_section_from_ticks(cursor.to_ticks(), bar_offset=bar_offset)
+        except ValueError:
+            pass
+
         reduction = Fraction(self.beat_unit, 4)
 
         bar, measure_rest = divmod(cursor.value * reduction, self.beats_per_bar)
-        measure, rest = divmod(measure_rest * reduction, 1)
+        measure, rest = divmod(measure_rest, 1)
 
         return TimeSection(bar=bar_offset + bar + 1, measure=measure + 1, rest=rest)
 
@@ -751,14 +1051,37 @@ class TimeSignature:
         step: Duration,
         cursor_offset: Duration = Duration(),
         base_time_section: TimeSection | None = None,
+        end_cursor: Duration | None = None,
     ) -> Generator[Tuple[TimeSection, Duration], None, None]:
-        cursor = Duration()
+        """Time sections every step from cursor_offset, endless unless end_cursor is set"""
 
         bar_offset = 0
         if base_time_section:
             bar_offset = base_time_section.bar - 1
 
-        while True:
+        try:
+            time_grid = self.get_time_grid(step)
+            offset_ticks = cursor_offset.to_ticks()
+            end_ticks = end_cursor.to_ticks() if end_cursor is not None else None
+        except ValueError:
+            yield from self._generate_time_sections(step, cursor_offset, bar_offset, end_cursor)
+
+            return
+
+        for index in count():
+            ticks = offset_ticks + index * time_grid.step_ticks
+
+            if end_ticks is not None and ticks >= end_ticks:
+                return
+
+            yield time_grid.get_time_section_at(index, bar_offset=bar_offset), Duration.from_ticks(ticks)
+
+    def _generate_time_sections(
+        self, step: Duration, cursor_offset: Duration, bar_offset: int, end_cursor: Duration | None
+    ) -> Generator[Tuple[TimeSection, Duration], None, None]:
+        cursor = Duration()
+
+        while end_cursor is None or cursor + cursor_offset < end_cursor:
             time_section = self.get_time_section(cursor, bar_offset=bar_offset)
 
             yield time_section, cursor + cursor_offset
@@ -788,6 +1111,74 @@ class TimeSection:
         return f"{self.bar}:{self.measure}:{float(self.rest)}"
 
 
+@dataclass(frozen=True)
+class TimeGrid:
+    """Time sections of a time signature sampled every step, precomputed over
+    the shortest span of bars after which the grid repeats"""
+
+    time_signature: TimeSignature
+    step_ticks: int
+    period_bars: int
+    positions: Tuple[Tuple[int, int, Fraction], ...]
+
+    def __copy__(self) -> TimeGrid:
+        return self
+
+    @classmethod
+    def build(cls, time_signature: TimeSignature, step_ticks: int) -> TimeGrid:
+        if step_ticks <= 0:
+            raise ValueError(f"Invalid step: {step_ticks} ticks, must be positive")
+
+        bar_ticks = time_signature.get_ticks()
+        beat_ticks = time_signature.get_beat_ticks()
+        period_ticks = lcm(bar_ticks, step_ticks)
+
+        positions = []
+        for ticks in range(0, period_ticks, step_ticks):
+            bar, bar_rest = divmod(ticks, bar_ticks)
+            measure, rest = divmod(bar_rest, beat_ticks)
+
+            positions.append((bar, measure + 1, Fraction(rest, beat_ticks)))
+
+        return cls(
+            time_signature=time_signature,
+            step_ticks=step_ticks,
+            period_bars=period_ticks // bar_ticks,
+            positions=tuple(positions),
+        )
+
+    def get_time_section_at(self, index: int, bar_offset: int = 0) -> TimeSection:
+        """Time section of the index-th step"""
+
+        period, position = divmod(index, len(self.positions))
+        bar, measure, rest = self.positions[position]
+
+        return TimeSection(bar=bar_offset + period * self.period_bars + bar + 1, measure=measure, rest=rest)
+
+    def get_time_section(self, ticks: int, bar_offset: int = 0) -> TimeSection:
+        index, rest = divmod(ticks, self.step_ticks)
+
+        if rest:
+            return self.time_signature.get_time_section_from_ticks(ticks, bar_offset=bar_offset)
+
+        return self.get_time_section_at(index, bar_offset=bar_offset)
+
+    def get_schedule(self, start_ticks: int, end_ticks: int) -> range:
+        """Ticks of the steps between start (included) and end (excluded), from a grid starting at 0"""
+
+        first_index = -(-start_ticks // self.step_ticks)
+
+        return range(first_index * self.step_ticks, end_ticks, self.step_ticks)
+
+    def get_time_sections(
+        self, start_ticks: int, end_ticks: int, bar_offset: int = 0
+    ) -> List[Tuple[TimeSection, int]]:
+        return [
+            (self.get_time_section_at(ticks // self.step_ticks, bar_offset=bar_offset), ticks)
+            for ticks in self.get_schedule(start_ticks, end_ticks)
+        ]
+
+
 @dataclass
 class DurationItem:
     numerator: int = 1
@@ -843,6 +1234,13 @@ class ChordItem:
     def __hash__(self) -> int:
         return int(self.id)
 
+    def set_values(self, chord_item: ChordItem) -> None:
+        """Copy the values of chord_item, keeping the id of this one"""
+
+        for chord_item_field in fields(self):
+            if chord_item_field.name != "id":
+                setattr(self, chord_item_field.name, getattr(chord_item, chord_item_field.name))
+
     @staticmethod
     def parse_root_note_or_degree(string: str) -> Note | Degree:
         try:
@@ -941,9 +1339,15 @@ class HarmonyItem:
 
     id: UUID = field(default_factory=uuid4)
 
+    # Bumped by edits so layouts computed from the chord items can be reused until then
+    revision: int = field(default=0, compare=False, repr=False)
+
     def __hash__(self) -> int:
         return int(self.id)
 
+    def bump_revision(self) -> None:
+        self.revision += 1
+
     """
     @classmethod
     def _build(
@@ -982,6 +1386,9 @@ class HarmonyItem:
             "chord_items=" + ";".join([chord_item.to_log_string() for chord_item in self.chord_items])
         )
 
+    def get_voicings(self) -> List[Tuple[Note, ...]]:
+        return Chord.get_voicings(chord_item.as_chord(self.scale) for chord_item in self.chord_items)
+
     def dict(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
         return {
             "scale": str(self.scale).replace(" ", "_"),
@@ -1,4 +1,5 @@
-from typing import Any, Dict
+import re
+from typing import Any, Callable, Dict
 
 from pyparsing import (Combine, Empty, Group, Literal, Optional, ParserElement,
                        Suppress, Word, ZeroOrMore, alphas, delimitedList, nums,
@@ -77,5 +78,96 @@ grid_pattern = delimitedList(
 )("grid_sections")
 
 
+# Hand-written fast paths for the most used grammars, they must return the exact same
+# dicts as their pyparsing counterparts and None for anything they do not recognize
+note_regex = re.compile(
+    "(" + "|".join(sorted(ENGLISH_NOTE_NOTATION + SOLFEGE_NOTE_NOTATION, key=len, reverse=True)) + ")"
+    r"([#b]+)?([0-9]+)?"
+)
+interval_regex = re.compile(r"([0-9]+)(M|m|a+|d+)?")
+degree_regex = re.compile(r"([#b]+)?(VII|VI|V|IV|III|II|I|vii|vi|v|iv|iii|ii|i)")
+duration_regex = re.compile(r"(?:([0-9]+)(?:/([0-9]+))?)?([WHQES])?")
+time_signature_regex = re.compile(r"([0-9]+)/([0-9]+)")
+
+
+def fast_parse_note(string: str) -> Dict[str, Any] | None:
+    if not (match := note_regex.fullmatch(string)):
+        return None
+
+    name, alteration, octave = match.groups()
+
+    parsed: Dict[str, Any] = {"name": name}
+
+    if alteration:
+        parsed["alteration"] = alteration
+    if octave:
+        parsed["octave"] = int(octave)
+
+    return parsed
+
+
+def fast_parse_interval(string: str) -> Dict[str, Any] | None:
+    if not (match := interval_regex.fullmatch(string)):
+        return None
+
+    name, alteration = match.groups()
+
+    return {"name": name, "alteration": alteration or ""}
+
+
+def fast_parse_degree(string: str) -> Dict[str, Any] | None:
+    if not (match := degree_regex.fullmatch(string)):
+        return None
+
+    alteration, name = match.groups()
+
+    parsed: Dict[str, Any] = {"name": name}
+
+    if alteration:
+        parsed["alteration"] = alteration
+
+    return parsed
+
+
+def fast_parse_duration(string: str) -> Dict[str, Any] | None:
+    if not (match := duration_regex.fullmatch(string)):
+        return None
+
+    numerator, denominator, base_duration = match.groups()
+
+    parsed: Dict[str, Any] = {}
+
+    if numerator:
+        parsed["numerator"] = int(numerator)
+    if denominator:
+        parsed["denominator"] = int(denominator)
+    if base_duration:
+        parsed["base_duration"] = base_duration
+
+    return parsed
+
+
+def fast_parse_time_signature(string: str) -> Dict[str, Any] | None:
+    if not (match := time_signature_regex.fullmatch(string)):
+        return None
+
+    beats_per_bar, beat_unit = match.groups()
+
+    return {"beats_per_bar": int(beats_per_bar), "beat_unit": int(beat_unit)}
+
+
+fast_parsers: Dict[int, Callable[[str], Dict[str, Any] | None]] = {
+    id(note_pattern): fast_parse_note,
+    id(interval_pattern): fast_parse_interval,
+    id(degree_pattern): fast_parse_degree,
+    id(duration_pattern): fast_parse_duration,
+    id(time_signature_pattern): fast_parse_time_signature,
+}
+
+
 def parse(parser_pattern: ParserElement, string: str) -> Dict[str, Any]:
+    if fast_parser := fast_parsers.get(id(parser_pattern)):
+        if (parsed := fast_parser(string)) is not None:
+            return parsed
+
     return parser_pattern.parseString(string, parseAll=True).asDict()
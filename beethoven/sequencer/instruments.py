@@ -3,7 +3,7 @@
 
 # from beethoven.helpers.sequencer import note_sequencer
 from itertools import cycle
-from beethoven.helpers.sequencer import NoteSorter, note_repeater, note_sequencer, one_time_play
+from beethoven.helpers.sequencer import NoteSorter, PatternVoice, one_time_play
 from beethoven.models import Duration, Interval, Note
 from beethoven.sequencer.objects import BasePlayer, Mapping, PercussionPlayer, Part
 
@@ -42,22 +42,26 @@ class Metronome(PercussionPlayer):
 class BasicMetronome(Metronome):
     style = "Basic"
 
+    pattern = (
+        PatternVoice(Metronome.MAIN_TICK, quarter, "+..."),
+        PatternVoice(Metronome.SEC_TICK, quarter, ".+++"),
+    )
+
     def play(self):
-        return NoteSorter(
-            main=note_sequencer(quarter, [self.get_note(self.MAIN_TICK)], "+..."),
-            sec=note_sequencer(quarter, [self.get_note(self.SEC_TICK)], ".+++"),
-        )
+        return self.play_pattern()
 
 
 class BasicEighthMetronome(Metronome):
     style = "Basic Eighth"
 
+    pattern = (
+        PatternVoice(Metronome.MAIN_TICK, quarter, "+..."),
+        PatternVoice(Metronome.SEC_TICK, quarter, ".+++"),
+        PatternVoice(Metronome.ALT_TICK, eighth, ".+"),
+    )
+
     def play(self):
-        return NoteSorter(
-            main=note_sequencer(quarter, [self.get_note(self.MAIN_TICK)], "+..."),
-            sec=note_sequencer(quarter, [self.get_note(self.SEC_TICK)], ".+++"),
-            alt=note_sequencer(eighth, [self.get_note(self.ALT_TICK)], ".+"),
-        )
+        return self.play_pattern()
 
 
 class Piano(BasePlayer):
@@ -72,7 +76,7 @@ class BasicChordPiano(Piano):
 
         #while 1:
         if 1:
-            for note in self.part.chord.notes:
+            for note in self.part.chord.voicing:
                 yield timeline, self.get_message(note, self.part.chord_duration)
 
             timeline += self.part.chord_duration
@@ -82,13 +86,12 @@ class BasicArpeggioPiano(Piano):
     style = "Basic Arpeggio"
 
     def play(self):
-        tonic = self.part.chord.notes[0]
+        voicing = self.part.chord.voicing
+        tonic = voicing[0]
         octave = Interval(name="8")
         tonic_2oct = tonic.add_interval(octave).add_interval(octave)
 
-        notes = self.part.chord.notes
-        notes += [note.add_interval(octave) for note in self.part.chord.notes]
-        notes.append(tonic_2oct)
+        notes = [*voicing, *Note.transpose_many(voicing, octave), tonic_2oct]
 
         timeline = self.part.start_cursor
 
@@ -132,12 +135,15 @@ class Drum(PercussionPlayer):
 class BasicDrum(Drum):
     style = "Basic"
 
+    pattern = (
+        PatternVoice(Drum.KICK, whole, "+"),
+        PatternVoice(Drum.SNARE, half, ".+"),
+        PatternVoice(Drum.CLOSED_HH, quarter, "+"),
+    )
+
     def play(self):
         yield from NoteSorter(
-            kick=note_repeater(whole, [self.get_note(self.KICK)]),
-            snare=note_repeater(whole, [self.get_note(self.SNARE)], half),
-            hh=note_repeater(quarter, [self.get_note(self.CLOSED_HH)]),
-            #crash=note_repeater(self.part.chord_duration, [self.get_note(self.CRASH)]),
+            pattern=self.play_pattern(),
             crash=one_time_play(self.part.start_cursor, [self.get_note(self.CRASH)]),
         )
 
@@ -145,16 +151,15 @@ class BasicDrum(Drum):
 class JazzDrum(Drum):
     style = "Jazz"
 
+    pattern = (
+        PatternVoice(Drum.KICK, eighth, "+......+"),
+        PatternVoice(Drum.SNARE, eighth, "..+..+.+"),
+        PatternVoice(Drum.RIDE, quarter_triplet, "+.+"),
+        PatternVoice(Drum.CLOSED_HH, quarter_triplet, "...........+" + "." * 12, velocity=44),
+        PatternVoice(Drum.OPEN_HH, quarter_triplet, "..........+." + "." * 12),
+        PatternVoice(Drum.LOW_TOM, quarter_triplet, "." * 12 + "..........+."),
+        PatternVoice(Drum.FLOOR_TOM, quarter_triplet, "." * 12 + "...........+"),
+    )
+
     def play(self):
-        for cursor, note in NoteSorter(
-            kick=note_sequencer(eighth, [self.get_note(self.KICK)], "+......+"),
-            snare=note_sequencer(eighth, [self.get_note(self.SNARE)], "..+..+.+"),
-            ride=note_sequencer(quarter_triplet, [self.get_note(self.RIDE)], "+.+"),
-            close_hh=note_sequencer(quarter_triplet, [self.get_note(self.CLOSED_HH, velocity=44)], "...........+" + "." * 12),
-            open_hh=note_sequencer(quarter_triplet, [self.get_note(self.OPEN_HH)], "..........+." + "." * 12),
-            low_tom=note_sequencer(quarter_triplet, [self.get_note(self.LOW_TOM)], "." * 12 + "..........+."),
-            floor_tom=note_sequencer(quarter_triplet, [self.get_note(self.FLOOR_TOM)], "." * 12 + "...........+"),
-        ):
-            yield self.part.start_cursor + cursor, note
-
-        return
+        return self.play_pattern()
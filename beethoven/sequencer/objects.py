@@ -2,18 +2,22 @@ from __future__ import annotations
 
 import re
 from copy import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from functools import partial
 from itertools import count
-from typing import (Any, Callable, Dict, Generator, List,
-                    Tuple, Type, Union)
+from typing import (Any, Callable, Dict, Generator, Iterator, List,
+                    NamedTuple, Tuple, Type, Union)
 
+from beethoven.helpers.sequencer import PatternVoice, RhythmPattern
 from beethoven.models import (Bpm, Chord, ChordItem, Duration,
                               HarmonyItem, Note, Scale, TimeSection,
                               TimeSignature)
 from beethoven.sequencer.registry import RegisteredPlayer
 from beethoven.settings import PlayerSetting
+from beethoven.utils.trace import PLAYER, tracer
+
+player_trace = tracer[PLAYER]
 
 
 class InvalidHarmonyChordItems(Exception):
@@ -31,6 +35,9 @@ class SequencerStrategy(Enum):
 class Mapping:
     mappings: Dict[str, Note | None]
 
+    # Bumped on every change, so compiled player targets know when to rebuild
+    revision: int = field(default=0, compare=False)
+
     def get(self, name: str) -> Note | None:
         return self.mappings.get(name)
     
@@ -39,6 +46,8 @@ class Mapping:
             if name in self.mappings:
                 self.mappings[name] = note
 
+        self.revision += 1
+
 
 @dataclass
 class Message:
@@ -104,6 +113,29 @@ class BasePlayer(RegisteredPlayer):
 class PercussionPlayer(BasePlayer):
     is_percussion: bool = True
 
+    pattern: Tuple[PatternVoice, ...] = ()
+
+    @classmethod
+    def get_rhythm_pattern(cls, time_signature: TimeSignature) -> RhythmPattern:
+        return RhythmPattern.compile(cls.pattern, time_signature)  # type: ignore[no-any-return]
+
+    def play_pattern(self) -> Iterator[Tuple[Duration, Message | None]]:
+        """Pattern events from the part start, as cursors like the other players yield"""
+
+        assert self.part, "Part must be set"
+
+        messages = [self.get_note(voice.name, velocity=voice.velocity) for voice in self.pattern]
+        rhythm_pattern = self.get_rhythm_pattern(self.part.time_signature)
+
+        if not rhythm_pattern.events:
+            return iter(())
+
+        return (
+            (Duration.from_ticks(cycle_tick + ticks), messages[voice_index])
+            for cycle_tick in count(self.part.start_tick, rhythm_pattern.cycle_ticks)
+            for ticks, voice_index in rhythm_pattern.events
+        )
+
     def get_note(self, note_str: str, duration: Duration = Duration(), velocity: int = 127) -> Message | None:
         if self.mapping and (note := self.mapping.get(note_str)):
             return Message(
@@ -140,14 +172,15 @@ class SystemPlayer(PercussionPlayer):
             # sixteenth_duration,
             cursor_offset=part.start_cursor,
             base_time_section=part.start_time_section,
+            end_cursor=part.intermediate_cursor,
         ):
-            if cursor >= part.intermediate_cursor:
-                break
             # print("c", cursor, time_section)
 
             yield cursor, partial(self.callable, cursor, time_section, self)
 
-        print("OUT")
+        if player_trace.enabled:
+            player_trace.record("system_play_ended", part.intermediate_cursor)
+
         self.generator = None
 
 
@@ -177,6 +210,18 @@ class Part:
     # next_harmony_item_change: bool
     start_time_section: TimeSection
 
+    @property
+    def start_tick(self) -> int:
+        return self.start_cursor.to_ticks()
+
+    @property
+    def intermediate_tick(self) -> int:
+        return self.intermediate_cursor.to_ticks()
+
+    @property
+    def end_tick(self) -> int:
+        return self.end_cursor.to_ticks()
+
     def show(self):
         # print("scale                :", self.scale)
         # print("chord                :", self.chord)
@@ -257,6 +302,16 @@ class Conductor:
         return section
 
 
+class SplitterState(NamedTuple):
+    global_cursor: Duration
+    time_signature_range_cursor: Duration
+    bar_starting: bool
+    previous_end_time_section: TimeSection
+    previous_part_harmony_item: HarmonyItem | None
+    section_index: int
+    sub_section_index: int
+
+
 @dataclass
 class Splitter:
     conductor: Conductor
@@ -267,8 +322,23 @@ class Splitter:
     previous_part_harmony_item: HarmonyItem | None = None
     grid_starting: bool = True
 
-    # @lru_cache(maxsize=None)
-    def get_harmony_item_chords_durations(self, harmony_item: HarmonyItem) -> Dict[ChordItem, List[Duration]]:
+    harmony_item_layouts: Dict[HarmonyItem, Tuple[int, Dict[ChordItem, List[Duration]]]] = field(
+        default_factory=dict
+    )
+
+    def get_harmony_item_layout(self, harmony_item: HarmonyItem) -> Dict[ChordItem, List[Duration]]:
+        """Chords durations of the harmony item, computed again only once its revision changed"""
+
+        layout = self.harmony_item_layouts.get(harmony_item)
+
+        if layout is None or layout[0] != harmony_item.revision:
+            layout = (harmony_item.revision, self.get_harmony_item_chords_durations(harmony_item))
+            self.harmony_item_layouts[harmony_item] = layout
+
+        return layout[1]
+
+    @staticmethod
+    def get_harmony_item_chords_durations(harmony_item: HarmonyItem) -> Dict[ChordItem, List[Duration]]:
         time_signature_duration = harmony_item.time_signature.get_duration()
 
         cursor = Duration()
@@ -311,36 +381,49 @@ class Splitter:
         # pprint({id(k): v for k, v in chord_items_data.items()})
         return chord_items_data
 
-    """
-    def flatten(self, harmony_iterator: HarmonyItemSelector):
-        harmony_iterator.harmony_index = 0
-        harmony_iterator.chord_index = 0
-
-        current_items = harmony_iterator.current_items
-        origin_items = current_items
-        next_items = harmony_iterator.get_next_items()
-
-        parts = []
-        while 1:
-            parts.append(self.run(current_items, next_items))
-
-            current_items = next_items
-            next_items = harmony_iterator.next()
+    def get_state(self) -> SplitterState:
+        """Snapshot of the cursors carried from a chord to the next one"""
+
+        return SplitterState(
+            global_cursor=self.global_cursor,
+            time_signature_range_cursor=self.time_signature_range_cursor,
+            bar_starting=self.bar_starting,
+            previous_end_time_section=copy(self.previous_end_time_section),
+            previous_part_harmony_item=self.previous_part_harmony_item,
+            section_index=self.conductor._section_index,
+            sub_section_index=self.conductor._sub_section_index,
+        )
 
-            if next_items == origin_items:
-                return parts
-    """
+    def set_state(self, state: SplitterState) -> None:
+        self.global_cursor = state.global_cursor
+        self.time_signature_range_cursor = state.time_signature_range_cursor
+        self.bar_starting = state.bar_starting
+        self.previous_end_time_section = copy(state.previous_end_time_section)
+        self.previous_part_harmony_item = state.previous_part_harmony_item
+        self.conductor._section_index = state.section_index
+        self.conductor._sub_section_index = state.sub_section_index
 
-    def run(self, sequencer_items, next_sequencer_items):
+    def run(
+        self,
+        sequencer_items: Tuple[HarmonyItem, ChordItem],
+        next_sequencer_items: Tuple[HarmonyItem, ChordItem],
+    ) -> Generator[Part, None, None]:
         harmony_item, chord_item = sequencer_items
         time_signature_duration = harmony_item.time_signature.get_duration()
         next_harmony_change = harmony_item is not next_sequencer_items[0]
 
         duration = chord_item.duration_item.value
 
+        layout = self.get_harmony_item_layout(harmony_item)
+
+        if chord_item not in layout:
+            # The chord items changed without a revision bump
+            harmony_item.bump_revision()
+            layout = self.get_harmony_item_layout(harmony_item)
+
         (
             duration, cursor, next_cursor, next_bar_cursor, harmony_item_duration
-        ) = self.get_harmony_item_chords_durations(harmony_item)[chord_item]
+        ) = layout[chord_item]
 
         split, next_time_signature_cursor = divmod(
             self.time_signature_range_cursor + duration,
@@ -469,6 +552,7 @@ class HarmonyItemSelector:
             self.harmony_items.insert(self.harmony_index + 1, item)
         elif isinstance(item, ChordItem):
             self.current_harmony_item.chord_items.insert(self.chord_index + 1, item)
+            self.current_harmony_item.bump_revision()
         else:
             raise Exception(f"Check this : {item = }")
 
@@ -486,6 +570,7 @@ class HarmonyItemSelector:
                 return
 
             del self.current_harmony_item.chord_items[self.chord_index]
+            self.current_harmony_item.bump_revision()
 
             if self.chord_index == len(self.current_harmony_item.chord_items):
                 self.chord_index -= 1
@@ -553,7 +638,7 @@ class HarmonyItemSelector:
 
         return items
 
-    def run_for(self, full_round: int = 1):
+    def run_for(self, full_round: int = 1) -> Generator[Tuple[Tuple[HarmonyItem, ChordItem], Tuple[HarmonyItem, ChordItem]], None, None]:
         count = 0
         for h in self.harmony_items:
             for c in h.chord_items:
@@ -564,14 +649,14 @@ class HarmonyItemSelector:
                 if i or j:
                     self.next()
 
-                yield self.current_items, self.get_next_items()
+                yield self.current_items, self.get_next_items()[0]
 
-    def run(self):
+    def run(self) -> Generator[Tuple[Tuple[HarmonyItem, ChordItem], Tuple[HarmonyItem, ChordItem]], None, None]:
         for i in count(0):
             if i:
                 self.next()
 
-            yield self.current_items, self.get_next_items()
+            yield self.current_items, self.get_next_items()[0]
 
 
 OptionalMessage = Message | None
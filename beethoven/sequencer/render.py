@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Generator, List, Sequence, Tuple
+
+from mido import MetaMessage, MidiFile, MidiTrack, bpm2tempo
+
+from beethoven.adapters.midi import MidiEvent
+from beethoven.constants.duration import ticks_per_quarter
+from beethoven.sequencer.objects import BasePlayer, Conductor, HarmonyItemSelector, Message, Part, Splitter
+from beethoven.sequencer.runner import Buffer, PlayerTarget
+
+TrackEvent = Tuple[int, MidiEvent | MetaMessage]
+
+
+@dataclass
+class RenderStats:
+    parts: int
+    events: int
+    ticks: int
+    elapsed: float
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+
+class OfflineRenderer:
+    """Sequence a harmony grid through the Splitter, Buffer and players as the
+    Sequencer does, but into a Standard MIDI File and without sleeping.
+
+    Ticks are written as is, the file resolution being ticks_per_quarter.
+    """
+
+    def __init__(
+        self,
+        harmony_iterator: HarmonyItemSelector,
+        players: Sequence[BasePlayer],
+        conductor_str: str = "MCL",
+    ):
+        self.harmony_iterator = harmony_iterator
+        self.players = players
+        self.conductor_str = conductor_str
+
+    def get_parts(self, rounds: int = 1) -> Generator[Part, None, None]:
+        splitter = Splitter(conductor=Conductor.build(self.conductor_str))
+
+        self.harmony_iterator.reset()
+
+        for sequencer_items, next_sequencer_items in self.harmony_iterator.run_for(rounds):
+            yield from splitter.run(sequencer_items, next_sequencer_items)
+
+    @staticmethod
+    def get_meta_messages(part: Part, previous_part: Part | None) -> List[MetaMessage]:
+        meta_messages = []
+
+        if previous_part is None or part.bpm != previous_part.bpm:
+            meta_messages.append(MetaMessage("set_tempo", tempo=bpm2tempo(part.bpm.value)))
+
+        if (
+            (previous_part is None or part.time_signature != previous_part.time_signature)
+            # Standard MIDI Files only store power of 2 denominators
+            and not part.time_signature.beat_unit & (part.time_signature.beat_unit - 1)
+        ):
+            meta_messages.append(
+                MetaMessage(
+                    "time_signature",
+                    numerator=part.time_signature.beats_per_bar,
+                    denominator=part.time_signature.beat_unit,
+                )
+            )
+
+        return meta_messages
+
+    def render(self, rounds: int = 1) -> Tuple[MidiFile, RenderStats]:
+        start = perf_counter()
+
+        meta_events: List[TrackEvent] = []
+        player_events: List[List[TrackEvent]] = [[] for _ in self.players]
+        player_indexes = {id(player): index for index, player in enumerate(self.players)}
+
+        buffer = Buffer(generators=self.players)
+        previous_part = None
+        parts = 0
+        end_tick = 0
+
+        for part in self.get_parts(rounds):
+            meta_events.extend(
+                (part.start_tick, meta_message)
+                for meta_message in self.get_meta_messages(part, previous_part)
+            )
+
+            buffer.setup(part)
+
+            player_targets = [PlayerTarget.build(player, output=None) for player in self.players]
+
+            for tick, message in buffer.get_messages():
+                if not isinstance(message, Message):
+                    continue
+
+                player_index = player_indexes[id(message.player)]
+                target = player_targets[player_index]
+
+                if not target.enabled or not (midi_events := target.get_midi_events(message)):
+                    continue
+
+                note_on, note_off = midi_events
+
+                events = player_events[player_index]
+                events.append((tick, note_on))
+                events.append((tick + message.duration.to_ticks(), note_off))
+
+            previous_part = part
+            parts += 1
+            end_tick = part.end_tick
+
+        midi_file = MidiFile(type=1, ticks_per_beat=ticks_per_quarter)
+        midi_file.tracks.append(self.get_track(meta_events))
+
+        for player, events in zip(self.players, player_events):
+            midi_file.tracks.append(
+                self.get_track(
+                    events,
+                    name=f"{player.setting.instrument_name} {player.setting.instrument_style}",
+                )
+            )
+
+        stats = RenderStats(
+            parts=parts,
+            events=sum(len(events) for events in player_events),
+            ticks=end_tick,
+            elapsed=perf_counter() - start,
+        )
+
+        return midi_file, stats
+
+    @staticmethod
+    def get_track(events: List[TrackEvent], name: str | None = None) -> MidiTrack:
+        """Track of events given with absolute ticks, sorted stably so messages of
+        a same tick keep the order the Sequencer would send them in"""
+
+        track = MidiTrack()
+
+        if name:
+            track.append(MetaMessage("track_name", name=name))
+
+        last_tick = 0
+        for tick, message in sorted(events, key=lambda event: event[0]):
+            if isinstance(message, MidiEvent):
+                message = message.to_mido()
+
+            track.append(message.copy(time=tick - last_tick))
+            last_tick = tick
+
+        return track
+
+    def save(self, path: Path | str, rounds: int = 1) -> RenderStats:
+        midi_file, stats = self.render(rounds)
+        midi_file.save(str(path))
+
+        return stats
@@ -1,24 +1,32 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from copy import copy
 from dataclasses import dataclass, field, replace
+from functools import partial
 from itertools import cycle
-from pprint import pprint
-from time import sleep
-from typing import Dict, List, Protocol, Sequence, Tuple, TypeVar
-
-from mido.backends.rtmidi import Output  # type: ignore[import]
-from PySide6.QtCore import SignalInstance
-
-from beethoven.adapters.midi import MidiAdapter, MidiMessage
-from beethoven.models import (ChordItem, Duration, DurationItem,
-                              HarmonyItem, TimeSection, TimeSignature)
-from beethoven.sequencer.objects import BasePlayer, Message, Conductor, SequencerStrategy, Splitter, HarmonyItemSelector, SequencerStrategy, Part
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Protocol, Sequence, Tuple, TypeVar
+
+from beethoven.adapters.midi import MidiAdapter, MidiEvent
+from beethoven.constants.duration import ticks_per_quarter
+from beethoven.models import (Bpm, ChordItem, Duration, DurationItem,
+                              HarmonyItem, Scale, TimeSection, TimeSignature)
+from beethoven.sequencer.objects import BasePlayer, Message, Conductor, SequencerStrategy, Splitter, HarmonyItemSelector, SequencerStrategy, Part, InvalidHarmonyChordItems
+from beethoven.sequencer.scheduler import DeadlineScheduler, EventQueue
+from beethoven.sequencer.timeline import TimelineCompiler, TimelineEvent
+from beethoven.utils.trace import SEQUENCER, tracer
 
 # from beethoven.ui.constants import DEFAULT_TIME_SIGNATURE
 
+if TYPE_CHECKING:
+    from mido.backends.rtmidi import Output  # type: ignore[import]
+    from PySide6.QtCore import SignalInstance
+
 Obj = TypeVar("Obj")
 
+sequencer_trace = tracer[SEQUENCER]
+
 
 class NoteGeneratorProtocol(Protocol):
     def __init__(self, strategy: SequencerStrategy | None= None): ...
@@ -37,8 +45,8 @@ class Buffer:  # (NoteGenerator):
         self.cursor: Duration
         self.limit_cursor: Duration
 
-    def get_generators(self): return self.generators
-    def set_generators(self, generators): self.generators = generators
+    def get_generators(self) -> Sequence[BasePlayer]: return self.generators
+    def set_generators(self, generators: Sequence[BasePlayer]) -> None: self.generators = generators
 
     def setup(self, part: Part, strategy: SequencerStrategy | None = None, **kwargs):
         self.part = part
@@ -49,23 +57,77 @@ class Buffer:  # (NoteGenerator):
         # self.limit_cursor = self.part.end_cursor
         self.limit_cursor = self.part.intermediate_cursor
 
-    def get_messages(self):
-        messages = []
+    def get_messages(self) -> List[Tuple[int, Any]]:
+        """Messages of every player for the part, timelines converted to integer ticks"""
+
+        messages: List[Tuple[int, Any]] = []
+        limit_tick = self.part.intermediate_tick
         g: BasePlayer
         for g in self.generators:
             g.setup(self.part)
 
             for timeline, message in g.play():
-                if timeline >= self.part.intermediate_cursor:
+                tick = timeline if isinstance(timeline, int) else timeline.to_ticks()
+
+                if tick >= limit_tick:
                     break
-                messages.append([timeline, message])
+                messages.append((tick, message))
         return messages
 
 
+@dataclass(frozen=True)
+class PlayerTarget:
+    """Output, channel and mapping MIDI indexes of a player, resolved once per player
+    setup or mapping change so scheduling a message is only a few lookups"""
+
+    output: Output | None
+    channel: int
+    enabled: bool
+    midi_indexes: Dict[str, int]
+
+    @classmethod
+    def build(cls, player: BasePlayer, output: Output | None) -> PlayerTarget:
+        mappings = player.mapping.mappings if player.mapping else {}
+
+        return cls(
+            output=output,
+            channel=player.setting.channel,
+            enabled=player.setting.enabled,
+            midi_indexes={name: note.midi_index for name, note in mappings.items() if note},
+        )
+
+    @staticmethod
+    def get_key(player: BasePlayer) -> Tuple[Any, ...]:
+        return (
+            player.setting.output_name,
+            player.setting.channel,
+            player.setting.enabled,
+            player.mapping.revision if player.mapping else None,
+        )
+
+    def get_midi_events(self, message: Message) -> Tuple[MidiEvent, MidiEvent] | None:
+        if isinstance(message.note, str):
+            midi_index = self.midi_indexes.get(message.note)
+        else:
+            midi_index = message.note.midi_index
+
+        if not midi_index:
+            return None
+
+        return (
+            MidiEvent("note_on", self.channel, midi_index, message.velocity, self.output),
+            MidiEvent("note_off", self.channel, midi_index, message.velocity, self.output),
+        )
+
+
 @dataclass
 class Sequencer:
     continuous_duration_ratio = 2
 
+    # Seconds of music computed ahead of the dispatch loop
+    lookahead = 0.5
+    queue_maxsize = 4096
+
     harmony_iterator: HarmonyItemSelector
     players: List[BasePlayer] = field(default_factory=list)
 
@@ -78,7 +140,9 @@ class Sequencer:
         harmony_iterator: HarmonyItemSelector,
         players: List[BasePlayer],
         preview: bool,
-        items_change: SignalInstance
+        items_change: SignalInstance,
+        clock: Callable[[], float] = perf_counter,
+        sleeper: Callable[[float], Any] | None = None,
     ):
         self.midi_adapter = midi_adapter
         self.harmony_iterator = harmony_iterator
@@ -87,11 +151,109 @@ class Sequencer:
         self.items_change = items_change
 
         self._cached_midi_outputs: Dict[str, Output] = {}
+        self._cached_player_targets: Dict[int, Tuple[Tuple[Any, ...], PlayerTarget]] = {}
+
+        self.stopping = Event()
+        self.scheduler = DeadlineScheduler(clock=clock, sleeper=sleeper, stopping=self.stopping)
+        self.queue = EventQueue(maxsize=self.queue_maxsize)
+
+        # Note off of the notes sent and not released yet, by output, channel and note
+        self.sounding_notes: Dict[Tuple[int, int, int], MidiEvent] = {}
+
+        self.update_lock = Lock()
+        self.updated = Event()
+        self.pending_players: List[BasePlayer] | None = None
+        self.pending_edits: List[Tuple[HarmonyItem, ChordItem | None, Dict[str, Any], ChordItem | None]] = []
+
+        self.timeline_compiler = TimelineCompiler(
+            Buffer(generators=self.players), self.get_player_target, routed_only=True
+        )
 
         self.reset()
 
-    def set_players(self, players):
+    def set_players(self, players: List[BasePlayer]) -> None:
         self.players = players
+        self.timeline_compiler.set_players(players)
+
+        # Player ids may be reused by the new players, opened outputs are kept
+        self._cached_player_targets.clear()
+
+    def update(
+        self,
+        harmony_item: HarmonyItem | None = None,
+        chord_item: ChordItem | None = None,
+        players: List[BasePlayer] | None = None,
+        bpm: Bpm | None = None,
+        time_signature: TimeSignature | None = None,
+        scale: Scale | None = None,
+        chord_values: ChordItem | None = None,
+    ) -> None:
+        """Apply edits from the next part on, without stopping the playback.
+
+        The values are set on the items by apply_updates on the producer thread,
+        so parts are never computed from half edited items. Harmony values go to
+        the harmony item of the chord item, or to the current one when no item is
+        given, chord values to the chord item. Players replace the current ones,
+        reusing the outputs already opened.
+        """
+
+        harmony_values = {
+            name: value
+            for name, value in (("bpm", bpm), ("time_signature", time_signature), ("scale", scale))
+            if value is not None
+        }
+
+        if chord_values is not None and chord_item is None:
+            raise ValueError("Chord values need the chord item to apply them to")
+
+        if harmony_item is None and chord_item is not None:
+            harmony_item = next(
+                (item for item in self.harmony_iterator.harmony_items if chord_item in item.chord_items),
+                None,
+            )
+
+            if harmony_item is None:
+                raise InvalidHarmonyChordItems()
+        elif harmony_item is None and harmony_values:
+            harmony_item = self.harmony_iterator.current_harmony_item
+
+        with self.update_lock:
+            if harmony_item is not None:
+                # Copied as the caller may keep editing its values until they are applied
+                self.pending_edits.append(
+                    (harmony_item, chord_item, harmony_values, copy(chord_values) if chord_values else None)
+                )
+
+            if players is not None:
+                self.pending_players = players
+
+            self.updated.set()
+
+    def apply_updates(self) -> bool:
+        """Take the updates at a part boundary, True if there were any"""
+
+        if not self.updated.is_set():
+            return False
+
+        with self.update_lock:
+            self.updated.clear()
+
+            edits, self.pending_edits = self.pending_edits, []
+            players, self.pending_players = self.pending_players, None
+
+        for harmony_item, chord_item, harmony_values, chord_values in edits:
+            for name, value in harmony_values.items():
+                setattr(harmony_item, name, value)
+
+            if chord_item is not None and chord_values is not None:
+                chord_item.set_values(chord_values)
+
+            harmony_item.bump_revision()
+
+        if players is not None:
+            self.set_players(players)
+
+        return True
 
     def set_harmony_iterator(self, harmony_iterator):
         self.harmony_iterator = harmony_iterator
@@ -100,46 +262,40 @@ class Sequencer:
         if output_name and output_name not in self._cached_midi_outputs:
             self._cached_midi_outputs[output_name] = self.midi_adapter.open_output(output_name)
 
-        return self._cached_midi_outputs[output_name]
+        return self._cached_midi_outputs.get(output_name)
+
+    def get_player_target(self, player: BasePlayer) -> PlayerTarget:
+        key = PlayerTarget.get_key(player)
+        cached = self._cached_player_targets.get(id(player))
+
+        if cached is None or cached[0] != key:
+            target = PlayerTarget.build(player, output=self.get_midi_output(player.setting.output_name))
+            self._cached_player_targets[id(player)] = cached = (key, target)
 
-    def reset(self):
+        return cached[1]
+
+    def reset(self) -> None:
         self.global_cursor = Duration()
         self.previous_time_signature = None
 
         self.previous_harmony_end_time_section = TimeSection()
         self.previous_harmony_item = None
 
-    def run(self):  # noqa: C901
-        conductor = Conductor.build("MCL")
-        splitter = Splitter(conductor=conductor)
-
-        v = 0
-        print("RUN")
-        players = self.players
-
-        if v:
-            print(self.players)
-
-        buffer = Buffer(generators=players)
-        if v:
-            print("(", players, ")")
+    def start(self) -> None:
+        """Arm the sequencer for a new run, before starting the thread calling run,
+        so a stop issued while that thread starts isn't lost"""
 
-        if v:
-            print("RERUN")
-        # print("RERUN")
-        # print("RERUN")
-        # print(self.params.harmony_iterator)
-        message: Message
-        last_cursor = Duration()
+        self.stopping.clear()
+        self.queue = EventQueue(maxsize=self.queue_maxsize)
 
-        # for sequencer_items, next_sequencer_items in self.params.harmony_iterator.run():
+    def stop(self) -> None:
+        self.stopping.set()
+        self.queue.close(clear=True)
 
-        print(f"{self.preview = }")
-        print(f"{self.continuous = }")
+    def get_sequencer_items(self) -> Iterator[Tuple[Tuple[HarmonyItem, ChordItem], Tuple[HarmonyItem, ChordItem]]]:
         preview_iterator: cycle[Tuple[Tuple[HarmonyItem, ChordItem], Tuple[HarmonyItem, ChordItem]]] | None = None
         if self.preview or self.continuous:
             sequencer_items = self.harmony_iterator.current_items
-            # next_sequencer_items = self.harmony_iterator.get_next_items()
 
             harmony_item, chord_item = sequencer_items
 
@@ -152,142 +308,231 @@ class Sequencer:
                 ((harmony_item, chord_item), (harmony_item, chord_item))
             ])
 
-        i = 0
-        # while 1:
-        print(self.preview)
-        for sequencer_items, next_sequencer_items in preview_iterator or self.harmony_iterator.run():
-            harmony_item, chord_item = sequencer_items
-            if not self.preview:
-                self.items_change.emit(harmony_item, chord_item)
+        for i, items in enumerate(preview_iterator or self.harmony_iterator.run()):
+            if self.preview and i > 3:
+                break
+
+            yield items
+
+    def wait_for_lookahead(self, seconds: float) -> bool:
+        """Block the producer until seconds is within the lookahead window"""
 
-            # pprint(harmony_item)
-            print("Sequencer = ", harmony_item.scale.to_log_string(), " - ", chord_item.root)
+        while (ahead := seconds - self.lookahead - (self.scheduler.clock() - self.scheduler.origin)) > 0:
+            if self.stopping.wait(ahead):
+                return False
 
-            sequencer_items = (harmony_item, chord_item)
+        return not self.stopping.is_set()
 
-            # harmony_item, chord_item = sequencer_items
-            if v:
-                print("=" * 55)
-            if v:
-                print("#", i)
-            #  if self.params.on_harmony_item_change:
-            #      self.params.on_harmony_item_change(harmony_item)
+    def wait_for_part(self, part: Part, offset_ticks: int = 0) -> bool:
+        """Set the part tempo and block until it is within the lookahead and the queue has room"""
 
-            # if self.params.on_chord_item_change:
-            #     self.params.on_chord_item_change(harmony_item, chord_item)
+        start_tick = part.start_tick + offset_ticks
+        self.scheduler.set_tempo(start_tick, 60 / (ticks_per_quarter * part.bpm.value))
+
+        if not self.wait_for_lookahead(self.scheduler.get_seconds(start_tick)):
+            return False
+
+        return self.queue.wait_for_room()
+
+    def push_events(self, part: Part, events: Sequence[TimelineEvent], offset_ticks: int = 0) -> None:
+        self.queue.push(
+            ((self.scheduler.get_seconds(tick + offset_ticks), event) for tick, event in events),
+            watermark=self.scheduler.get_seconds(part.intermediate_tick + offset_ticks),
+        )
+
+    def produce(self) -> None:
+        """Compute the parts and their MIDI messages ahead of time into the queue,
+        as (deadline in seconds since the run start, MIDI message or callable)"""
+
+        if sequencer_trace.enabled:
+            sequencer_trace.record("produce", self.preview, self.continuous)
+
+        try:
+            if self.preview or self.continuous:
+                self.produce_parts(self.get_sequencer_items(), Splitter(conductor=Conductor.build("MCL")))
+            else:
+                self.produce_timeline()
+        finally:
+            self.queue.close()
+
+    def produce_parts(
+        self,
+        sequencer_items_iterator: Iterator[Tuple[Tuple[HarmonyItem, ChordItem], Tuple[HarmonyItem, ChordItem]]],
+        splitter: Splitter,
+    ) -> None:
+        """Split and play the chords one at a time as they come"""
+
+        for sequencer_items, next_sequencer_items in sequencer_items_iterator:
+            harmony_item, chord_item = sequencer_items
+            if sequencer_trace.enabled:
+                sequencer_trace.record("items", harmony_item.scale.to_log_string(), chord_item.root)
+
+            chord_starting = True
 
             for part in splitter.run(sequencer_items, next_sequencer_items):
-                if v:
-                    print("-" * 33)
-
-                # print("START", part.start_cursor)
-                # print("INTER", part.intermediate_cursor)
-                # print("END  ", part.end_cursor)
-                # print("scale", part.scale)
-                # print("chord", part.chord)
-
-                if v:
-                    pprint(part)
-                # pprint(part)
-
-                if v:
-                    print()
-                buffer.setup(part)
-
-                events = defaultdict(list)
-                messages = buffer.get_messages()
-                for cursor, message in messages:
-                    """
-                    if not callable(message):
-                        print(f"{str(cursor.value):6}, {str(message.note):4}, {str(message.duration.value)}")
-                    """
-
-                    if cursor >= part.end_cursor:
-                        break
-
-                    if isinstance(message, Message):
-                        note_on, note_off = MidiMessage.get_tuple_from_message(
-                            message=message,
-                            output=self.get_midi_output(message.player.setting.output_name),
-                        )
-
-                        events[cursor].append(note_on)
-                        events[cursor + message.duration].append(note_off)
-                    elif callable(message):
-                        events[cursor].append(message)
-
-                end_cursor = part.end_cursor
-                end_cursor = part.intermediate_cursor
-                ratio = 1
-                midi_messages: List[MidiMessage]
-                """
-                pprint(events)
-                print("++++", last_cursor, end_cursor)
-                """
-                if v:
-                    pprint(list(events.keys()))
-                for cursor, midi_messages in sorted(events.items(), key=lambda x: x[0]):
-                    if cursor > last_cursor:
-                        if v:
-                            print("SLEEP", last_cursor, cursor, float((cursor - last_cursor).value) * ratio * 60)  # / part.bpm.value)
-                        sleep(float((cursor - last_cursor).value) * ratio * 60 / part.bpm.value)
-                        # sleep_for_gap(last_cursor, cursor, bpm=part.bpm)
-                    # print("out sleep")
-
-                    for midi_message in midi_messages:
-                        # print(message)
-                        print("-", cursor, midi_message.origin.note, midi_message.type)
-
-                        if callable(midi_message):
-                            midi_message()
-
-                            continue
-                        else:
-                            midi_message.fix_note_midi_index()
-
-                        if (
-                            not midi_message.output or
-                            not midi_message.origin.player.setting.enabled or
-                            not midi_message.note
-                        ):
-                            # print(
-                            #     "ddddd",
-                            #     bool(message.output),
-                            #     message.origin.player.setting.enabled,
-                            #     message.fix_note_midi_index(),
-                            # )
-                            # print("OUT", message.origin.player)
-                            continue
-                        # else:
-                        elif midi_message.note:
-                            if midi_message.type == "note_on":
-                                # print("MSG", message.note)
-                                self.midi_adapter.send_message(midi_message)
-                            else:
-                                if midi_message.opener:
-                                    midi_message.note = midi_message.opener.note
-                                if midi_message.note:
-                                    self.midi_adapter.send_message(midi_message)
-                            # print("======", datetime.now(), cursor, last_cursor, end_cursor)
-                            # if message.type == "note_on":
-                            #     print("MSG", message.note)
-
-                    last_cursor = cursor
-
-                # print("----", cursor, last_cursor, end_cursor)
-                if last_cursor < end_cursor:
-                    print("end sleep", part.start_cursor, end_cursor, last_cursor, float((end_cursor - last_cursor).value) * ratio * 60)  # / part.bpm.value)
-                    # sleep(float((end_cursor - last_cursor).value) * ratio * 60 / part.bpm.value)
-                print("end", part.start_cursor, part.intermediate_cursor, part.end_harmony_cursor)
-                # sleep_for_gap(last_cursor, end_cursor, bpm=part.bpm)
-
-            # if self.preview:
-            #     i += 1
-            #     if i > 20:
-            #         break
-            i += 1
-            if self.preview:
-                if i > 3:
-                    break
+                if not self.wait_for_part(part):
+                    return
+
+                updated = self.apply_updates()
+
+                events: List[TimelineEvent] = []
+
+                # Items changes are sent again after an update, the UI showing the applied values
+                if (chord_starting or updated) and not self.preview:
+                    events.append((part.start_tick, partial(self.items_change.emit, harmony_item, chord_item)))
+                    chord_starting = False
+
+                player_targets = {id(player): self.get_player_target(player) for player in self.players}
+                events.extend(self.timeline_compiler.get_part_events(part, player_targets))
+
+                self.push_events(part, events)
+
+    def produce_timeline(self) -> None:
+        """Replay the compiled timeline of the grid from the current items, compiled
+        again between loops and on updates so edits apply without splitting the whole grid.
+
+        Chord looping is left to produce_parts, from the chord it is enabled on.
+        """
+
+        timeline = self.timeline_compiler.compile(self.harmony_iterator)
+        if not timeline.end_tick:
+            return
+
+        index = timeline.get_segment_index(*self.harmony_iterator.current_indexes)
+        part_index = 0
+        offset_ticks = -timeline.segments[index].start_tick
+        updated = False
+
+        while True:
+            segment = timeline.segments[index]
+
+            if part_index == len(segment.parts):
+                index += 1
+                part_index = 0
+
+                if index == len(timeline.segments):
+                    offset_ticks += timeline.end_tick
+                    index = 0
+
+                    timeline = self.timeline_compiler.compile(self.harmony_iterator)
+                    if not timeline.end_tick:
+                        return
+
+                continue
+
+            part = segment.parts[part_index]
+
+            if part_index == 0:
+                self.harmony_iterator.harmony_index = segment.harmony_index
+                self.harmony_iterator.chord_index = segment.chord_index
+
+                if self.harmony_iterator.chord_looping:
+                    splitter = Splitter(
+                        conductor=Conductor.build("MCL"),
+                        global_cursor=Duration.from_ticks(part.start_tick + offset_ticks),
+                    )
+                    return self.produce_parts(self.get_sequencer_items(), splitter)
+
+                if sequencer_trace.enabled:
+                    sequencer_trace.record("segment", segment.harmony_index, segment.chord_index, offset_ticks)
+
+            if not self.wait_for_part(part, offset_ticks):
+                return
+
+            if self.apply_updates():
+                tick = part.start_tick + offset_ticks
+
+                timeline = self.timeline_compiler.compile(self.harmony_iterator)
+                if not timeline.end_tick:
+                    return
+
+                index, part_index, timeline_tick = timeline.locate(segment, part_index)
+                offset_ticks = tick - timeline_tick
+
+                if sequencer_trace.enabled:
+                    sequencer_trace.record("updated", index, part_index, self.timeline_compiler.compiled_segments)
+
+                updated = True
+                continue
+
+            part_events = segment.part_events[part_index]
+
+            # Items changes are sent again after an update, the UI showing the applied values
+            if part_index == 0 or updated:
+                item_change = partial(self.items_change.emit, segment.harmony_item, segment.chord_item)
+                part_events = ((part.start_tick, item_change), *part_events)
+                updated = False
+
+            self.push_events(part, part_events, offset_ticks)
+
+            part_index += 1
+
+    def release_notes(self) -> None:
+        """Send the note off of the notes still sounding, their own being dropped on stop"""
+
+        if self.sounding_notes:
+            if sequencer_trace.enabled:
+                sequencer_trace.record("release", len(self.sounding_notes))
+
+            self.midi_adapter.send_messages(list(self.sounding_notes.values()))
+            self.sounding_notes.clear()
+
+    def dispatch(self, midi_messages: List[MidiEvent | Callable[[], Any]]) -> None:
+        """Send the messages due at a same deadline in one batch, then run the callables"""
+
+        callables = []
+        midi_events = []
+
+        for midi_message in midi_messages:
+            if callable(midi_message):
+                callables.append(midi_message)
+                continue
+
+            midi_events.append(midi_message)
+
+            key = (id(midi_message.output), midi_message.channel, midi_message.note)
+
+            if midi_message.type == "note_on":
+                self.sounding_notes[key] = midi_message._replace(type="note_off")
+            elif midi_message.type == "note_off":
+                self.sounding_notes.pop(key, None)
+
+        if midi_events:
+            if sequencer_trace.enabled:
+                sequencer_trace.record("dispatch", *(f"{event.type}:{event.note}" for event in midi_events))
+
+            self.midi_adapter.send_messages(midi_events)
+
+        for callable_message in callables:
+            callable_message()
+
+    def run(self) -> None:
+        """Dispatch the messages computed by the producer thread at their deadline,
+        so computing a new part never delays the messages being played"""
+
+        if sequencer_trace.enabled:
+            sequencer_trace.record("run")
+
+        self.scheduler.reset()
+        self.sounding_notes.clear()
+
+        producer = Thread(target=self.produce, name="sequencer_producer", daemon=True)
+        producer.start()
+
+        while (event := self.queue.pop()) is not None:
+            seconds, midi_message = event
+            midi_messages = [midi_message, *self.queue.pop_at(seconds)]
+
+            self.scheduler.wait_until(self.scheduler.origin + seconds)
+
+            if self.stopping.is_set():
+                break
+
+            self.dispatch(midi_messages)
+
+        producer.join()
+
+        self.release_notes()
 
-        print("Sequencer::Run grid ended")
+        if sequencer_trace.enabled:
+            sequencer_trace.record("run_ended", self.scheduler.jitter.count, self.scheduler.jitter.max)
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Event
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# Upper bounds of the lateness buckets, in seconds
+JITTER_BUCKETS: Tuple[float, ...] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025)
+
+
+@dataclass
+class JitterStats:
+    buckets: Tuple[float, ...] = JITTER_BUCKETS
+
+    counts: List[int] = field(init=False)
+    count: int = field(init=False, default=0)
+    total: float = field(init=False, default=0.0)
+    max: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def add(self, late_by: float) -> None:
+        self.counts[bisect_left(self.buckets, late_by)] += 1
+        self.count += 1
+        self.total += late_by
+
+        if late_by > self.max:
+            self.max = late_by
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def get_histogram(self) -> Dict[str, int]:
+        """Event counts keyed by lateness upper bound in microseconds"""
+
+        labels = [f"<={bound * 1_000_000:g}us" for bound in self.buckets]
+        labels.append(f">{self.buckets[-1] * 1_000_000:g}us")
+
+        return dict(zip(labels, self.counts))
+
+
+class DeadlineScheduler:
+    """Wait for ticks against absolute deadlines computed from the session start.
+
+    Deadlines never accumulate the time spent between waits, the last part of
+    each wait is spun to get under the sleep granularity and the lateness of
+    every wait is recorded in jitter. Setting stopping interrupts a wait, the
+    default sleeper waiting on it.
+    """
+
+    def __init__(
+        self,
+        spin_threshold: float = 0.001,
+        clock: Callable[[], float] = perf_counter,
+        sleeper: Callable[[float], Any] | None = None,
+        stopping: Event | None = None,
+    ):
+        self.spin_threshold = spin_threshold
+        self.clock = clock
+        self.stopping = stopping if stopping is not None else Event()
+        self.sleeper = sleeper or self.stopping.wait
+
+        self.reset()
+
+    def reset(self) -> None:
+        self.origin = self.clock()
+
+        self.anchor_tick = 0
+        self.anchor_seconds = 0.0
+        self.seconds_per_tick = 0.0
+
+        self.jitter = JitterStats()
+
+    def set_tempo(self, tick: int, seconds_per_tick: float) -> None:
+        """Change the tick duration from tick on, keeping earlier deadlines in place"""
+
+        self.anchor_seconds = self.get_seconds(tick)
+        self.anchor_tick = tick
+        self.seconds_per_tick = seconds_per_tick
+
+    def get_seconds(self, tick: int) -> float:
+        return self.anchor_seconds + (tick - self.anchor_tick) * self.seconds_per_tick
+
+    def get_deadline(self, tick: int) -> float:
+        return self.origin + self.get_seconds(tick)
+
+    def wait_until(self, deadline: float) -> float:
+        """Lateness of the wait, negative and not recorded when interrupted"""
+
+        remaining = deadline - self.clock()
+
+        if remaining > self.spin_threshold:
+            self.sleeper(remaining - self.spin_threshold)
+
+        while (now := self.clock()) < deadline:
+            if self.stopping.is_set():
+                return now - deadline
+
+        late_by = now - deadline
+        self.jitter.add(late_by)
+
+        return late_by
+
+    def wait_for_tick(self, tick: int) -> float:
+        return self.wait_until(self.get_deadline(tick))
+
+
+class EventQueue:
+    """Bounded queue of (deadline, item) shared by a producer and a dispatch loop.
+
+    Items pop in deadline order, then push order, and only once the producer
+    watermark passed them, so nothing pushed later can be due before an item
+    already popped.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+
+        self.heap: List[Tuple[float, int, Any]] = []
+        self.serials = count()
+        self.watermark = float("-inf")
+        self.closed = False
+
+        self.condition = Condition()
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def is_poppable(self) -> bool:
+        return bool(self.heap) and self.heap[0][0] < self.watermark
+
+    def wait_for_room(self) -> bool:
+        """Block while the queue is full, False once closed.
+
+        Items past the watermark count too, so maxsize has to leave room for the
+        note offs still pending after a part.
+        """
+
+        with self.condition:
+            self.condition.wait_for(lambda: self.closed or len(self.heap) < self.maxsize)
+
+            return not self.closed
+
+    def push(self, items: Iterable[Tuple[float, Any]], watermark: float) -> None:
+        """Push items and allow popping everything due before the watermark"""
+
+        with self.condition:
+            if self.closed:
+                return
+
+            for deadline, item in items:
+                heappush(self.heap, (deadline, next(self.serials), item))
+
+            self.watermark = max(self.watermark, watermark)
+
+            self.condition.notify_all()
+
+    def pop(self) -> Tuple[float, Any] | None:
+        """Next (deadline, item), None once closed and drained"""
+
+        with self.condition:
+            self.condition.wait_for(lambda: self.closed or self.is_poppable())
+
+            if not self.heap:
+                return None
+
+            deadline, _, item = heappop(self.heap)
+
+            self.condition.notify_all()
+
+            return deadline, item
+
+    def pop_at(self, deadline: float) -> List[Any]:
+        """Pop without blocking the poppable items due exactly at deadline"""
+
+        items = []
+
+        with self.condition:
+            while self.heap and self.heap[0][0] == deadline and (self.closed or self.is_poppable()):
+                items.append(heappop(self.heap)[2])
+
+            if items:
+                self.condition.notify_all()
+
+        return items
+
+    def close(self, clear: bool = False) -> None:
+        """Stop accepting items, the remaining ones are still popped unless cleared"""
+
+        with self.condition:
+            self.closed = True
+
+            if clear:
+                self.heap.clear()
+
+            self.condition.notify_all()
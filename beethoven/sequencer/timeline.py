@@ -0,0 +1,244 @@
+"""Timeline of a whole harmony grid, compiled ahead of playback.
+
+One loop of the grid is flattened into chord segments holding the parts of a
+chord item and the events of every player, in ticks from the grid start.
+Compiling again after an edit only runs the Splitter and the players for the
+chord items whose inputs changed, the other segments are reused as is.
+"""
+
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+from beethoven.adapters.midi import MidiEvent
+from beethoven.models import ChordItem, Duration, HarmonyItem
+from beethoven.sequencer.objects import (BasePlayer, Conductor, HarmonyItemSelector, Message, Part, Splitter,
+                                         SplitterState)
+
+if TYPE_CHECKING:
+    from beethoven.sequencer.runner import Buffer, PlayerTarget
+
+TimelineEvent = Tuple[int, MidiEvent | Callable[[], Any]]
+
+
+@dataclass(frozen=True)
+class ChordSegment:
+    harmony_index: int
+    chord_index: int
+    harmony_item: HarmonyItem
+    chord_item: ChordItem
+
+    # Everything the parts and events depend on besides the splitter state
+    key: Tuple[Any, ...]
+    state: SplitterState
+    next_state: SplitterState
+
+    parts: Tuple[Part, ...]
+    part_events: Tuple[Tuple[TimelineEvent, ...], ...]
+
+    @property
+    def start_tick(self) -> int:
+        return self.state.global_cursor.to_ticks()
+
+    @property
+    def end_tick(self) -> int:
+        return self.next_state.global_cursor.to_ticks()
+
+
+@dataclass(frozen=True)
+class Timeline:
+    segments: Tuple[ChordSegment, ...]
+    players_key: Tuple[Tuple[int, Any, PlayerTarget], ...]
+
+    @property
+    def end_tick(self) -> int:
+        return self.segments[-1].end_tick if self.segments else 0
+
+    @property
+    def parts(self) -> List[Part]:
+        return [part for segment in self.segments for part in segment.parts]
+
+    def get_events(self) -> List[TimelineEvent]:
+        """Events of the loop sorted by tick, a same tick keeping the compilation order"""
+
+        events = [
+            event
+            for segment in self.segments
+            for part_events in segment.part_events
+            for event in part_events
+        ]
+        events.sort(key=lambda event: event[0])
+
+        return events
+
+    def get_segment_index(self, harmony_index: int, chord_index: int) -> int:
+        for index, segment in enumerate(self.segments):
+            if segment.harmony_index == harmony_index and segment.chord_index == chord_index:
+                return index
+
+        return 0
+
+    def locate(self, segment: ChordSegment, part_index: int) -> Tuple[int, int, int]:
+        """Segment index, part index and tick in this timeline of a part of a segment
+        compiled before, to resume playback after an edit.
+
+        Playback resumes on the part at the same place of the same chord item, on
+        the next chord when that part is gone, or at the same grid indexes when the
+        chord item itself is gone.
+        """
+
+        part_tick = segment.parts[part_index].start_tick - segment.start_tick
+
+        for index, new_segment in enumerate(self.segments):
+            if new_segment.harmony_item is not segment.harmony_item or new_segment.chord_item is not segment.chord_item:
+                continue
+
+            for new_part_index, part in enumerate(new_segment.parts):
+                if part.start_tick - new_segment.start_tick == part_tick:
+                    return index, new_part_index, part.start_tick
+
+            index = (index + 1) % len(self.segments)
+
+            return index, 0, self.segments[index].start_tick
+
+        index = self.get_segment_index(segment.harmony_index, segment.chord_index)
+
+        return index, 0, self.segments[index].start_tick
+
+
+class TimelineCompiler:
+    """Compile a harmony grid into a Timeline, keeping the last one to reuse its
+    segments on the next compilation.
+
+    A segment is reused when its chord item, harmony settings, layout and the
+    splitter state it starts from are unchanged, and the players resolve to the
+    same targets. Events of players without output are dropped with routed_only.
+    """
+
+    def __init__(
+        self,
+        buffer: Buffer,
+        get_player_target: Callable[[BasePlayer], PlayerTarget],
+        conductor_str: str = "MCL",
+        routed_only: bool = False,
+    ):
+        self.buffer = buffer
+        self.get_player_target = get_player_target
+        self.conductor_str = conductor_str
+        self.routed_only = routed_only
+
+        self.timeline: Timeline | None = None
+        self.harmony_item_layouts: Dict[HarmonyItem, Tuple[int, Dict[ChordItem, List[Duration]]]] = {}
+
+        # Segments compiled, not reused, by the last compilation
+        self.compiled_segments = 0
+
+    @property
+    def players(self) -> List[BasePlayer]:
+        return list(self.buffer.get_generators())
+
+    def set_players(self, players: List[BasePlayer]) -> None:
+        self.buffer.set_generators(players)
+
+    def compile(self, harmony_iterator: HarmonyItemSelector) -> Timeline:
+        splitter = Splitter(
+            conductor=Conductor.build(self.conductor_str),
+            harmony_item_layouts=self.harmony_item_layouts,
+        )
+
+        player_targets = {id(player): self.get_player_target(player) for player in self.players}
+        players_key = tuple(
+            (id(player), getattr(player, "callable", None), player_targets[id(player)]) for player in self.players
+        )
+
+        previous_segments: Dict[Tuple[HarmonyItem, ChordItem], ChordSegment] = {}
+        if self.timeline is not None and self.timeline.players_key == players_key:
+            previous_segments = {
+                (segment.harmony_item, segment.chord_item): segment for segment in self.timeline.segments
+            }
+
+        grid = [
+            (harmony_index, chord_index, harmony_item, chord_item)
+            for harmony_index, harmony_item in enumerate(harmony_iterator.harmony_items)
+            for chord_index, chord_item in enumerate(harmony_item.chord_items)
+        ]
+
+        # Drop the layouts of harmony items removed from the grid since the last compilation
+        harmony_items = set(harmony_iterator.harmony_items)
+        for harmony_item in [item for item in self.harmony_item_layouts if item not in harmony_items]:
+            del self.harmony_item_layouts[harmony_item]
+
+        segments = []
+        self.compiled_segments = 0
+
+        for position, (harmony_index, chord_index, harmony_item, chord_item) in enumerate(grid):
+            next_items = grid[(position + 1) % len(grid)][2:]
+
+            layout = splitter.get_harmony_item_layout(harmony_item).get(chord_item)
+            key = (
+                copy(chord_item),
+                harmony_item.scale,
+                harmony_item.bpm,
+                harmony_item.time_signature,
+                tuple(layout) if layout else None,
+                harmony_item is not next_items[0],
+            )
+            state = splitter.get_state()
+
+            segment = previous_segments.get((harmony_item, chord_item))
+
+            if segment is not None and layout and segment.key == key and segment.state == state:
+                splitter.set_state(segment.next_state)
+
+                if (segment.harmony_index, segment.chord_index) != (harmony_index, chord_index):
+                    segment = replace(segment, harmony_index=harmony_index, chord_index=chord_index)
+            else:
+                parts = tuple(splitter.run((harmony_item, chord_item), next_items))
+
+                segment = ChordSegment(
+                    harmony_index=harmony_index,
+                    chord_index=chord_index,
+                    harmony_item=harmony_item,
+                    chord_item=chord_item,
+                    key=key,
+                    state=state,
+                    next_state=splitter.get_state(),
+                    parts=parts,
+                    part_events=tuple(tuple(self.get_part_events(part, player_targets)) for part in parts),
+                )
+                self.compiled_segments += 1
+
+            segments.append(segment)
+
+        self.timeline = Timeline(segments=tuple(segments), players_key=players_key)
+
+        return self.timeline
+
+    def get_part_events(self, part: Part, player_targets: Dict[int, PlayerTarget]) -> List[TimelineEvent]:
+        """Note on and off events of the part messages, callables being kept as is"""
+
+        self.buffer.setup(part)
+
+        events: List[TimelineEvent] = []
+
+        for tick, message in self.buffer.get_messages():
+            if isinstance(message, Message):
+                target = player_targets[id(message.player)]
+
+                if (
+                    not target.enabled or
+                    (self.routed_only and not target.output) or
+                    not (midi_events := target.get_midi_events(message))
+                ):
+                    continue
+
+                note_on, note_off = midi_events
+
+                events.append((tick, note_on))
+                events.append((tick + message.duration.to_ticks(), note_off))
+            elif callable(message):
+                events.append((tick, message))
+
+        return events
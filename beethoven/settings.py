@@ -3,11 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from os import environ
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from hartware_lib.adapters.filesystem import FileAdapter
 from hartware_lib.serializers.dataclasses import DataClassExtraSerializer
-from hartware_lib.serializers.main import deserialize, serialize
+from hartware_lib.serializers.main import (NoSerializerMatch, deserialize,
+                                           serialize)
 
 from beethoven.models import Note
 
@@ -19,6 +20,22 @@ BEETHOVEN_CONFIG_PATH = (
 )
 
 
+class NoteExtraSerializer:
+    """Notes are slotted and have no __dict__, store them as their string form"""
+
+    def dictify(self, o: Any) -> Dict[str, str]:
+        if isinstance(o, Note):
+            return {"_type": "Note", "value": str(o)}
+
+        raise NoSerializerMatch()
+
+    def objectify(self, type: str, value: Any) -> Note:
+        if type == "Note":
+            return Note.parse(value)  # type: ignore[no-any-return]
+
+        raise NoSerializerMatch()
+
+
 @dataclass
 class TuningSetting:
     notes: List[Note]
@@ -145,6 +162,7 @@ class AppSettings:
         if settings_file.exists:
             try:
                 settings = deserialize(settings_file.read(), extra_serializers=[
+                    NoteExtraSerializer(),
                     DataClassExtraSerializer(
                         AppSettings,
                         TuningSettings,
@@ -180,7 +198,7 @@ class AppSettings:
 
     def serialize(self) -> str:
         return serialize(
-            self, indent=4, extra_serializers=[DataClassExtraSerializer()]
+            self, indent=4, extra_serializers=[NoteExtraSerializer(), DataClassExtraSerializer()]
         )
 
     def save(self, config_file: Path = BEETHOVEN_CONFIG_PATH) -> Path:
@@ -1,11 +1,16 @@
 from typing import List, Protocol, Tuple
 
 from beethoven.models import ChordItem, HarmonyItem, Note
+from beethoven.utils.pitch_class import PitchClassSet
 
 
 class NotesContainer(Protocol):
     notes: List[Note]
 
+    @property
+    def pitch_class_set(self) -> PitchClassSet:
+        ...
+
     def __hash__(self) -> int:
         ...
 
@@ -1,6 +1,7 @@
 import logging
+from copy import copy
 from pprint import pprint
-from typing import List, TypeVar
+from typing import Any, List, TypeVar
 
 from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QWidget
@@ -56,7 +57,7 @@ class ComposeWidget(QWidget):
         )
 
         self.chord_picker = ChordPickerDialog(
-            chord_item=harmony_items[0].chord_items[0], parent=self,
+            chord_item=copy(harmony_items[0].chord_items[0]), parent=self,
         )
         self.chord_picker.value_changed.connect(self.handle_change_from_chord_picker)
         self.harmony_picker = HarmonyPicker()
@@ -130,7 +131,10 @@ class ComposeWidget(QWidget):
 
     def reset_players(self):
         logger.info("reset players")
-        print("reset players" * 22)
+
+        if self.is_playing_grid():
+            self.manager.sequencer_manager.update(reset_players=True)
+            return
 
         was_running = False
         if not self.manager.sequencer_manager.is_stopped():
@@ -147,7 +151,7 @@ class ComposeWidget(QWidget):
         logger.info("reset")
         print("reset")
 
-    def play(self, **kwargs):
+    def play(self, **kwargs: Any) -> None:
         kwargs.setdefault("continuous", self.sequencer_widget.is_chord_step_button_pressed())
         kwargs.setdefault("preview", self.manager.sequencer_manager.is_playing_preview())
 
@@ -158,6 +162,11 @@ class ComposeWidget(QWidget):
     def stop(self, **kwargs):
         self.manager.sequencer_manager.stop(**kwargs)
 
+    def is_playing_grid(self) -> bool:
+        sequencer_manager = self.manager.sequencer_manager
+
+        return sequencer_manager.is_playing() and not sequencer_manager.is_playing_preview()
+
     def handle_items_change(
         self,
         harmony_item: HarmonyItem,
@@ -175,8 +184,9 @@ class ComposeWidget(QWidget):
             with block_signal([self.composer_grid]):
                 self.composer_grid.set_current_items(harmony_item, chord_item)
         if not from_chord_picker:
+            # The picker edits a copy, its values being applied by the change handler
             with block_signal([self.chord_picker]):
-                self.chord_picker.set(chord_item)
+                self.chord_picker.set(copy(chord_item))
         if not from_harmony_picker:
             with block_signal([self.harmony_picker]):
                 self.harmony_picker.set(harmony_item)
@@ -256,16 +266,26 @@ class ComposeWidget(QWidget):
             else:
                 self.play()
 
-    def handle_change_from_chord_picker(self, chord_item):
-        logger.info(f"chord item={chord_item.to_log_string()}")
+    def handle_change_from_chord_picker(self, chord_values: ChordItem) -> None:
+        logger.info(f"chord item={chord_values.to_log_string()}")
 
-        self.handle_items_change(self.harmony_iterator.current_harmony_item, chord_item, from_chord_picker=True)
+        harmony_item, chord_item = self.harmony_iterator.current_items
 
-        print("CHORD PICKER CHANGE PLAY()")
-        if self.manager.sequencer_manager.is_stopped() or self.manager.sequencer_manager.is_playing_preview():
-            self.play(preview=True)
-        else:
-            self.play()
+        # The sequencer applies the values between two parts, then sends the items change
+        if self.is_playing_grid():
+            logger.debug("update playing grid from chord picker")
+            self.manager.sequencer_manager.update(
+                harmony_item=harmony_item, chord_item=chord_item, chord_values=chord_values
+            )
+            return
+
+        chord_item.set_values(chord_values)
+        harmony_item.bump_revision()
+
+        self.handle_items_change(harmony_item, chord_item, from_chord_picker=True)
+
+        logger.debug("play preview from chord picker")
+        self.play(preview=True)
 
     def handle_sequencer_stepper_change(self, _):
         key_step = self.sequencer_widget.is_key_step_button_pressed()
@@ -292,8 +312,19 @@ class ComposeWidget(QWidget):
             f"time_signature={str(time_signature)} bpm={str(bpm)}"
         )
 
+        # The sequencer applies the values between two parts, then sends the items change
+        if (scale or time_signature or bpm) and self.is_playing_grid():
+            self.manager.sequencer_manager.update(
+                harmony_item=self.harmony_iterator.current_harmony_item,
+                scale=scale,
+                time_signature=time_signature,
+                bpm=bpm,
+            )
+            return
+
         if time_signature:
             self.harmony_iterator.current_harmony_item.time_signature = time_signature
+            self.harmony_iterator.current_harmony_item.bump_revision()
             self.composer_grid.harmony_grid.refresh_current_index()
 
         if bpm:
@@ -312,7 +343,7 @@ class ComposeWidget(QWidget):
             else:
                 self.update_frame_display()
 
-    def update_frame_display(self):
+    def update_frame_display(self) -> None:
         self.harmony_chord_frames.update_frames(
             current_items=self.harmony_iterator.current_items,
             next_items=self.harmony_iterator.get_next_items()[0],
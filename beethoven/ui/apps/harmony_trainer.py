@@ -93,6 +93,8 @@ class HarmonyItemGenerator:
     def set_time_signature(self, time_signature: TimeSignature):
         self.current_item.time_signature = time_signature
         self.next_item.time_signature = time_signature
+        self.current_item.bump_revision()
+        self.next_item.bump_revision()
 
         self.original_item = replace(self.original_item, time_signature=time_signature)
 
@@ -3,6 +3,10 @@ from typing import List
 
 from beethoven.models import Note
 from beethoven.types import NotesContainer
+from beethoven.utils.pitch_class import PitchClassSet
+from beethoven.utils.trace import CHECKER, tracer
+
+checker_trace = tracer[CHECKER]
 
 
 class NoteCheckerType(Enum):
@@ -34,18 +38,14 @@ class NotesContainerChecker:
             return False
 
         if self.type_check == NoteCheckerType.BY_BASE_NOTE:
-            print(notes_container)
-            print([
-                self.to_midi_index(self.to_base_notes(notes_container.values())),
-                self.to_midi_index(self.to_base_notes(self.current.notes))
-            ])
-            print(self.to_base_notes(notes_container.values()))
-            print(self.current.notes)
-            print()
-            if (
-                sorted(self.to_midi_index(self.to_base_notes(notes_container.values()))) !=
-                sorted(self.to_midi_index(self.to_base_notes(self.current.notes)))
-            ):
+            if checker_trace.enabled:
+                checker_trace.record(
+                    "check",
+                    self.to_midi_index(self.to_base_notes(notes_container.values())),
+                    self.to_midi_index(self.to_base_notes(self.current.notes)),
+                )
+
+            if PitchClassSet.from_notes(notes_container.values()) != self.current.pitch_class_set:
                 return False
 
         elif self.type_check == NoteCheckerType.BY_MIDI_INDEX:
@@ -164,7 +164,7 @@ class GuitarDisplay(QWidget):
         dot_offset = (self.fret_spacing + self.note_dot_size + self.fret_width) / 2
         half_dot_size = self.dot_size / 2
 
-        chord_note_names = {n.index: str(n.remove_octave()) for n in self.chord.notes}
+        chord_note_names = {n.index: str(n.remove_octave()) for n in self.chord.voicing}
         scale_note_names = {n.index: str(n.remove_octave()) for n in self.scale.notes}
 
         for string_note, string_pos in self.string_position_iterator:
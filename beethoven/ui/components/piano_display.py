@@ -135,7 +135,7 @@ class PianoDisplay(QWidget):
         if self.starts_with_a:
             keys += 2
 
-        chord_note_names = {n.index: str(n.remove_octave()) for n in self.chord.notes}
+        chord_note_names = {n.index: str(n.remove_octave()) for n in self.chord.voicing}
         scale_note_names = {n.index: str(n.remove_octave()) for n in self.scale.notes}
 
         keys = self.keys
@@ -88,7 +88,7 @@ class InversionSpinBox(SpinBox):
         self.valueChanged.connect(self.handle_value_change)
 
     def get_chord_len(self, chord_item: ChordItem) -> int:
-        return len(chord_index.get_intervals(chord_item.name).split(",")) - 1
+        return len(chord_index.get_intervals_table(chord_item.name).intervals) - 1
 
     def set(self, chord_item: ChordItem):
         maximum = 2
@@ -55,7 +55,7 @@ class MappingDialog(QDialog):
         if not self.mapping:
             return
 
-        self.mapping.mappings[key] = value or None
+        self.mapping.set_mapping({key: value or None})
 
         from pprint import pprint
 
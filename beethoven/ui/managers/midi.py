@@ -48,7 +48,6 @@ class MidiManager(QObject):
             self.input_thread.start()
 
     def update_outputs(self, output_names: List[str]):
-        print("update_outputs")
         logger.info(f"outputs set to: {', '.join(output_names) or 'none'}")
 
         for output_name in output_names:
@@ -67,14 +66,19 @@ class MidiManager(QObject):
             self.input_thread = None
 
     def terminate_output_thread(self):
-        self.clean()
-
         if self.output_thread:
             self.output_thread.finished.disconnect()
-            self.output_thread.terminate()
-            self.output_thread.wait()
+            self.output_thread.sequencer.stop()
+
+            # Let the sequencer release its sounding notes before forcing it
+            if not self.output_thread.wait(1000):
+                self.output_thread.terminate()
+                self.output_thread.wait()
+
             self.output_thread = None
 
+        self.clean()
+
     def terminate_threads(self):
         self.terminate_input_thread()
         self.terminate_output_thread()
@@ -1,5 +1,6 @@
 import logging
 from enum import Enum, auto
+from typing import Any, Dict
 
 from PySide6.QtCore import QObject, QThread, Signal
 
@@ -11,8 +12,10 @@ from beethoven.sequencer.utils import setup_players
 from beethoven.settings import AppSettings, PlayerSetting
 from beethoven.ui.managers.midi import MidiManager
 from beethoven.ui.threads import MidiOutputThread
+from beethoven.utils.trace import MANAGER, tracer
 
 logger = logging.getLogger("manager.sequencer")
+manager_trace = tracer[MANAGER]
 
 
 class SequencerState(Enum):
@@ -23,6 +26,7 @@ class SequencerState(Enum):
 
 class SequencerManager(QObject):
     grid_play = Signal(object)
+    grid_update = Signal(object)
     grid_stop = Signal()
     grid_ended = Signal()
 
@@ -43,6 +47,7 @@ class SequencerManager(QObject):
         self._system_player = SystemPlayer(PlayerSetting())
 
         self.grid_play.connect(self._play)
+        self.grid_update.connect(self._update)
         self.grid_stop.connect(self._stop)
 
     def set_harmony_iterator(self, harmony_iterator: HarmonyItemSelector):
@@ -85,13 +90,15 @@ class SequencerManager(QObject):
 
     def _play(self, params):
         if params.get("if_playing") and not self.is_playing():
-            print("Sequencer::Play : not playing, skipping...")
+            if manager_trace.enabled:
+                manager_trace.record("play_skipped", self.state)
             return
         preview = params.get("preview", False)
         # continuous = params.get("continuous", False)
 
         # params.get("preview", not self.is_playing() or self.is_playing_preview())  # params.get("preview", False)
-        print(f"SequencerManager :: Play  : {self.state = }  -  {preview = }        ({params = })")
+        if manager_trace.enabled:
+            manager_trace.record("play", self.state, preview, params)
         logger.info("playing")
 
         if not self.is_stopped():
@@ -106,6 +113,8 @@ class SequencerManager(QObject):
             preview=preview,
             items_change=self.items_change
         )
+        sequencer.start()
+
         self.midi_manager.output_thread = MidiOutputThread(
             midi_adapter=self.adapters.midi,
             sequencer=sequencer
@@ -115,12 +124,32 @@ class SequencerManager(QObject):
         self.midi_manager.output_thread.finished.connect(self.finished)
         # self.midi_manager.output_thread.timeout.connect(self.finished)
 
+    def update(self, **kwargs: Any) -> None:
+        self.grid_update.emit(kwargs)
+
+    def _update(self, params: Dict[str, Any]) -> None:
+        """Hand edits over to the running sequencer, keeping its thread and outputs"""
+
+        if self.state != SequencerState.playing or not self.midi_manager.output_thread:
+            if manager_trace.enabled:
+                manager_trace.record("update_skipped", self.state)
+            return
+
+        if manager_trace.enabled:
+            manager_trace.record("update", params)
+        logger.info("updating")
+
+        if params.pop("reset_players", False):
+            params["players"] = self.get_players()
+
+        self.midi_manager.output_thread.sequencer.update(**params)
+
     def stop(self, **kwargs):
-        print(" ==== STOP")
+        if manager_trace.enabled:
+            manager_trace.record("stop", self.state)
         self.grid_stop.emit()
 
     def _stop(self):
-        print("SequencerManager::Stop")
         logger.info("stopped")
         if not self.is_stopped():
             self.midi_manager.terminate_output_thread()
@@ -134,7 +163,6 @@ class SequencerManager(QObject):
         # self.midi_manager.terminate_output_thread()
 
     def finished(self):
-        print("SequencerManager::Finished")
         logger.info("finished")
 
         if not self.is_stopped():
@@ -4,32 +4,45 @@ from typing import Dict
 from PySide6.QtCore import QThread, SignalInstance
 
 from beethoven.adapters.midi import Input, MidiAdapter
-from beethoven.models import Note
+from beethoven.indexes.notations import NoteSpellingEnum
+from beethoven.models import Note, Scale
 from beethoven.sequencer.runner import Sequencer
+from beethoven.utils.trace import MIDI_INPUT, tracer
+
+midi_input_trace = tracer[MIDI_INPUT]
 
 
 class MidiInputThread(QThread):
-    def __init__(self, midi_input: Input, on_note_change: SignalInstance):
+    def __init__(
+        self,
+        midi_input: Input,
+        on_note_change: SignalInstance,
+        spelling: NoteSpellingEnum = NoteSpellingEnum.FLAT,
+        scale: Scale | None = None,
+    ):
         super(MidiInputThread, self).__init__()
 
         self.logger = logging.getLogger("threads.midi_input")
 
         self.midi_input = midi_input
         self.on_note_change = on_note_change
+        self.midi_notes_table = Note.get_midi_notes_table(spelling=spelling, scale=scale)
 
     def run(self):
         midi_notes: Dict[int, Note] = dict()
-        print("RUN")
+        self.logger.info("run start")
 
         for message in self.midi_input:
             if message.type not in ("note_on", "note_off"):
                 continue
 
-            note = Note.from_midi_index(message.note)
+            note = self.midi_notes_table[message.note]
 
             if message.type == "note_on":
                 midi_notes[message.note] = note
-                print("RUN", [message.note, note])
+
+                if midi_input_trace.enabled:
+                    midi_input_trace.record("note_on", message.note, note)
 
             if message.type == "note_off":
                 if message.note in midi_notes:
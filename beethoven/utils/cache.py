@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import dataclass
+from functools import lru_cache, update_wrapper
+from types import MethodType
+from typing import Any, Callable, Dict, List
+
+
+@dataclass
+class CacheStats:
+    name: str
+    hits: int
+    misses: int
+    maxsize: int | None
+    size: int
+
+
+class ModelCache:
+    """Bounded LRU memoization of a model constructor.
+
+    Composite models are mutable dataclasses, so every call returns a copy of the
+    cached instance (copy-on-return) and callers can't alter what is stored.
+    Immutable models (Note, Interval, Degree) copy to themselves.
+    """
+
+    registry: List[ModelCache] = []
+
+    def __init__(
+        self, func: Callable[..., Any], maxsize: int | None, copier: Callable[[Any], Any]
+    ) -> None:
+        self.func = func
+        self.copier = copier
+        self.cached_func = lru_cache(maxsize=maxsize)(func)
+
+        update_wrapper(self, func)
+
+        ModelCache.registry.append(self)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.copier(self.cached_func(*args, **kwargs))
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+
+        return MethodType(self, instance)
+
+    @property
+    def name(self) -> str:
+        return self.func.__qualname__
+
+    def stats(self) -> CacheStats:
+        info = self.cached_func.cache_info()
+
+        return CacheStats(
+            name=self.name,
+            hits=info.hits,
+            misses=info.misses,
+            maxsize=info.maxsize,
+            size=info.currsize,
+        )
+
+    def clear(self) -> None:
+        self.cached_func.cache_clear()
+
+    @classmethod
+    def clear_all(cls) -> None:
+        for model_cache in cls.registry:
+            model_cache.clear()
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, CacheStats]:
+        return {model_cache.name: model_cache.stats() for model_cache in cls.registry}
+
+
+def copy_model(value: Any) -> Any:
+    """Copy a cached composite model and the lists it holds, sharing the immutable
+    models (Note, Interval, Degree) in them instead of copying them deeply"""
+    if isinstance(value, list):
+        return [copy_model(item) for item in value]
+
+    copied = copy(value)
+
+    if copied is value:
+        return copied
+
+    for name, item in vars(copied).items():
+        if isinstance(item, list):
+            setattr(copied, name, copy_model(item))
+
+    return copied
+
+
+def cache(
+    maxsize: int | None = 128, copier: Callable[[Any], Any] = copy
+) -> Callable[[Callable[..., Any]], ModelCache]:
+    def decorator(func: Callable[..., Any]) -> ModelCache:
+        return ModelCache(func, maxsize=maxsize, copier=copier)
+
+    return decorator
+
+
+def clear_caches() -> None:
+    ModelCache.clear_all()
+
+
+def get_cache_stats() -> Dict[str, CacheStats]:
+    return ModelCache.get_stats()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Tuple
+
+if TYPE_CHECKING:
+    from beethoven.models import Note
+
+PITCH_CLASS_COUNT = 12
+PITCH_CLASS_MASK = (1 << PITCH_CLASS_COUNT) - 1
+
+MIDI_NOTE_COUNT = 128
+MIDI_NOTE_MASK = (1 << MIDI_NOTE_COUNT) - 1
+
+
+@dataclass(frozen=True)
+class PitchClassSet:
+    """12-bit set of pitch classes, bit 0 being C"""
+
+    mask: int = 0
+
+    def __post_init__(self) -> None:
+        if self.mask < 0 or self.mask > PITCH_CLASS_MASK:
+            raise ValueError(f"Invalid mask: {self.mask}, must be between 0 and {PITCH_CLASS_MASK}")
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __contains__(self, index: int) -> bool:
+        return bool(self.mask >> (index % PITCH_CLASS_COUNT) & 1)
+
+    def __and__(self, other: PitchClassSet) -> PitchClassSet:
+        return PitchClassSet(self.mask & other.mask)
+
+    def __or__(self, other: PitchClassSet) -> PitchClassSet:
+        return PitchClassSet(self.mask | other.mask)
+
+    def __le__(self, other: PitchClassSet) -> bool:
+        return self.issubset(other)
+
+    def __ge__(self, other: PitchClassSet) -> bool:
+        return self.issuperset(other)
+
+    def __str__(self) -> str:
+        return format(self.mask, f"0{PITCH_CLASS_COUNT}b")
+
+    @classmethod
+    def from_indexes(cls, indexes: Iterable[int]) -> PitchClassSet:
+        mask = 0
+
+        for index in indexes:
+            mask |= 1 << (index % PITCH_CLASS_COUNT)
+
+        return cls(mask)
+
+    @classmethod
+    def from_notes(cls, notes: Iterable[Note]) -> PitchClassSet:
+        return cls.from_indexes(note.index for note in notes)
+
+    @property
+    def indexes(self) -> Tuple[int, ...]:
+        return tuple(index for index in range(PITCH_CLASS_COUNT) if self.mask >> index & 1)
+
+    def intersection(self, other: PitchClassSet) -> PitchClassSet:
+        return self & other
+
+    def union(self, other: PitchClassSet) -> PitchClassSet:
+        return self | other
+
+    def issubset(self, other: PitchClassSet) -> bool:
+        return self.mask & other.mask == self.mask
+
+    def issuperset(self, other: PitchClassSet) -> bool:
+        return self.mask & other.mask == other.mask
+
+    def transpose(self, semitones: int) -> PitchClassSet:
+        shift = semitones % PITCH_CLASS_COUNT
+
+        return PitchClassSet(
+            ((self.mask << shift) | (self.mask >> (PITCH_CLASS_COUNT - shift))) & PITCH_CLASS_MASK
+        )
+
+
+@dataclass(frozen=True)
+class MidiNoteSet:
+    """128-bit set of MIDI note numbers"""
+
+    mask: int = 0
+
+    def __post_init__(self) -> None:
+        if self.mask < 0 or self.mask > MIDI_NOTE_MASK:
+            raise ValueError(f"Invalid mask: {self.mask}, must fit in {MIDI_NOTE_COUNT} bits")
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __contains__(self, index: int) -> bool:
+        return 0 <= index < MIDI_NOTE_COUNT and bool(self.mask >> index & 1)
+
+    def __and__(self, other: MidiNoteSet) -> MidiNoteSet:
+        return MidiNoteSet(self.mask & other.mask)
+
+    def __or__(self, other: MidiNoteSet) -> MidiNoteSet:
+        return MidiNoteSet(self.mask | other.mask)
+
+    def __le__(self, other: MidiNoteSet) -> bool:
+        return self.issubset(other)
+
+    def __ge__(self, other: MidiNoteSet) -> bool:
+        return self.issuperset(other)
+
+    @classmethod
+    def from_indexes(cls, indexes: Iterable[int]) -> MidiNoteSet:
+        mask = 0
+
+        for index in indexes:
+            if not 0 <= index < MIDI_NOTE_COUNT:
+                raise ValueError(
+                    f"Invalid MIDI index: {index}, must be between 0 and {MIDI_NOTE_COUNT - 1}"
+                )
+
+            mask |= 1 << index
+
+        return cls(mask)
+
+    @classmethod
+    def from_notes(cls, notes: Iterable[Note]) -> MidiNoteSet:
+        return cls.from_indexes(note.midi_index for note in notes)
+
+    @property
+    def indexes(self) -> Tuple[int, ...]:
+        return tuple(index for index in range(MIDI_NOTE_COUNT) if self.mask >> index & 1)
+
+    def intersection(self, other: MidiNoteSet) -> MidiNoteSet:
+        return self & other
+
+    def union(self, other: MidiNoteSet) -> MidiNoteSet:
+        return self | other
+
+    def issubset(self, other: MidiNoteSet) -> bool:
+        return self.mask & other.mask == self.mask
+
+    def issuperset(self, other: MidiNoteSet) -> bool:
+        return self.mask & other.mask == other.mask
+
+    def transpose(self, semitones: int) -> MidiNoteSet:
+        """Shift every note, dropping those falling out of the MIDI range"""
+
+        if semitones >= 0:
+            return MidiNoteSet((self.mask << semitones) & MIDI_NOTE_MASK)
+
+        return MidiNoteSet(self.mask >> -semitones)
+
+    def to_pitch_class_set(self) -> PitchClassSet:
+        mask = self.mask
+        pitch_class_mask = 0
+
+        while mask:
+            pitch_class_mask |= mask & PITCH_CLASS_MASK
+            mask >>= PITCH_CLASS_COUNT
+
+        return PitchClassSet(pitch_class_mask)
@@ -0,0 +1,132 @@
+"""Structured event trace for the real-time paths.
+
+Records are appended to a ring buffer and logged by a background drainer
+thread, so tracing never blocks on output in a timing critical thread. Each
+category is switched on its own, a disabled category only costs an attribute
+lookup at the call site:
+
+    if sequencer_trace.enabled:
+        sequencer_trace.record("send", tick, note)
+
+Categories listed in the BEETHOVEN_TRACE environment variable (comma separated,
+or "all") are enabled at import.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from os import environ
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any, Deque, Dict, List, NamedTuple, Tuple
+
+SEQUENCER = "sequencer"
+PLAYER = "player"
+MIDI_INPUT = "midi_input"
+CHECKER = "checker"
+MANAGER = "manager"
+
+CATEGORIES: Tuple[str, ...] = (SEQUENCER, PLAYER, MIDI_INPUT, CHECKER, MANAGER)
+
+
+class TraceRecord(NamedTuple):
+    time: float
+    category: str
+    event: str
+    values: Tuple[Any, ...]
+
+    def __str__(self) -> str:
+        return " ".join([f"{self.time:.6f}", self.event, *map(str, self.values)])
+
+
+class TraceCategory:
+    def __init__(self, name: str, records: Deque[TraceRecord]):
+        self.name = name
+        self.records = records
+
+        self.enabled = False
+
+    def record(self, event: str, *values: Any) -> None:
+        self.records.append(TraceRecord(perf_counter(), self.name, event, values))
+
+
+class TraceDrainer(Thread):
+    def __init__(self, tracer: Tracer, interval: float):
+        super(TraceDrainer, self).__init__(name="trace_drainer", daemon=True)
+
+        self.tracer = tracer
+        self.interval = interval
+        self.stopping = Event()
+
+    def flush(self) -> None:
+        for record in self.tracer.drain():
+            logging.getLogger(f"trace.{record.category}").debug(record)
+
+    def run(self) -> None:
+        while not self.stopping.wait(self.interval):
+            self.flush()
+
+        self.flush()
+
+    def stop(self) -> None:
+        self.stopping.set()
+        self.join()
+
+
+class Tracer:
+    def __init__(self, size: int = 8192, categories: Tuple[str, ...] = CATEGORIES, interval: float = 0.1):
+        # Appending to a bounded deque is atomic and drops the oldest records when full
+        self.records: Deque[TraceRecord] = deque(maxlen=size)
+        self.categories: Dict[str, TraceCategory] = {
+            name: TraceCategory(name, self.records) for name in categories
+        }
+        self.interval = interval
+
+        self.drainer: TraceDrainer | None = None
+
+    def __getitem__(self, name: str) -> TraceCategory:
+        return self.categories[name]
+
+    @property
+    def enabled(self) -> List[str]:
+        return [name for name, category in self.categories.items() if category.enabled]
+
+    def enable(self, *names: str) -> None:
+        """Enable the given categories, or all of them, and start the drainer"""
+
+        for name in names or self.categories:
+            self.categories[name].enabled = True
+
+        if self.drainer is None:
+            self.drainer = TraceDrainer(self, self.interval)
+            self.drainer.start()
+
+    def disable(self, *names: str) -> None:
+        """Disable the given categories, or all of them, the drainer stops when none is left"""
+
+        for name in names or self.categories:
+            self.categories[name].enabled = False
+
+        if not self.enabled and self.drainer is not None:
+            self.drainer.stop()
+            self.drainer = None
+
+    def drain(self) -> List[TraceRecord]:
+        records = []
+
+        while True:
+            try:
+                records.append(self.records.popleft())
+            except IndexError:
+                return records
+
+
+tracer = Tracer()
+
+trace_names = [name.strip().lower() for name in environ.get("BEETHOVEN_TRACE", "").split(",")]
+
+if "all" in trace_names:
+    tracer.enable()
+elif enabled_names := [name for name in trace_names if name in tracer.categories]:
+    tracer.enable(*enabled_names)
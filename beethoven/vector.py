@@ -0,0 +1,177 @@
+"""Batch chord and scale math over NumPy arrays.
+
+Chords are stored as 2D arrays of MIDI indexes (as given by Note.midi_index),
+one chord per row, sorted and padded on the right with PAD. Scales and pitch
+class sets are stored as 12-bit masks, bit 0 being C, as in PitchClassSet.
+
+NumPy is an optional dependency, install the vector extra to use this module.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Sequence, cast
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover
+    raise ImportError("beethoven.vector requires numpy, install beethoven with the vector extra") from exc
+
+from beethoven.indexes.notations import NoteSpellingEnum
+from beethoven.models import Chord, Note, Scale
+from beethoven.utils.pitch_class import PITCH_CLASS_COUNT, PitchClassSet
+
+PAD = -1
+
+# Note.midi_index of C0 (octave 0 notes are only counted by pitch class), indexes
+# below are pitch classes
+MIDI_INDEX_OFFSET = 24
+
+# Chord rows of MIDI indexes, and pitch class masks
+ChordArray = npt.NDArray[np.int16]
+MaskArray = npt.NDArray[np.int32]
+
+
+def notes_to_array(notes: Iterable[Note]) -> ChordArray:
+    return np.array([note.midi_index for note in notes], dtype=np.int16)
+
+
+def array_to_notes(
+    midi_indexes: Iterable[int],
+    spelling: NoteSpellingEnum = NoteSpellingEnum.FLAT,
+    scale: Scale | None = None,
+) -> List[Note]:
+    notes_table = Note.get_midi_notes_table(spelling=spelling, scale=scale)
+
+    notes = []
+    for index in midi_indexes:
+        if index == PAD:
+            continue
+
+        if index < MIDI_INDEX_OFFSET:
+            notes.append(notes_table[index % PITCH_CLASS_COUNT].remove_octave())
+        else:
+            notes.append(notes_table[int(index) - MIDI_INDEX_OFFSET])
+
+    return notes
+
+
+def chords_to_array(chords: Iterable[Chord], width: int | None = None) -> ChordArray:
+    voicings = Chord.get_voicings(chords)
+    row_width = width or max((len(voicing) for voicing in voicings), default=0)
+
+    array = np.full((len(voicings), row_width), PAD, dtype=np.int16)
+
+    for row, voicing in enumerate(voicings):
+        indexes = sorted(note.midi_index for note in voicing)[:row_width]
+        array[row, : len(indexes)] = indexes
+
+    return array
+
+
+def array_to_chords(array: ChordArray) -> List[Chord | None]:
+    """Identify each row, keeping the best candidate or None"""
+
+    chords: List[Chord | None] = []
+
+    for row in array:
+        candidates = Chord.identify(int(index) for index in row if index != PAD)
+        chords.append(candidates[0] if candidates else None)
+
+    return chords
+
+
+def scales_to_masks(scales: Iterable[Scale]) -> MaskArray:
+    return np.array([scale.pitch_class_set.mask for scale in scales], dtype=np.int32)
+
+
+def masks_to_pitch_class_sets(masks: MaskArray) -> List[PitchClassSet]:
+    return [PitchClassSet(int(mask)) for mask in masks]
+
+
+def get_lengths(array: ChordArray) -> npt.NDArray[np.intp]:
+    return cast(npt.NDArray[np.intp], np.count_nonzero(array != PAD, axis=-1))
+
+
+def sort_rows(array: ChordArray) -> ChordArray:
+    """Sort each row ascending, keeping the padding on the right"""
+
+    sort_keys = np.where(array == PAD, np.iinfo(array.dtype).max, array)
+
+    return np.take_along_axis(array, np.argsort(sort_keys, axis=-1, kind="stable"), axis=-1)
+
+
+def transpose(array: ChordArray, semitones: int | Sequence[int] | npt.NDArray[np.integer]) -> ChordArray:
+    """Transpose every chord, by the same amount or by one amount per row"""
+
+    shift = np.asarray(semitones, dtype=array.dtype)
+    if shift.ndim == 1 and array.ndim == 2:
+        shift = shift[:, np.newaxis]
+
+    return np.where(array == PAD, array, array + shift)
+
+
+def invert(array: ChordArray, inversion: int | Sequence[int] | npt.NDArray[np.integer]) -> ChordArray:
+    """Raise the lowest notes of each chord by an octave, inversion being the
+    count of notes to raise, the same for every row or one per row"""
+
+    array = sort_rows(array)
+
+    inversions = np.asarray(inversion)
+    if inversions.ndim == 1:
+        inversions = inversions[:, np.newaxis]
+
+    inversions = inversions % np.maximum(get_lengths(array), 1)[:, np.newaxis]
+    raised = (np.arange(array.shape[-1]) < inversions) & (array != PAD)
+
+    return sort_rows(np.where(raised, array + PITCH_CLASS_COUNT, array))
+
+
+def to_pitch_classes(array: ChordArray) -> ChordArray:
+    return np.where(array == PAD, array, array % PITCH_CLASS_COUNT)
+
+
+def to_masks(array: ChordArray) -> MaskArray:
+    """Pitch class mask of each chord"""
+
+    bits = np.where(array == PAD, 0, np.left_shift(1, array % PITCH_CLASS_COUNT, dtype=np.int32))
+
+    return cast(MaskArray, np.bitwise_or.reduce(bits, axis=-1))
+
+
+def scale_membership(array: ChordArray, scale_masks: MaskArray) -> npt.NDArray[np.bool_]:
+    """Boolean matrix telling, for each chord row, if it fits in each scale"""
+
+    chord_masks = to_masks(array)[:, np.newaxis]
+
+    return cast(npt.NDArray[np.bool_], (chord_masks & scale_masks[np.newaxis, :]) == chord_masks)
+
+
+def voice_leading_distances(
+    array_1: ChordArray, array_2: ChordArray, pitch_class: bool = False
+) -> npt.NDArray[np.int32]:
+    """Distance matrix between two chord sets.
+
+    Each note moves to the nearest note of the other chord and the distance is the
+    total count of semitones moved both ways, so chords of different sizes compare.
+    With pitch_class, notes move within the octave and octave placement is ignored.
+    """
+
+    notes_1 = array_1[:, np.newaxis, :, np.newaxis].astype(np.int32)
+    notes_2 = array_2[np.newaxis, :, np.newaxis, :].astype(np.int32)
+
+    distances = np.abs(notes_1 - notes_2)
+    if pitch_class:
+        distances %= PITCH_CLASS_COUNT
+        distances = np.minimum(distances, PITCH_CLASS_COUNT - distances)
+
+    padded = (notes_1 == PAD) | (notes_2 == PAD)
+    distances = np.where(padded, np.iinfo(np.int32).max, distances)
+
+    valid_1 = array_1 != PAD
+    valid_2 = array_2 != PAD
+
+    forward = np.where(valid_1[:, np.newaxis, :], distances.min(axis=3), 0).sum(axis=2)
+    backward = np.where(valid_2[np.newaxis, :, :], distances.min(axis=2), 0).sum(axis=2)
+
+    return cast(npt.NDArray[np.int32], forward + backward)
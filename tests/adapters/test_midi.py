@@ -1,6 +1,7 @@
-from pytest import fixture
+from mido import Message
+from pytest import fixture, raises
 
-from beethoven.adapters.midi import MidiMessage, MidiMetaMessage
+from beethoven.adapters.midi import MidiMessage, MidiMetaMessage, encode_message
 
 
 @fixture(scope="function", autouse=True)
@@ -68,3 +69,64 @@ def test_midi_adapter_send_midi_meta_message(adapters, mocker):
     adapters.midi.send_message(message)
 
     assert mocked_midi_send.call_count == 1
+
+
+def test_midi_adapter_send_midi_messages(adapters, mocker):
+    mocked_midi_send = mocker.patch("beethoven.adapters.midi.Output.send")
+
+    piano_output = adapters.midi.open_output("PIANO_CHANNEL")
+    drum_output = adapters.midi.open_output("DRUM_CHANNEL")
+
+    adapters.midi.send_messages(
+        [
+            MidiMessage(origin=None, note=64, output=piano_output, velocity=127, channel=0, type="note_on"),
+            MidiMessage(origin=None, note=36, output=drum_output, velocity=100, channel=9, type="note_on"),
+            MidiMessage(origin=None, note=60, output=piano_output, velocity=0, channel=0, type="note_off"),
+        ]
+    )
+
+    assert [call.args[0] for call in mocked_midi_send.call_args_list] == [
+        Message("note_on", note=64, velocity=127, channel=0),
+        Message("note_off", note=60, velocity=0, channel=0),
+        Message("note_on", note=36, velocity=100, channel=9),
+    ]
+
+
+def test_midi_adapter_send_midi_messages_keeps_meta_message_order(adapters, mocker):
+    sent = []
+    mocker.patch("beethoven.adapters.midi.Output.send", side_effect=sent.append)
+    mocker.patch("beethoven.adapters.midi.Output._send", side_effect=sent.append)
+
+    output = adapters.midi.open_output("PIANO_CHANNEL")
+
+    adapters.midi.send_messages(
+        [
+            MidiMessage(origin=None, note=64, output=output, velocity=127, channel=0, type="note_on"),
+            MidiMetaMessage(output=output, type="text", text="start"),
+            MidiMessage(origin=None, note=64, output=output, velocity=0, channel=0, type="note_off"),
+        ]
+    )
+
+    assert [message.type for message in sent] == ["note_on", "text", "note_off"]
+
+
+def test_midi_adapter_send_midi_messages_on_closed_output(adapters, mocker):
+    mocked_midi_send = mocker.patch("beethoven.adapters.midi.Output.send")
+
+    output = adapters.midi.open_output("PIANO_CHANNEL")
+    output.close()
+
+    with raises(ValueError):
+        adapters.midi.send_messages(
+            [MidiMessage(origin=None, note=64, output=output, velocity=127, channel=0, type="note_on")]
+        )
+
+    assert mocked_midi_send.call_count == 0
+
+
+def test_encode_message():
+    encoded_message = encode_message("note_on", 1, 60, 100)
+
+    assert encoded_message == bytes([0x91, 60, 100])
+    assert encode_message("note_on", 1, 60, 100) is encoded_message
+    assert encode_message("note_off", 0, 60, 0) == bytes([0x80, 60, 0])
@@ -1,8 +1,13 @@
 from pytest import mark
 
-from beethoven.helpers.sequencer import (note_repeater, note_sequencer,
-                                         sort_generator_outputs)
-from beethoven.models import Duration
+from itertools import islice
+
+from beethoven.helpers.sequencer import (NoteSorter, PatternVoice,
+                                         RhythmPattern, note_repeater,
+                                         note_sequencer,
+                                         sort_generator_outputs, tick_repeater,
+                                         tick_sequencer)
+from beethoven.models import Duration, TimeSignature
 
 
 @mark.parametrize(
@@ -100,3 +105,116 @@ def test_sequencer_helper_sort_generator_outputs():
         (Duration.parse("2"), 2),
         (Duration.parse("3"), 2),
     ]
+
+
+def test_tick_repeater_and_sequencer():
+    quarter_ticks = Duration.parse("1").to_ticks()
+
+    repeater = tick_repeater(quarter_ticks, [None], offset_ticks=quarter_ticks // 2)
+    sequencer = tick_sequencer(quarter_ticks, [None], "+.+")
+
+    assert [next(repeater)[0] for _ in range(3)] == [5040, 15120, 25200]
+    assert [next(sequencer)[0] for _ in range(3)] == [0, 20160, 30240]
+
+
+def test_note_sorter_ties_follow_generators_order():
+    sorter = NoteSorter(
+        kick=note_sequencer(Duration.parse("2"), ["kick"], "+"),
+        hh=note_sequencer(Duration.parse("1"), ["hh"], "+"),
+        crash=note_sequencer(Duration.parse("4"), ["crash"], "+"),
+    )
+
+    assert [next(sorter)[1] for _ in range(7)] == ["kick", "hh", "crash", "hh", "kick", "hh", "hh"]
+
+
+def test_note_sorter_refeed():
+    sorter = NoteSorter(
+        kick=note_sequencer(Duration.parse("1"), ["kick"], "+"),
+        snare=note_sequencer(Duration.parse("1"), ["snare"], ".+"),
+    )
+    sorter.refeed_enabled = True
+    sorter.end_cursor = Duration.parse("2")
+
+    assert list(sorter) == [
+        (Duration.parse("0"), "kick"),
+        (Duration.parse("1"), "kick"),
+        (Duration.parse("1"), "snare"),
+    ]
+
+    sorter.end_cursor = Duration.parse("4")
+
+    assert list(sorter) == [
+        (Duration.parse("2"), "kick"),
+        (Duration.parse("3"), "kick"),
+        (Duration.parse("3"), "snare"),
+    ]
+
+
+def test_note_sorter_add_and_remove_generators():
+    sorter = NoteSorter(kick=note_sequencer(Duration.parse("1"), ["kick"], "+"))
+
+    assert next(sorter) == (Duration.parse("0"), "kick")
+
+    sorter.add_generator("hh", note_repeater(Duration.parse("1/2"), ["hh"], Duration.parse("1")))
+
+    assert next(sorter) == (Duration.parse("1"), "kick")
+    assert next(sorter) == (Duration.parse("1"), "hh")
+
+    sorter.remove_generator("kick")
+
+    assert [next(sorter) for _ in range(2)] == [
+        (Duration.parse("3/2"), "hh"),
+        (Duration.parse("2"), "hh"),
+    ]
+
+
+PATTERN_VOICES = (
+    PatternVoice("main", Duration.parse("1"), "+..."),
+    PatternVoice("sec", Duration.parse("1"), ".+++"),
+    PatternVoice("alt", Duration.parse("1/2"), ".+"),
+    PatternVoice("ride", Duration.parse("1/3Q"), "+.+"),
+)
+
+
+def test_rhythm_pattern_compile():
+    rhythm_pattern = RhythmPattern.compile(PATTERN_VOICES, TimeSignature.parse("4/4"))
+
+    assert rhythm_pattern is RhythmPattern.compile(PATTERN_VOICES, TimeSignature.parse("4/4"))
+    assert rhythm_pattern.cycle_ticks == Duration.parse("4").to_ticks()
+    assert len(rhythm_pattern.events) == 4 + 4 + 8
+    assert list(rhythm_pattern.events) == sorted(rhythm_pattern.events)
+
+
+def test_rhythm_pattern_matches_note_sorter():
+    rhythm_pattern = RhythmPattern.compile(PATTERN_VOICES, TimeSignature.parse("4/4"))
+
+    sorter = NoteSorter(
+        **{
+            voice.name: note_sequencer(voice.step, [voice.name], voice.round_robin)
+            for voice in PATTERN_VOICES
+        }
+    )
+
+    assert [
+        (Duration.from_ticks(ticks), PATTERN_VOICES[voice_index].name)
+        for ticks, voice_index in rhythm_pattern.events
+    ] == list(islice(sorter, len(rhythm_pattern.events)))
+
+
+@mark.parametrize(
+    "time_signature,cycle,main_ticks",
+    [
+        ("3/4", "3", ["0"]),
+        ("5/4", "5", ["0", "4"]),
+        ("2/4", "4", ["0"]),
+        ("6/8", "3", ["0"]),
+    ],
+)
+def test_rhythm_pattern_compile_per_time_signature(time_signature, cycle, main_ticks):
+    rhythm_pattern = RhythmPattern.compile(PATTERN_VOICES, TimeSignature.parse(time_signature))
+
+    assert rhythm_pattern.cycle_ticks == Duration.parse(cycle).to_ticks()
+    assert [ticks for ticks, voice_index in rhythm_pattern.events if voice_index == 0] == [
+        Duration.parse(main_tick).to_ticks() for main_tick in main_ticks
+    ]
+    assert all(ticks < rhythm_pattern.cycle_ticks for ticks, _ in rhythm_pattern.events)
@@ -1,4 +1,5 @@
 from beethoven.indexes import chord_index
+from beethoven.indexes.models import ChordMatch
 
 
 def test_chord_index_is_valid():
@@ -18,3 +19,40 @@ def test_chord_index_get_intervals():
 
 def test_chord_index_get_name_from_intervals():
     assert chord_index.get_name_from_intervals("1,3,5,7") == "maj7"
+
+
+def test_chord_index_get_intervals_table():
+    intervals_table = chord_index.get_intervals_table("min7")
+
+    assert intervals_table.intervals == (("1", 0), ("3", -1), ("5", 0), ("7", -1))
+    assert intervals_table.semitones == (0, 3, 7, 10)
+    assert intervals_table.degrees == (0, 2, 4, 6)
+
+
+def test_chord_index_identify_root_position():
+    assert chord_index.identify_midi_indexes([60, 64, 67]) == (ChordMatch(root=0, name="maj"),)
+
+
+def test_chord_index_identify_inversion():
+    matches = chord_index.identify_midi_indexes([64, 67, 72])
+
+    assert matches[0] == ChordMatch(root=0, name="maj", inversion=1)
+    assert ChordMatch(root=0, name="power", base=4) in matches
+
+
+def test_chord_index_identify_omitted_fifth():
+    assert ChordMatch(root=0, name="7", omitted_fifth=True) in chord_index.identify_midi_indexes(
+        [60, 64, 70]
+    )
+
+
+def test_chord_index_identify_foreign_bass():
+    matches = chord_index.identify_midi_indexes([57, 60, 64, 67])
+
+    assert ChordMatch(root=0, name="maj", base=9) in matches
+    assert ChordMatch(root=9, name="min7") in matches
+
+
+def test_chord_index_identify_unknown():
+    assert chord_index.identify_midi_indexes([60, 61, 62]) == ()
+    assert chord_index.identify_midi_indexes([]) == ()
@@ -1,4 +1,6 @@
 from beethoven.indexes import scale_index
+from beethoven.indexes.models import ScaleMatch
+from beethoven.utils.pitch_class import PitchClassSet
 
 
 def test_scale_index_is_valid():
@@ -14,3 +16,38 @@ def test_scale_index_get_names():
 def test_scale_index_get_intervals():
     assert scale_index.get_intervals("pentatonic") == "1,3m,4,5,7m"
     assert scale_index.get_intervals("lydian") == "1,2,3,4a,5,6,7"
+
+
+def test_scale_index_get_intervals_table():
+    intervals_table = scale_index.get_intervals_table("lydian")
+
+    assert intervals_table.intervals == (
+        ("1", 0), ("2", 0), ("3", 0), ("4", 1), ("5", 0), ("6", 0), ("7", 0)
+    )
+    assert intervals_table.semitones == (0, 2, 4, 6, 7, 9, 11)
+    assert intervals_table.degrees == (0, 1, 2, 3, 4, 5, 6)
+
+
+def test_scale_index_get_scales_containing():
+    c_major_mask = PitchClassSet.from_indexes([0, 2, 4, 5, 7, 9, 11]).mask
+    g_major_mask = PitchClassSet.from_indexes([7, 9, 11, 0, 2, 4, 6]).mask
+
+    matches = scale_index.get_scales_containing(PitchClassSet.from_indexes([0, 4, 7, 11]).mask)
+
+    assert ScaleMatch(tonic=0, name="major", mask=c_major_mask) in matches
+    assert ScaleMatch(tonic=7, name="major", mask=g_major_mask) in matches
+    assert not [match for match in matches if match.tonic == 2 and match.name == "major"]
+
+    assert len(scale_index.get_scales_containing(0)) == len(scale_index.scale_matches)
+
+
+def test_scale_index_get_closest_scales():
+    # C major with an added F#
+    mask = PitchClassSet.from_indexes([0, 2, 4, 5, 6, 7, 9, 11]).mask
+
+    matches = scale_index.get_closest_scales(mask, limit=3)
+
+    assert [(match.tonic, match.name) for match in matches] == [(7, "bebop"), (0, "major"), (7, "major")]
+
+    assert scale_index.get_closest_scales(mask, limit=2) == matches[:2]
+    assert len(scale_index.closest_directory[mask]) == len(scale_index.scale_matches)
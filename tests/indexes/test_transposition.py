@@ -0,0 +1,41 @@
+from pytest import mark, raises
+
+from beethoven.indexes import transposition_index
+from beethoven.indexes.models import IntervalSpelling, Transposition
+
+
+@mark.parametrize(
+    "note_name,interval_name,reverse,expected_transposition",
+    [
+        ["C", "3", False, Transposition(name="E", alteration_offset=0, octave_gap=0)],
+        ["A", "3", False, Transposition(name="C", alteration_offset=1, octave_gap=1)],
+        ["A", "3", True, Transposition(name="F", alteration_offset=0, octave_gap=0)],
+        ["B", "8", False, Transposition(name="B", alteration_offset=0, octave_gap=1)],
+        ["Do", "5", True, Transposition(name="F", alteration_offset=0, octave_gap=-1)],
+    ],
+)
+def test_transposition_index_get_transposition(note_name, interval_name, reverse, expected_transposition):
+    assert transposition_index.get_transposition(note_name, interval_name, reverse) == expected_transposition
+
+
+@mark.parametrize(
+    "note_name_1,note_name_2,octave_gap,expected_interval_spelling",
+    [
+        ["C", "E", None, IntervalSpelling(name="3", alteration_offset=0)],
+        ["A", "C", None, IntervalSpelling(name="3", alteration_offset=-1)],
+        ["C", "E", 1, IntervalSpelling(name="10", alteration_offset=0)],
+        ["E", "F", 0, IntervalSpelling(name="2", alteration_offset=-1)],
+    ],
+)
+def test_transposition_index_get_interval_spelling(
+    note_name_1, note_name_2, octave_gap, expected_interval_spelling
+):
+    assert (
+        transposition_index.get_interval_spelling(note_name_1, note_name_2, octave_gap)
+        == expected_interval_spelling
+    )
+
+
+def test_transposition_index_get_interval_spelling_out_of_range():
+    with raises(KeyError):
+        transposition_index.get_interval_spelling("C", "C", 3)
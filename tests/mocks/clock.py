@@ -0,0 +1,14 @@
+class FakeClock:
+    def __init__(self, step=0.0001, sleep_overshoot=0.0):
+        self.now = 100.0
+        self.step = step
+        self.sleep_overshoot = sleep_overshoot
+        self.sleeps = []
+
+    def clock(self):
+        self.now += self.step
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds + self.sleep_overshoot
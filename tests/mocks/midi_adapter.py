@@ -7,22 +7,20 @@ class MockedInput(Output):
     def __init__(self, name, **kwargs):
         self.name = name
 
-    def closed(self):
-        return False
+    closed = False
 
     def close(self, *args, **kwargs):
-        pass
+        self.closed = True
 
 
 class MockedOutput(Output):
     def __init__(self, name, **kwargs):
         self.name = name
 
-    def closed(self):
-        return False
+    closed = False
 
     def close(self, *args, **kwargs):
-        pass
+        self.closed = True
 
 
 class MockedMidiAdapter(MidiAdapter):
@@ -1,6 +1,8 @@
 from pytest import mark, raises
 
-from beethoven.models import Chord, Degree, Interval, Note
+from beethoven.models import (Bpm, Chord, ChordItem, Degree, Duration,
+                              HarmonyItem, Interval, Note, TimeSignature)
+from beethoven.utils.pitch_class import PitchClassSet
 from tests.fixtures.scales import c_major
 
 
@@ -244,3 +246,75 @@ def test_chord_parsing_with_scale_context(
 def test_chord_model_raise_invalid_name():
     with raises(ValueError, match="Invalid name: fake"):
         Chord(root=Note(name="C"), name="fake")
+
+
+@mark.parametrize(
+    "string,expected_indexes",
+    [
+        ["C_maj", (0, 4, 7)],
+        ["A4_min7", (0, 4, 7, 9)],
+        ["C4_maj:i=2", (0, 4, 7)],
+        ["C4_maj:b=A", (0, 4, 7, 9)],
+        ["C4_7:e=9m", (0, 1, 4, 7, 10)],
+    ],
+)
+def test_chord_pitch_class_set(string, expected_indexes):
+    chord = Chord.parse(string)
+
+    assert chord.pitch_class_set.indexes == expected_indexes
+    assert chord.pitch_class_set == PitchClassSet.from_notes(chord.notes)
+
+
+def test_chord_midi_note_set():
+    assert Chord.parse("C4_maj").midi_note_set.indexes == (72, 76, 79)
+
+
+def test_chord_identify():
+    chords = Chord.identify([57, 60, 64, 67])
+
+    assert Chord(root=Note(name="A"), name="min7", inversion=0) in chords
+    assert Chord(root=Note(name="C"), name="maj", inversion=0, base_note=Note(name="A")) in chords
+
+    assert Chord.identify([61, 65, 68]) == [
+        Chord(root=Note(name="D", alteration=-1), name="maj", inversion=0)
+    ]
+
+
+def test_chord_voicing():
+    chord = Chord.parse("C4_maj7:b=E")
+
+    assert chord.voicing == tuple(chord.notes)
+    assert chord.voicing is Chord.parse("C4_maj7:b=E").voicing
+    assert chord.notes is not chord.notes
+
+
+def test_chord_voicing_follows_chord_changes():
+    chord = Chord.parse("C4_maj7")
+    chord.inversion = 1
+
+    assert chord.voicing == tuple(Note.parse_list("E4,G4,B4,C5"))
+
+
+def test_chord_get_voicings():
+    chords = [Chord.parse("D_min7"), Chord.parse("G_7"), Chord.parse("C_maj7")]
+
+    assert Chord.get_voicings(chords) == [tuple(chord.notes) for chord in chords]
+
+
+def test_harmony_item_get_voicings():
+    harmony_item = HarmonyItem(
+        scale=c_major,
+        chord_items=[
+            ChordItem(root=Degree("II"), name="", duration_item=Duration()),
+            ChordItem(root=Degree("V"), name="", duration_item=Duration()),
+            ChordItem(root=Note(name="C"), name="maj7", duration_item=Duration(), inversion=2),
+        ],
+        bpm=Bpm(120),
+        time_signature=TimeSignature(4, 4),
+    )
+
+    assert harmony_item.get_voicings() == [
+        tuple(Note.parse_list("D,F,A,C")),
+        tuple(Note.parse_list("G,B,D,F")),
+        tuple(Note.parse_list("G,B,C,E")),
+    ]
@@ -1,3 +1,5 @@
+from dataclasses import FrozenInstanceError
+
 from pytest import mark, raises
 
 from beethoven.models import Degree
@@ -39,3 +41,19 @@ def test_degree_model_raise_invalid_alteration(alteration):
 )
 def test_degree_model_index_property(name, index):
     assert Degree(name=name).index == index
+
+
+def test_degree_model_is_immutable():
+    degree = Degree(name="III", alteration=-1)
+
+    with raises(FrozenInstanceError):
+        degree.alteration = 0
+
+    assert not hasattr(degree, "__dict__")
+
+
+def test_degree_model_interning():
+    assert Degree.intern("III", -1) is Degree.intern("III", -1)
+    assert Degree.parse("bIII") is Degree.intern("III", -1)
+
+    assert hash(Degree.intern("III", -1)) == hash(Degree(name="III", alteration=-1))
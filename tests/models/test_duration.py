@@ -1,4 +1,4 @@
-from pytest import mark
+from pytest import mark, raises
 
 from beethoven.models import Duration
 
@@ -22,3 +22,27 @@ from beethoven.models import Duration
 )
 def test_duration_parsing(string, expected_obj):
     assert Duration.parse(string) == expected_obj
+
+
+@mark.parametrize(
+    "string,expected_ticks",
+    [
+        ["0", 0],
+        ["Q", 10080],
+        ["W", 40320],
+        ["1/3Q", 3360],
+        ["1/5E", 1008],
+        ["2/3S", 1680],
+        ["1/7S", 360],
+    ],
+)
+def test_duration_ticks_conversion(string, expected_ticks):
+    duration = Duration.parse(string)
+
+    assert duration.to_ticks() == expected_ticks
+    assert Duration.from_ticks(expected_ticks) == duration
+
+
+def test_duration_ticks_conversion_raise_inexact_value():
+    with raises(ValueError, match="can't be expressed in ticks"):
+        Duration.parse("1/11S").to_ticks()
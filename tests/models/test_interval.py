@@ -1,3 +1,5 @@
+from dataclasses import FrozenInstanceError
+
 from pytest import mark, raises
 
 from beethoven.models import Interval
@@ -91,3 +93,19 @@ def test_interval_model_raise_invalid_name():
 def test_interval_model_raise_invalid_alteration(alteration):
     with raises(ValueError, match=f"Invalid alteration: {alteration}, must be between -3 and 3"):
         Interval(name="1", alteration=alteration)
+
+
+def test_interval_model_is_immutable():
+    interval = Interval(name="3", alteration=-1)
+
+    with raises(FrozenInstanceError):
+        interval.alteration = 0
+
+    assert not hasattr(interval, "__dict__")
+
+
+def test_interval_model_interning():
+    assert Interval.intern("3", -1) is Interval.intern("3", -1)
+    assert Interval.parse("3m") is Interval.intern("3", -1)
+
+    assert hash(Interval.intern("3", -1)) == hash(Interval(name="3", alteration=-1))
@@ -1,6 +1,9 @@
+from dataclasses import FrozenInstanceError
+
 from pytest import mark, raises
 
-from beethoven.models import Interval, Note
+from beethoven.indexes.notations import NoteSpellingEnum
+from beethoven.models import Chord, Degree, Interval, Note, Scale
 
 
 @mark.parametrize(
@@ -81,6 +84,33 @@ def test_note_model_raise_invalid_octave(octave):
         Note(name="C", octave=octave)
 
 
+def test_note_model_is_immutable():
+    note = Note(name="C", octave=4)
+
+    with raises(FrozenInstanceError):
+        note.octave = 5
+
+    assert not hasattr(note, "__dict__")
+
+
+def test_note_model_interning():
+    assert Note.intern("C", 1, 4) is Note.intern("C", 1, 4)
+    assert Note.intern("C", 1, 4) == Note(name="C", alteration=1, octave=4)
+    assert Note.parse("C#4") is Note.intern("C", 1, 4)
+
+    assert hash(Note.intern("C", 1, 4)) == hash(Note(name="C", alteration=1, octave=4))
+
+
+def test_note_model_interning_from_chords_and_scales():
+    assert Scale.parse("C4_major").get_note_from_degree(Degree.parse("bIII")) is Note.parse("Eb4")
+    assert Chord.parse("C4_maj").set_root_octave(5).root is Note.parse("C5")
+
+
+def test_note_set_octave():
+    assert Note(name="C").set_octave(4) == Note(name="C", octave=4)
+    assert Note(name="C", octave=4).set_octave(None) == Note(name="C")
+
+
 def test_note_model_greater_equality_methods():
     assert Note(name="C") == Note(name="C")
     assert Note(name="C", alteration=1) == Note(name="C", alteration=1)
@@ -132,6 +162,16 @@ def test_note_add_interval_reversed(note, interval, expected_note):
     assert note.add_interval(interval, reverse=True) == expected_note
 
 
+@mark.parametrize("reverse", [False, True])
+def test_note_transpose_many(reverse):
+    notes = Note.parse_list("C4,Eb4,G#4,B,Fb")
+    interval = Interval(name="6", alteration=-1)
+
+    assert Note.transpose_many(notes, interval, reverse=reverse) == [
+        note.add_interval(interval, reverse=reverse) for note in notes
+    ]
+
+
 @mark.parametrize(
     "note1,note2,expected_interval",
     [
@@ -178,3 +218,34 @@ def test_note_remove_notes_octave():
         Note(name="C"),
         Note(name="E"),
     ]
+
+
+@mark.parametrize(
+    "index,spelling,expected_note",
+    [
+        [0, NoteSpellingEnum.FLAT, Note(name="C", octave=0)],
+        [61, NoteSpellingEnum.FLAT, Note(name="D", alteration=-1, octave=5)],
+        [61, NoteSpellingEnum.SHARP, Note(name="C", alteration=1, octave=5)],
+        [127, NoteSpellingEnum.SHARP, Note(name="G", octave=10)],
+    ],
+)
+def test_note_from_midi_index(index, spelling, expected_note):
+    assert Note.from_midi_index(index, spelling=spelling) == expected_note
+
+
+def test_note_from_midi_index_with_scale():
+    scale = Scale.parse("C#_major")
+
+    assert Note.from_midi_index(65, scale=scale) == Note(name="E", alteration=1, octave=5)
+    assert Note.from_midi_index(72, scale=scale) == Note(name="B", alteration=1, octave=5)
+    assert Note.from_midi_index(70, scale=scale) == Note(name="A", alteration=1, octave=5)
+
+    # Out of range octaves fall back on the spelling policy
+    assert Note.from_midi_index(0, scale=scale) == Note(name="C", octave=0)
+
+
+def test_note_get_midi_notes_table():
+    table = Note.get_midi_notes_table()
+
+    assert len(table) == 128
+    assert table is Note.get_midi_notes_table()
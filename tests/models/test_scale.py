@@ -1,6 +1,7 @@
 from pytest import mark, raises
 
-from beethoven.models import Interval, Note, Scale
+from beethoven.models import Chord, Interval, Note, Scale
+from beethoven.utils.pitch_class import PitchClassSet
 from tests.fixtures.chords import c_major_7th_chords
 from tests.fixtures.scales import a_minor, a_minor_pentatonic, c_major
 
@@ -92,3 +93,60 @@ def test_scale_model_is_diatonic():
 
 def test_scale_get_diatonic_chords():
     assert c_major.get_diatonic_chords() == c_major_7th_chords
+
+
+def test_scale_get_diatonic_triads_and_ninths():
+    assert [chord.name for chord in c_major.get_diatonic_chords(size=3)] == [
+        "maj",
+        "min",
+        "min",
+        "maj",
+        "maj",
+        "min",
+        "dim",
+    ]
+
+    ninth_chords = c_major.get_diatonic_chords(size=5)
+
+    assert [chord.name for chord in ninth_chords] == [chord.name for chord in c_major_7th_chords]
+    assert ninth_chords[2].extensions == [Interval(name="9", alteration=-1)]
+    assert ninth_chords[2].notes == Note.parse_list("E,G,B,D,F")
+
+
+def test_scale_get_diatonic_chords_returns_copies():
+    c_major.get_diatonic_chords()[0].name = "min"
+
+    assert c_major.get_diatonic_chords() == c_major_7th_chords
+
+
+def test_scale_get_diatonic_chords_raise_invalid_size():
+    with raises(ValueError, match="Invalid size: 6, must be 3, 4 or 5"):
+        c_major.get_diatonic_chords(size=6)
+
+
+def test_scale_get_all_diatonic_chords():
+    all_chords = Scale.get_all_diatonic_chords("major")
+
+    assert len(all_chords) == 12
+    assert all_chords[Note(name="C")] == c_major_7th_chords
+    assert all_chords[Note(name="E", alteration=-1)] == Scale.parse("Eb_major").get_diatonic_chords()
+
+
+def test_scale_pitch_class_set():
+    assert c_major.pitch_class_set.indexes == (0, 2, 4, 5, 7, 9, 11)
+    assert a_minor_pentatonic.pitch_class_set == PitchClassSet.from_notes(a_minor_pentatonic.notes)
+    assert a_minor_pentatonic.pitch_class_set <= a_minor.pitch_class_set
+
+
+def test_scale_get_scales_containing():
+    scales = Scale.get_scales_containing(Chord.parse("D_min7").pitch_class_set)
+
+    assert c_major in scales
+    assert Scale.parse("F_major") in scales
+    assert Scale.parse("G_major") not in scales
+
+
+def test_scale_get_closest_scales():
+    scales = Scale.get_closest_scales(c_major.pitch_class_set, limit=3)
+
+    assert scales == [c_major, Scale.parse("A_minor"), Scale.parse("C_ionian")]
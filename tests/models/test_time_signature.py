@@ -139,3 +139,87 @@ def test_time_section_helper_time_section_generator(time_signature, step, count,
         time_section = next(generator)
 
     assert time_section == expected_time_section
+
+
+@mark.parametrize(
+    "time_signature,cursor,expected_time_section",
+    [
+        [TimeSignature(4, 4), Duration.parse("0"), TimeSection(bar=1, measure=1)],
+        [TimeSignature(4, 4), Duration.parse("9/2"), TimeSection(bar=2, measure=1, rest=Fraction(1, 2))],
+        [TimeSignature(6, 8), Duration.parse("1"), TimeSection(bar=1, measure=3)],
+        [TimeSignature(6, 8), Duration.parse("7/2"), TimeSection(bar=2, measure=2)],
+        [TimeSignature(3, 2), Duration.parse("1/3Q"), TimeSection(bar=1, measure=1, rest=Fraction(1, 6))],
+    ],
+)
+def test_time_signature_get_time_section(time_signature, cursor, expected_time_section):
+    assert time_signature.get_time_section(cursor) == expected_time_section
+    assert time_signature.get_time_section_from_ticks(cursor.to_ticks()) == expected_time_section
+
+
+def test_time_signature_get_ticks():
+    assert TimeSignature(4, 4).get_ticks() == TimeSignature(4, 4).get_duration().to_ticks()
+    assert TimeSignature(6, 8).get_ticks() == Duration.parse("3").to_ticks()
+
+
+def test_time_signature_generate_time_sections_with_end_cursor():
+    generator = TimeSignature(3, 4).generate_time_sections(
+        quarter_duration,
+        cursor_offset=Duration.parse("2"),
+        base_time_section=TimeSection(bar=3),
+        end_cursor=Duration.parse("6"),
+    )
+
+    assert list(generator) == [
+        (TimeSection(bar=3, measure=1), Duration.parse("2")),
+        (TimeSection(bar=3, measure=2), Duration.parse("3")),
+        (TimeSection(bar=3, measure=3), Duration.parse("4")),
+        (TimeSection(bar=4, measure=1), Duration.parse("5")),
+    ]
+
+
+def test_time_signature_generate_time_sections_without_ticks_resolution():
+    generator = TimeSignature(4, 4).generate_time_sections(
+        Duration.parse("1/11S"), end_cursor=Duration.parse("1/11")
+    )
+
+    assert [time_section for time_section, _ in generator] == [
+        TimeSection(bar=1, measure=1, rest=Fraction(0)),
+        TimeSection(bar=1, measure=1, rest=Fraction(1, 44)),
+        TimeSection(bar=1, measure=1, rest=Fraction(2, 44)),
+        TimeSection(bar=1, measure=1, rest=Fraction(3, 44)),
+    ]
+
+
+@mark.parametrize(
+    "time_signature,step",
+    [
+        [TimeSignature(4, 4), Duration.parse("Q")],
+        [TimeSignature(3, 4), Duration.parse("H")],
+        [TimeSignature(7, 8), Duration.parse("1/3Q")],
+        [TimeSignature(5, 16), Duration.parse("E")],
+    ],
+)
+def test_time_grid_matches_time_sections(time_signature, step):
+    time_grid = time_signature.get_time_grid(step)
+    step_ticks = step.to_ticks()
+
+    for index in range(50):
+        assert time_grid.get_time_section_at(index, bar_offset=2) == time_signature.get_time_section(
+            step * index, bar_offset=2
+        )
+        assert time_grid.get_time_section(index * step_ticks) == time_signature.get_time_section(step * index)
+
+
+def test_time_grid_get_schedule():
+    time_grid = TimeSignature(4, 4).get_time_grid(quarter_duration)
+    quarter_ticks = quarter_duration.to_ticks()
+
+    assert time_grid is TimeSignature(4, 4).get_time_grid(quarter_duration)
+    assert list(time_grid.get_schedule(quarter_ticks // 2, quarter_ticks * 3)) == [
+        quarter_ticks,
+        quarter_ticks * 2,
+    ]
+    assert time_grid.get_time_sections(0, quarter_ticks * 5)[-1] == (
+        TimeSection(bar=2, measure=1),
+        quarter_ticks * 4,
+    )
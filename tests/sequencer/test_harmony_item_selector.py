@@ -181,3 +181,14 @@ def test_harmony_item_selector_delete_functions(harmony_selector, harmony_item_1
     harmony_selector.delete(HarmonyItem)
 
     assert harmony_selector.harmony_items == [harmony_item_1]
+
+
+def test_harmony_item_selector_run_for(harmony_selector, harmony_item_1, harmony_item_2):
+    assert list(harmony_selector.run_for(1)) == [
+        ((harmony_item_1, chord_item_11), (harmony_item_1, chord_item_12)),
+        ((harmony_item_1, chord_item_12), (harmony_item_1, chord_item_13)),
+        ((harmony_item_1, chord_item_13), (harmony_item_2, chord_item_21)),
+        ((harmony_item_2, chord_item_21), (harmony_item_2, chord_item_22)),
+        ((harmony_item_2, chord_item_22), (harmony_item_2, chord_item_23)),
+        ((harmony_item_2, chord_item_23), (harmony_item_1, chord_item_11)),
+    ]
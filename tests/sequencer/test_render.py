@@ -0,0 +1,94 @@
+from mido import MidiFile
+
+from beethoven.constants.duration import ticks_per_quarter
+from beethoven.models import (Bpm, ChordItem, Degree, Duration, DurationItem,
+                              HarmonyItem, Scale, TimeSignature)
+from beethoven.sequencer.instruments import BasicChordPiano, BasicMetronome
+from beethoven.sequencer.objects import HarmonyItemSelector
+from beethoven.sequencer.render import OfflineRenderer
+from beethoven.settings import PlayerSetting
+
+
+def get_chord_item(degree, duration):
+    return ChordItem(
+        root=Degree.parse(degree), name="", duration_item=DurationItem(base_duration=Duration.parse(duration))
+    )
+
+
+def get_renderer():
+    harmony_items = [
+        HarmonyItem(
+            scale=Scale.parse("C4_major"),
+            bpm=Bpm(120),
+            time_signature=TimeSignature(4, 4),
+            chord_items=[get_chord_item("II", "4"), get_chord_item("V", "2"), get_chord_item("I", "2")],
+        ),
+        HarmonyItem(
+            scale=Scale.parse("A4_minor"),
+            bpm=Bpm(90),
+            time_signature=TimeSignature(3, 4),
+            chord_items=[get_chord_item("I", "3")],
+        ),
+    ]
+    players = [
+        BasicMetronome(PlayerSetting(enabled=True)),
+        BasicChordPiano(PlayerSetting(enabled=True, channel=1)),
+        BasicChordPiano(PlayerSetting(enabled=False, channel=2)),
+    ]
+
+    return OfflineRenderer(HarmonyItemSelector(harmony_items), players)
+
+
+def test_offline_renderer(tmp_path):
+    path = tmp_path / "render.mid"
+
+    stats = get_renderer().save(path, rounds=2)
+
+    midi_file = MidiFile(path)
+
+    assert midi_file.ticks_per_beat == ticks_per_quarter
+    assert len(midi_file.tracks) == 4
+    assert stats.parts == 8
+    assert stats.ticks == Duration.parse("22").to_ticks()
+    assert stats.events == sum(
+        1 for track in midi_file.tracks[1:] for message in track if not message.is_meta
+    )
+    assert stats.events_per_second > 0
+
+    assert [
+        (message.type, message.dict().get("tempo"), message.dict().get("numerator"))
+        for message in midi_file.tracks[0]
+    ] == [
+        ("set_tempo", 500000, None),
+        ("time_signature", None, 4),
+        ("set_tempo", 666667, None),
+        ("time_signature", None, 3),
+        ("set_tempo", 500000, None),
+        ("time_signature", None, 4),
+        ("set_tempo", 666667, None),
+        ("time_signature", None, 3),
+        ("end_of_track", None, None),
+    ]
+
+    metronome_ticks = []
+    tick = 0
+    for message in midi_file.tracks[1]:
+        tick += message.time
+        if message.type == "note_on":
+            metronome_ticks.append(tick)
+
+    assert metronome_ticks == [quarter * ticks_per_quarter for quarter in range(22)]
+
+    chord_notes = [message.note for message in midi_file.tracks[2] if message.type == "note_on"]
+
+    assert chord_notes[:4] == [74, 77, 81, 84]
+    assert not [message for message in midi_file.tracks[3] if not message.is_meta]
+
+
+def test_offline_renderer_is_repeatable():
+    renderer = get_renderer()
+
+    midi_file_1, _ = renderer.render(rounds=1)
+    midi_file_2, _ = renderer.render(rounds=1)
+
+    assert [list(track) for track in midi_file_1.tracks] == [list(track) for track in midi_file_2.tracks]
@@ -0,0 +1,289 @@
+from dataclasses import replace
+from functools import partial
+from threading import Thread
+from time import sleep
+
+from pytest import approx, mark, raises
+
+from beethoven.adapters.midi import MidiEvent
+from beethoven.models import (Bpm, ChordItem, Degree, Duration, DurationItem,
+                              HarmonyItem, Note, Scale, TimeSignature)
+from beethoven.sequencer.instruments import (BasicChordPiano, BasicDrum,
+                                             BasicMetronome)
+from beethoven.sequencer.objects import (HarmonyItemSelector, InvalidHarmonyChordItems,
+                                         Message)
+from beethoven.sequencer.runner import PlayerTarget, Sequencer
+from beethoven.settings import PlayerSetting
+from tests.mocks.clock import FakeClock
+
+
+class FakeMidiAdapter:
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.sent = []
+        self.batches = []
+
+        # (seconds since the run start, callable) run once a batch is sent from then on
+        self.actions = []
+
+    def open_output(self, name):
+        return name
+
+    def send_messages(self, messages):
+        seconds = self.scheduler.clock() - self.scheduler.origin
+
+        self.batches.append(len(messages))
+        self.sent.extend((seconds, message.output, message.type, message.note) for message in messages)
+
+        while self.actions and self.actions[0][0] <= seconds:
+            self.actions.pop(0)[1]()
+
+
+class FakeSignal:
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, *args):
+        self.emitted.append(args)
+
+
+def get_sequencer(preview=True):
+    harmony_items = [
+        HarmonyItem(
+            scale=Scale.parse("C4_major"),
+            bpm=Bpm(600),
+            time_signature=TimeSignature(4, 4),
+            chord_items=[
+                ChordItem(
+                    root=Degree.parse("I"), name="", duration_item=DurationItem(base_duration=Duration.parse("4"))
+                )
+            ],
+        )
+    ]
+    fake_clock = FakeClock()
+    sequencer = Sequencer(
+        midi_adapter=None,
+        harmony_iterator=HarmonyItemSelector(harmony_items),
+        players=[
+            BasicMetronome(PlayerSetting(output_name="metronome", enabled=True)),
+            BasicChordPiano(PlayerSetting(output_name="piano", enabled=True)),
+        ],
+        preview=preview,
+        items_change=FakeSignal(),
+        clock=fake_clock.clock,
+        sleeper=fake_clock.sleep,
+    )
+    sequencer.midi_adapter = FakeMidiAdapter(sequencer.scheduler)
+    sequencer.lookahead = 0.2
+
+    return sequencer
+
+
+def run_until(sequencer, seconds, *actions):
+    sequencer.midi_adapter.actions = [*actions, (seconds, sequencer.stop)]
+    sequencer.run()
+
+    return [
+        (time, output)
+        for time, output, message_type, _ in sequencer.midi_adapter.sent
+        if output.startswith("metronome") and message_type == "note_on"
+    ]
+
+
+def test_sequencer_run_dispatches_on_time():
+    sequencer = get_sequencer()
+
+    sequencer.run()
+
+    sent = sequencer.midi_adapter.sent
+    metronome_times = [time for time, output, message_type, _ in sent if output == "metronome" and message_type == "note_on"]
+
+    assert metronome_times == [approx(beat * 0.1, abs=0.001) for beat in range(16)]
+
+    piano_notes = [(message_type, note) for _, output, message_type, note in sent if output == "piano"]
+
+    assert piano_notes[:4] == [("note_on", note) for note in (72, 76, 79, 83)]
+    assert len(piano_notes) == 4 * 4 * 2
+
+    # Messages of a same deadline go out in one batch, metronome ticks being zero length notes
+    assert sequencer.midi_adapter.batches[:2] == [6, 2]
+    assert sequencer.scheduler.jitter.count == len(sequencer.midi_adapter.batches)
+    assert sequencer.queue.closed and not len(sequencer.queue)
+    assert not sequencer.sounding_notes
+
+
+def test_sequencer_stop():
+    sequencer = get_sequencer(preview=False)
+
+    metronome_notes = run_until(sequencer, 0.15)
+
+    assert [time for time, _ in metronome_notes] == [approx(beat * 0.1, abs=0.001) for beat in range(3)]
+    assert sequencer.items_change.emitted
+
+    # Only the note off of the sounding notes go out after the stop
+    sent = sequencer.midi_adapter.sent
+    released = sent[-sequencer.midi_adapter.batches[-1]:]
+
+    assert [(output, message_type) for _, output, message_type, _ in released] == [("piano", "note_off")] * 4
+    assert all(time < 0.21 for time, _, _, _ in sent)
+
+    piano_notes = [(message_type, note) for _, output, message_type, note in sent if output == "piano"]
+
+    assert sorted(note for message_type, note in piano_notes if message_type == "note_on") == [72, 76, 79, 83]
+    assert sorted(note for message_type, note in piano_notes if message_type == "note_off") == [72, 76, 79, 83]
+    assert not sequencer.sounding_notes
+
+
+def test_sequencer_stop_from_another_thread():
+    harmony_iterator = get_sequencer().harmony_iterator
+    harmony_iterator.harmony_items[0].bpm = Bpm(60)
+
+    sequencer = Sequencer(
+        midi_adapter=None,
+        harmony_iterator=harmony_iterator,
+        players=[BasicChordPiano(PlayerSetting(output_name="piano", enabled=True))],
+        preview=False,
+        items_change=FakeSignal(),
+    )
+    sequencer.midi_adapter = FakeMidiAdapter(sequencer.scheduler)
+
+    thread = Thread(target=sequencer.run)
+    thread.start()
+
+    sleep(0.15)
+    sequencer.stop()
+    thread.join(1)
+
+    assert not thread.is_alive()
+    assert [message_type for _, _, message_type, _ in sequencer.midi_adapter.sent] == ["note_on"] * 4 + ["note_off"] * 4
+
+
+def test_sequencer_stop_before_run():
+    sequencer = get_sequencer(preview=False)
+
+    sequencer.start()
+    sequencer.stop()
+    sequencer.run()
+
+    assert not sequencer.midi_adapter.sent
+    assert not sequencer.items_change.emitted
+
+    # Armed again, the next run plays
+    sequencer.start()
+    sequencer.midi_adapter.actions = [(0.15, sequencer.stop)]
+    sequencer.run()
+
+    assert sequencer.midi_adapter.sent
+
+
+def test_sequencer_loops_over_compiled_timeline():
+    sequencer = get_sequencer(preview=False)
+
+    metronome_notes = run_until(sequencer, 0.75)
+
+    assert [time for time, _ in metronome_notes] == [approx(beat * 0.1, abs=0.001) for beat in range(9)]
+    assert len(sequencer.items_change.emitted) == 3
+
+    # The timeline compiled again for the next loops reuses its segment
+    assert sequencer.timeline_compiler.compiled_segments == 0
+
+
+def test_sequencer_update_players():
+    sequencer = get_sequencer(preview=False)
+    opened_outputs = dict(sequencer._cached_midi_outputs)
+
+    players = [BasicMetronome(PlayerSetting(output_name="metronome_2", enabled=True))]
+    metronome_notes = run_until(sequencer, 0.75, (0.05, partial(sequencer.update, players=players)))
+
+    # Applied from the next part on, without a gap
+    assert [output for _, output in metronome_notes] == ["metronome"] * 4 + ["metronome_2"] * 5
+    assert [time for time, _ in metronome_notes] == [approx(beat * 0.1, abs=0.001) for beat in range(9)]
+
+    assert not [output for time, output, _, _ in sequencer.midi_adapter.sent if time > 0.45 and output == "piano"]
+    assert sequencer.players == players
+    assert opened_outputs.items() <= sequencer._cached_midi_outputs.items()
+
+
+@mark.parametrize("with_harmony_item", [True, False])
+def test_sequencer_update_tempo(with_harmony_item):
+    sequencer = get_sequencer(preview=False)
+    harmony_item = sequencer.harmony_iterator.harmony_items[0]
+
+    # Without items, the bpm goes to the current harmony item
+    update = partial(sequencer.update, harmony_item=harmony_item if with_harmony_item else None, bpm=Bpm(300))
+    metronome_notes = run_until(sequencer, 0.85, (0.05, update))
+
+    assert [time for time, _ in metronome_notes] == [
+        approx(time, abs=0.001) for time in (0.0, 0.1, 0.2, 0.3, 0.4, 0.6, 0.8, 1.0)
+    ]
+    assert harmony_item.bpm == Bpm(300)
+
+
+def test_sequencer_update_applies_values_on_apply_updates():
+    sequencer = get_sequencer(preview=False)
+    harmony_item = sequencer.harmony_iterator.harmony_items[0]
+    chord_item = harmony_item.chord_items[0]
+    revision = harmony_item.revision
+
+    sequencer.update(
+        chord_item=chord_item,
+        chord_values=replace(chord_item, root=Degree.parse("IV")),
+        time_signature=TimeSignature(3, 4),
+    )
+
+    assert chord_item.root == Degree.parse("I")
+    assert harmony_item.time_signature == TimeSignature(4, 4)
+    assert harmony_item.revision == revision
+
+    assert sequencer.apply_updates()
+    assert not sequencer.apply_updates()
+
+    assert chord_item.root == Degree.parse("IV")
+    assert harmony_item.chord_items[0] is chord_item
+    assert harmony_item.time_signature == TimeSignature(3, 4)
+    assert harmony_item.revision == revision + 1
+
+
+def test_sequencer_update_unknown_chord_item():
+    sequencer = get_sequencer(preview=False)
+    chord_item = ChordItem(root=Degree.parse("V"), name="", duration_item=DurationItem())
+
+    with raises(InvalidHarmonyChordItems):
+        sequencer.update(chord_item=chord_item, bpm=Bpm(300))
+
+    with raises(ValueError):
+        sequencer.update(chord_values=chord_item)
+
+    assert not sequencer.apply_updates()
+
+
+def test_player_target_midi_events():
+    drum = BasicDrum(PlayerSetting(enabled=True, channel=9))
+    target = PlayerTarget.build(drum, output="drum")
+
+    assert target.get_midi_events(Message(note=BasicDrum.KICK, player=drum, velocity=100)) == (
+        MidiEvent("note_on", 9, Note.parse("C1").midi_index, 100, "drum"),
+        MidiEvent("note_off", 9, Note.parse("C1").midi_index, 100, "drum"),
+    )
+    assert target.get_midi_events(Message(note=Note.parse("E4"), player=drum))[0].note == 76
+    assert target.get_midi_events(Message(note="Unknown", player=drum)) is None
+
+
+def test_sequencer_player_targets_follow_mapping_and_setting_changes():
+    sequencer = get_sequencer()
+    drum = BasicDrum(PlayerSetting(output_name="drum", enabled=True))
+    drum.mapping = replace(drum.mapping, mappings=dict(drum.mapping.mappings))
+
+    target = sequencer.get_player_target(drum)
+
+    assert sequencer.get_player_target(drum) is target
+    assert target.output == "drum"
+
+    drum.mapping.set_mapping({BasicDrum.KICK: Note.parse("B0")})
+    target = sequencer.get_player_target(drum)
+
+    assert target.midi_indexes[BasicDrum.KICK] == Note.parse("B0").midi_index
+
+    drum.setting.enabled = False
+
+    assert sequencer.get_player_target(drum).enabled is False
@@ -0,0 +1,160 @@
+from threading import Thread
+from time import sleep
+
+from pytest import approx, mark
+
+from beethoven.sequencer.scheduler import DeadlineScheduler, EventQueue, JitterStats
+from tests.mocks.clock import FakeClock
+
+
+def get_scheduler(**kwargs):
+    fake_clock = FakeClock(**kwargs)
+
+    return DeadlineScheduler(clock=fake_clock.clock, sleeper=fake_clock.sleep), fake_clock
+
+
+def test_deadline_scheduler_deadlines_follow_tempo_changes():
+    scheduler, _ = get_scheduler()
+    scheduler.set_tempo(0, 0.5)
+
+    assert scheduler.get_seconds(4) == 2.0
+
+    scheduler.set_tempo(4, 0.25)
+
+    assert scheduler.get_seconds(4) == 2.0
+    assert scheduler.get_seconds(8) == 3.0
+    assert scheduler.get_deadline(8) == scheduler.origin + 3.0
+
+
+def test_deadline_scheduler_does_not_drift():
+    scheduler, fake_clock = get_scheduler(sleep_overshoot=0.0004)
+    scheduler.set_tempo(0, 0.01)
+
+    for tick in range(1, 1001):
+        scheduler.wait_for_tick(tick)
+        # Work done between waits must not delay the next deadlines
+        fake_clock.now += 0.002
+
+    assert fake_clock.now - scheduler.origin == approx(10.0 + 0.002, abs=0.001)
+    assert scheduler.jitter.count == 1000
+    assert scheduler.jitter.max < 0.0002
+    assert all(seconds < 0.01 - scheduler.spin_threshold + 0.0001 for seconds in fake_clock.sleeps)
+
+
+def test_deadline_scheduler_late_deadline():
+    scheduler, fake_clock = get_scheduler()
+    scheduler.set_tempo(0, 0.001)
+
+    fake_clock.now += 0.5
+
+    assert scheduler.wait_for_tick(10) == approx(0.49, abs=0.001)
+    assert not fake_clock.sleeps
+    assert scheduler.jitter.get_histogram()[">25000us"] == 1
+
+
+def test_deadline_scheduler_wait_is_interrupted_by_stopping():
+    scheduler = DeadlineScheduler()
+    scheduler.set_tempo(0, 1.0)
+
+    Thread(target=lambda: (sleep(0.05), scheduler.stopping.set())).start()
+
+    assert scheduler.wait_for_tick(10) < -9.0
+    assert scheduler.jitter.count == 0
+
+
+@mark.parametrize(
+    "late_by,label",
+    [
+        (0.0, "<=100us"),
+        (0.0001, "<=100us"),
+        (0.0003, "<=500us"),
+        (0.002, "<=2500us"),
+        (0.1, ">25000us"),
+    ],
+)
+def test_jitter_stats_histogram(late_by, label):
+    jitter = JitterStats()
+    jitter.add(late_by)
+
+    histogram = jitter.get_histogram()
+
+    assert histogram[label] == 1
+    assert sum(histogram.values()) == 1
+    assert jitter.mean == jitter.max == late_by
+
+
+def test_event_queue_pops_in_deadline_order_below_watermark():
+    queue = EventQueue(maxsize=4)
+
+    queue.push([(1.0, "b"), (0.0, "a"), (2.0, "off")], watermark=2.0)
+
+    assert queue.pop() == (0.0, "a")
+    assert queue.pop() == (1.0, "b")
+    assert not queue.is_poppable()
+
+    queue.push([(2.0, "on")], watermark=4.0)
+
+    assert queue.pop() == (2.0, "off")
+    assert queue.pop() == (2.0, "on")
+
+
+def test_event_queue_close():
+    queue = EventQueue()
+    queue.push([(0.0, "a"), (5.0, "b")], watermark=1.0)
+    queue.close()
+
+    assert queue.wait_for_room() is False
+    assert [queue.pop(), queue.pop(), queue.pop()] == [(0.0, "a"), (5.0, "b"), None]
+
+    queue = EventQueue()
+    queue.push([(0.0, "a")], watermark=1.0)
+    queue.close(clear=True)
+
+    assert queue.pop() is None
+
+
+def test_event_queue_blocks_producer_when_full():
+    queue = EventQueue(maxsize=2)
+    queue.push([(0.0, "a"), (1.0, "b")], watermark=2.0)
+
+    popped = []
+
+    def consume():
+        sleep(0.05)
+        popped.append(queue.pop())
+
+    consumer = Thread(target=consume)
+    consumer.start()
+
+    assert queue.wait_for_room() is True
+    assert popped == [(0.0, "a")]
+
+    consumer.join()
+
+    assert queue.pop() == (1.0, "b")
+
+    queue.push([(3.0, "c"), (4.0, "d")], watermark=2.0)
+
+    # Items past the watermark count towards the size too
+    closer = Thread(target=lambda: (sleep(0.05), queue.close()))
+    closer.start()
+
+    assert queue.wait_for_room() is False
+    assert len(queue) == 2
+
+    closer.join()
+
+
+def test_event_queue_pop_at():
+    queue = EventQueue()
+    queue.push([(0.0, "a"), (1.0, "c"), (0.0, "b"), (2.0, "d")], watermark=2.0)
+
+    assert queue.pop() == (0.0, "a")
+    assert queue.pop_at(0.0) == ["b"]
+    assert queue.pop_at(0.0) == []
+    assert queue.pop_at(1.0) == ["c"]
+    assert queue.pop_at(2.0) == []
+
+    queue.close()
+
+    assert queue.pop_at(2.0) == ["d"]
@@ -0,0 +1,77 @@
+from beethoven.models import (Bpm, ChordItem, Degree, Duration, DurationItem,
+                              HarmonyItem, Scale, TimeSignature)
+from beethoven.sequencer.objects import (Conductor, HarmonyItemSelector,
+                                         Splitter)
+
+
+def get_chord_item(degree, duration=None):
+    return ChordItem(
+        root=Degree.parse(degree),
+        name="",
+        duration_item=DurationItem(base_duration=Duration.parse(duration) if duration else None),
+    )
+
+
+def get_harmony_item(chord_items):
+    return HarmonyItem(
+        scale=Scale.parse("C4_major"), bpm=Bpm(120), time_signature=TimeSignature(4, 4), chord_items=chord_items
+    )
+
+
+def test_splitter_reuses_harmony_item_layout_until_revision_changes():
+    harmony_item = get_harmony_item([get_chord_item("I", "2"), get_chord_item("IV", "2")])
+    splitter = Splitter(conductor=Conductor.build("M"))
+
+    layout = splitter.get_harmony_item_layout(harmony_item)
+
+    assert splitter.get_harmony_item_layout(harmony_item) is layout
+    assert layout[harmony_item.chord_items[1]] == [
+        Duration.parse("2"), Duration.parse("2"), Duration.parse("4"), Duration.parse("4"), Duration.parse("4")
+    ]
+
+    harmony_item.time_signature = TimeSignature(3, 4)
+    harmony_item.bump_revision()
+
+    layout = splitter.get_harmony_item_layout(harmony_item)
+
+    assert splitter.get_harmony_item_layout(harmony_item) is layout
+    assert layout[harmony_item.chord_items[0]][3] == Duration.parse("3")
+
+
+def test_splitter_layout_follows_chord_items_edits():
+    harmony_item = get_harmony_item([get_chord_item("I", "4")])
+    harmony_iterator = HarmonyItemSelector([harmony_item])
+    splitter = Splitter(conductor=Conductor.build("M"))
+
+    splitter.get_harmony_item_layout(harmony_item)
+
+    harmony_iterator.insert(get_chord_item("V"))
+
+    layout = splitter.get_harmony_item_layout(harmony_item)
+
+    assert list(layout) == harmony_item.chord_items
+    assert layout[harmony_item.chord_items[1]][4] == Duration.parse("8")
+
+    # Chord items swapped without a bump are still found
+    harmony_item.chord_items[1] = get_chord_item("II", "2")
+
+    parts = list(
+        splitter.run((harmony_item, harmony_item.chord_items[1]), (harmony_item, harmony_item.chord_items[0]))
+    )
+
+    assert parts[0].chord_duration == Duration.parse("2")
+
+
+def test_splitter_layout_of_long_progression():
+    harmony_item = get_harmony_item([get_chord_item("I", "1") for _ in range(500)])
+    harmony_iterator = HarmonyItemSelector([harmony_item])
+    splitter = Splitter(conductor=Conductor.build("M"))
+
+    parts = [
+        part
+        for sequencer_items, next_sequencer_items in harmony_iterator.run_for(1)
+        for part in splitter.run(sequencer_items, next_sequencer_items)
+    ]
+
+    assert len(parts) == 500
+    assert len(splitter.harmony_item_layouts) == 1
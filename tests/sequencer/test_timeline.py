@@ -0,0 +1,189 @@
+from functools import partial
+
+from beethoven.adapters.midi import MidiEvent
+from beethoven.models import (Bpm, ChordItem, Degree, Duration, DurationItem,
+                              HarmonyItem, Scale, TimeSignature)
+from beethoven.sequencer.instruments import BasicChordPiano, BasicMetronome
+from beethoven.sequencer.objects import HarmonyItemSelector
+from beethoven.sequencer.render import OfflineRenderer
+from beethoven.sequencer.runner import Buffer, PlayerTarget
+from beethoven.sequencer.timeline import TimelineCompiler
+from beethoven.settings import PlayerSetting
+
+
+def get_chord_item(degree, duration):
+    return ChordItem(
+        root=Degree.parse(degree), name="", duration_item=DurationItem(base_duration=Duration.parse(duration))
+    )
+
+
+def get_harmony_iterator():
+    return HarmonyItemSelector([
+        HarmonyItem(
+            scale=Scale.parse("C4_major"),
+            bpm=Bpm(120),
+            time_signature=TimeSignature(4, 4),
+            chord_items=[get_chord_item("II", "4"), get_chord_item("V", "2"), get_chord_item("I", "2")],
+        ),
+        HarmonyItem(
+            scale=Scale.parse("A4_minor"),
+            bpm=Bpm(90),
+            time_signature=TimeSignature(3, 4),
+            chord_items=[get_chord_item("I", "3")],
+        ),
+    ])
+
+
+def get_players():
+    return [
+        BasicMetronome(PlayerSetting(enabled=True)),
+        BasicChordPiano(PlayerSetting(enabled=True, channel=1)),
+    ]
+
+
+def get_compiler(players):
+    return TimelineCompiler(Buffer(generators=players), partial(PlayerTarget.build, output=None))
+
+
+def test_timeline_matches_offline_render():
+    harmony_iterator = get_harmony_iterator()
+    players = get_players()
+
+    timeline = get_compiler(players).compile(harmony_iterator)
+    midi_file, stats = OfflineRenderer(harmony_iterator, players).render(rounds=1)
+
+    assert timeline.parts == list(OfflineRenderer(harmony_iterator, players).get_parts(rounds=1))
+    assert timeline.end_tick == stats.ticks == Duration.parse("11").to_ticks()
+    assert [segment.end_tick for segment in timeline.segments] == [
+        Duration.parse(duration).to_ticks() for duration in ("4", "6", "8", "11")
+    ]
+
+    events = timeline.get_events()
+
+    assert len(events) == stats.events
+    assert all(isinstance(event, MidiEvent) for _, event in events)
+    assert [tick for tick, _ in events] == sorted(tick for tick, _ in events)
+
+    piano_notes = [event.note for _, event in events if event.channel == 1 and event.type == "note_on"]
+
+    assert piano_notes == [
+        message.note for message in midi_file.tracks[2] if message.type == "note_on"
+    ]
+
+
+def test_timeline_compiler_reuses_unchanged_segments():
+    harmony_iterator = get_harmony_iterator()
+    compiler = get_compiler(get_players())
+
+    timeline_1 = compiler.compile(harmony_iterator)
+
+    assert compiler.compiled_segments == 4
+
+    timeline_2 = compiler.compile(harmony_iterator)
+
+    assert compiler.compiled_segments == 0
+    assert all(
+        segment_1 is segment_2 for segment_1, segment_2 in zip(timeline_1.segments, timeline_2.segments)
+    )
+
+
+def test_timeline_compiler_recompiles_edited_chord_only():
+    harmony_iterator = get_harmony_iterator()
+    compiler = get_compiler(get_players())
+
+    timeline_1 = compiler.compile(harmony_iterator)
+
+    harmony_iterator.harmony_items[0].chord_items[1].inversion = 1
+    harmony_iterator.harmony_items[0].bump_revision()
+
+    timeline_2 = compiler.compile(harmony_iterator)
+
+    assert compiler.compiled_segments == 1
+    assert timeline_2.segments[1] is not timeline_1.segments[1]
+    assert timeline_2.segments[1].part_events != timeline_1.segments[1].part_events
+    assert timeline_2.segments[3] is timeline_1.segments[3]
+
+
+def test_timeline_compiler_recompiles_shifted_chords():
+    harmony_iterator = get_harmony_iterator()
+    compiler = get_compiler(get_players())
+
+    compiler.compile(harmony_iterator)
+
+    harmony_iterator.harmony_items[0].chord_items[1].duration_item = DurationItem(
+        base_duration=Duration.parse("1")
+    )
+    harmony_iterator.harmony_items[0].bump_revision()
+
+    timeline = compiler.compile(harmony_iterator)
+
+    assert compiler.compiled_segments == 4
+    assert timeline.end_tick == Duration.parse("10").to_ticks()
+
+
+def test_timeline_compiler_drops_removed_harmony_item_layouts():
+    harmony_iterator = get_harmony_iterator()
+    compiler = get_compiler(get_players())
+
+    compiler.compile(harmony_iterator)
+
+    assert len(compiler.harmony_item_layouts) == 2
+
+    removed_harmony_item = harmony_iterator.harmony_items.pop(1)
+    compiler.compile(harmony_iterator)
+
+    assert list(compiler.harmony_item_layouts) == harmony_iterator.harmony_items
+    assert removed_harmony_item not in compiler.harmony_item_layouts
+
+
+def test_timeline_compiler_recompiles_on_player_change():
+    harmony_iterator = get_harmony_iterator()
+    players = get_players()
+    compiler = get_compiler(players)
+
+    compiler.compile(harmony_iterator)
+
+    players[1].setting.channel = 3
+    timeline = compiler.compile(harmony_iterator)
+
+    assert compiler.compiled_segments == 4
+    assert {event.channel for _, event in timeline.get_events()} == {0, 3}
+
+    compiler.set_players(players[:1])
+    timeline = compiler.compile(harmony_iterator)
+
+    assert compiler.compiled_segments == 4
+    assert {event.channel for _, event in timeline.get_events()} == {0}
+
+
+def test_timeline_segment_index():
+    harmony_iterator = get_harmony_iterator()
+    timeline = get_compiler(get_players()).compile(harmony_iterator)
+
+    assert timeline.get_segment_index(0, 2) == 2
+    assert timeline.get_segment_index(1, 0) == 3
+    assert timeline.get_segment_index(2, 0) == 0
+
+
+def test_timeline_locate_after_edit():
+    harmony_iterator = get_harmony_iterator()
+    compiler = get_compiler(get_players())
+
+    timeline = compiler.compile(harmony_iterator)
+    harmony_item = harmony_iterator.harmony_items[0]
+
+    harmony_item.chord_items[0].duration_item = DurationItem(base_duration=Duration.parse("2"))
+    harmony_item.bump_revision()
+
+    new_timeline = compiler.compile(harmony_iterator)
+
+    assert new_timeline.locate(timeline.segments[1], 0) == (1, 0, Duration.parse("2").to_ticks())
+    assert new_timeline.locate(timeline.segments[3], 0) == (3, 0, Duration.parse("6").to_ticks())
+
+    del harmony_item.chord_items[1]
+    harmony_item.bump_revision()
+
+    new_timeline = compiler.compile(harmony_iterator)
+
+    # The removed chord resumes on the chord taking its place
+    assert new_timeline.locate(timeline.segments[1], 0) == (1, 0, Duration.parse("2").to_ticks())
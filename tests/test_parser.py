@@ -0,0 +1,86 @@
+from itertools import product
+
+from pytest import mark
+
+from beethoven import parser
+
+NOTE_NAMES = parser.ENGLISH_NOTE_NOTATION + parser.SOLFEGE_NOTE_NOTATION
+NOTE_ALTERATIONS = ["", "#", "##", "###", "####", "b", "bb", "bbb", "bbbb", "#b"]
+OCTAVES = ["", *map(str, range(11))]
+
+INTERVAL_NAMES = [str(i) for i in range(1, 16)]
+INTERVAL_ALTERATIONS = ["", "M", "m", "a", "aa", "aaa", "d", "dd", "ddd"]
+
+DEGREE_NAMES = ["I", "II", "III", "IV", "V", "VI", "VII", "i", "ii", "iii", "iv", "v", "vi", "vii"]
+DEGREE_ALTERATIONS = ["", "#", "##", "###", "b", "bb", "bbb"]
+
+DURATION_FRACTIONS = ["", "1", "2", "3", "12", "1/2", "1/3", "3/5", "2/3"]
+DURATION_BASES = ["", "W", "H", "Q", "E", "S"]
+
+
+def pyparsing_parse(pattern, string):
+    return pattern.parseString(string, parseAll=True).asDict()
+
+
+def test_fast_parse_note_conformance():
+    for name, alteration, octave in product(NOTE_NAMES, NOTE_ALTERATIONS, OCTAVES):
+        string = f"{name}{alteration}{octave}"
+
+        assert parser.fast_parse_note(string) == pyparsing_parse(parser.note_pattern, string)
+
+
+def test_fast_parse_interval_conformance():
+    for name, alteration in product(INTERVAL_NAMES, INTERVAL_ALTERATIONS):
+        string = f"{name}{alteration}"
+
+        assert parser.fast_parse_interval(string) == pyparsing_parse(parser.interval_pattern, string)
+
+
+def test_fast_parse_degree_conformance():
+    for name, alteration in product(DEGREE_NAMES, DEGREE_ALTERATIONS):
+        string = f"{alteration}{name}"
+
+        assert parser.fast_parse_degree(string) == pyparsing_parse(parser.degree_pattern, string)
+
+
+def test_fast_parse_duration_conformance():
+    for fraction, base_duration in product(DURATION_FRACTIONS, DURATION_BASES):
+        string = f"{fraction}{base_duration}"
+
+        assert parser.fast_parse_duration(string) == pyparsing_parse(parser.duration_pattern, string)
+
+
+def test_fast_parse_time_signature_conformance():
+    for beats_per_bar, beat_unit in product(range(1, 17), (1, 2, 4, 8, 16, 32)):
+        string = f"{beats_per_bar}/{beat_unit}"
+
+        assert parser.fast_parse_time_signature(string) == pyparsing_parse(
+            parser.time_signature_pattern, string
+        )
+
+
+@mark.parametrize(
+    "pattern,string",
+    [
+        [parser.note_pattern, "C 4"],
+        [parser.note_pattern, "H"],
+        [parser.interval_pattern, "3 m"],
+        [parser.degree_pattern, "IIII"],
+        [parser.duration_pattern, "1 / 2"],
+        [parser.time_signature_pattern, " 3 / 4"],
+    ],
+)
+def test_fast_parse_falls_back_to_pyparsing(pattern, string):
+    assert parser.fast_parsers[id(pattern)](string) is None
+
+    try:
+        expected = pyparsing_parse(pattern, string)
+    except Exception as exc:
+        expected = type(exc)
+
+    try:
+        parsed = parser.parse(pattern, string)
+    except Exception as exc:
+        parsed = type(exc)
+
+    assert parsed == expected
@@ -113,4 +113,15 @@ def test_settings_serializers(clean_default_settings_file):
 
     deserialized = deserialize(serialized, extra_serializers=[extra_serializers])
 
-    assert settings == deserialized
\ No newline at end of file
+    assert settings == deserialized
+
+
+def test_settings_user_defined_tunings_cycle(clean_default_settings_file):
+    settings = AppSettings.load_default()
+    settings.tunings.user_defined["C Standard"] = TuningSetting.build_from_str("C2,F2,A#2,D#3,G3,C4")
+
+    settings.save(TEST_CONFIG_PATH)
+
+    local_settings = AppSettings.load(TEST_CONFIG_PATH)
+
+    assert local_settings.tunings.user_defined == settings.tunings.user_defined
@@ -0,0 +1,73 @@
+from pytest import importorskip
+
+from beethoven.models import Chord, Note, Scale
+
+np = importorskip("numpy")
+vector = importorskip("beethoven.vector")
+
+
+def test_notes_array_conversions():
+    notes = Note.parse_list("C4,Eb4,G4,Bb")
+    array = vector.notes_to_array(notes)
+
+    assert array.tolist() == [72, 75, 79, 10]
+    assert vector.array_to_notes(array) == notes
+
+
+def test_chords_array_conversions():
+    chords = [Chord.parse("C4_maj7"), Chord.parse("G3_7"), Chord.parse("A3_min")]
+    array = vector.chords_to_array(chords)
+
+    assert array.tolist() == [
+        [72, 76, 79, 83],
+        [67, 71, 74, 77],
+        [69, 72, 76, vector.PAD],
+    ]
+    assert [chord.name for chord in vector.array_to_chords(array)] == ["maj7", "7", "min"]
+
+
+def test_transpose():
+    array = vector.chords_to_array([Chord.parse("C4_maj7"), Chord.parse("A3_min")])
+
+    assert vector.transpose(array, 2).tolist() == [[74, 78, 81, 85], [71, 74, 78, vector.PAD]]
+    assert vector.transpose(array, [0, -1]).tolist() == [[72, 76, 79, 83], [68, 71, 75, vector.PAD]]
+
+
+def test_invert():
+    chords = [Chord.parse("C4_maj7"), Chord.parse("A3_min")]
+    array = vector.chords_to_array(chords)
+
+    assert vector.invert(array, 1).tolist() == [[76, 79, 83, 84], [72, 76, 81, vector.PAD]]
+    assert vector.invert(array, [2, 3]).tolist() == [[79, 83, 84, 88], [69, 72, 76, vector.PAD]]
+
+    inverted_chords = [Chord.parse("C4_maj7:i=2"), Chord.parse("A3_min:i=3")]
+
+    assert vector.invert(array, [2, 3]).tolist()[0] == [note.midi_index for note in inverted_chords[0].notes]
+
+
+def test_scale_membership():
+    array = vector.chords_to_array([Chord.parse("D_min7"), Chord.parse("E_7"), Chord.parse("C_maj")])
+    scale_masks = vector.scales_to_masks([Scale.parse("C_major"), Scale.parse("A_harmonic_minor")])
+
+    assert vector.scale_membership(array, scale_masks).tolist() == [
+        [True, True],
+        [False, True],
+        [True, False],
+    ]
+    assert vector.masks_to_pitch_class_sets(scale_masks)[0] == Scale.parse("C_major").pitch_class_set
+
+
+def test_voice_leading_distances():
+    array_1 = vector.chords_to_array([Chord.parse("G3_7"), Chord.parse("C4_maj")])
+    array_2 = vector.chords_to_array([Chord.parse("C4_maj"), Chord.parse("C4_maj:i=2")])
+
+    distances = vector.voice_leading_distances(array_1, array_2)
+
+    assert distances.shape == (2, 2)
+    assert distances[1, 0] == 0
+    assert distances[1, 1] == 24
+
+    pitch_class_distances = vector.voice_leading_distances(array_1, array_2, pitch_class=True)
+
+    assert pitch_class_distances[1].tolist() == [0, 0]
+    assert pitch_class_distances[0, 0] == pitch_class_distances[0, 1] == 6
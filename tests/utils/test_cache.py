@@ -0,0 +1,88 @@
+from beethoven.models import Chord, Interval, Note, Scale
+from beethoven.utils.cache import cache, clear_caches, get_cache_stats
+
+
+def test_cache_counts_hits_and_misses():
+    calls = []
+
+    @cache(maxsize=2)
+    def double(value):
+        calls.append(value)
+
+        return value * 2
+
+    assert double(1) == 2
+    assert double(1) == 2
+    assert double(2) == 4
+
+    stats = double.stats()
+
+    assert calls == [1, 2]
+    assert (stats.hits, stats.misses, stats.maxsize, stats.size) == (1, 2, 2, 2)
+
+
+def test_cache_is_bounded():
+    calls = []
+
+    @cache(maxsize=2)
+    def identity(value):
+        calls.append(value)
+
+        return value
+
+    for value in (1, 2, 3, 1):
+        identity(value)
+
+    assert calls == [1, 2, 3, 1]
+    assert identity.stats().size == 2
+
+
+def test_cache_clear():
+    @cache(maxsize=2)
+    def identity(value):
+        return value
+
+    identity(1)
+    identity.clear()
+
+    stats = identity.stats()
+
+    assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)
+
+
+def test_cache_shares_immutable_models():
+    assert Note.parse("C4") is Note.parse("C4")
+    assert Interval.parse("3") is Interval.parse("3")
+
+
+def test_cache_copies_mutable_parts_of_models():
+    chord = Chord.parse("C4_maj:e=9")
+    chord.root = Note(name="D", octave=4)
+    chord.extensions.append(Interval.parse("11"))
+
+    cached_chord = Chord.parse("C4_maj:e=9")
+
+    assert cached_chord.root == Note(name="C", octave=4)
+    assert cached_chord.extensions == [Interval.parse("9")]
+    assert chord.extensions[0] is cached_chord.extensions[0]
+
+
+def test_cache_shares_immutable_parts_of_models():
+    chord = Chord.parse("C4_maj")
+    scale = Scale.parse("C4_major")
+
+    assert chord is not Chord.parse("C4_maj")
+    assert chord.root is Chord.parse("C4_maj").root
+    assert scale is not Scale.parse("C4_major")
+    assert scale.tonic is Scale.parse("C4_major").tonic
+
+
+def test_cache_stats_are_registered():
+    clear_caches()
+
+    Note.parse("D")
+    Note.parse("D")
+
+    stats = get_cache_stats()["Note.parse"]
+
+    assert (stats.hits, stats.misses) == (1, 1)
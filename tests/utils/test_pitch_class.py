@@ -0,0 +1,72 @@
+from pytest import raises
+
+from beethoven.models import Note
+from beethoven.utils.pitch_class import MidiNoteSet, PitchClassSet
+
+c_major_triad = PitchClassSet.from_indexes([0, 4, 7])
+c_major_scale = PitchClassSet.from_indexes([0, 2, 4, 5, 7, 9, 11])
+
+
+def test_pitch_class_set_from_indexes():
+    assert c_major_triad.mask == 0b000010010001
+    assert c_major_triad.indexes == (0, 4, 7)
+    assert len(c_major_triad) == 3
+
+    assert PitchClassSet.from_indexes([12, 16, 19]) == c_major_triad
+
+
+def test_pitch_class_set_from_notes():
+    assert PitchClassSet.from_notes(Note.parse_list("C4,E5,G,C3")) == c_major_triad
+
+
+def test_pitch_class_set_raise_invalid_mask():
+    with raises(ValueError, match="Invalid mask: 4096, must be between 0 and 4095"):
+        PitchClassSet(1 << 12)
+
+
+def test_pitch_class_set_contains():
+    assert 4 in c_major_triad
+    assert 16 in c_major_triad
+    assert 5 not in c_major_triad
+
+
+def test_pitch_class_set_subset():
+    assert c_major_triad <= c_major_scale
+    assert c_major_scale >= c_major_triad
+    assert not c_major_scale.issubset(c_major_triad)
+
+
+def test_pitch_class_set_intersection_and_union():
+    g_major_triad = PitchClassSet.from_indexes([7, 11, 2])
+
+    assert c_major_triad & g_major_triad == PitchClassSet.from_indexes([7])
+    assert c_major_triad | g_major_triad == PitchClassSet.from_indexes([0, 2, 4, 7, 11])
+
+
+def test_pitch_class_set_transpose():
+    assert c_major_triad.transpose(7) == PitchClassSet.from_indexes([7, 11, 2])
+    assert c_major_triad.transpose(-1) == PitchClassSet.from_indexes([11, 3, 6])
+    assert c_major_triad.transpose(12) == c_major_triad
+
+
+def test_midi_note_set():
+    notes = MidiNoteSet.from_indexes([60, 64, 67, 72])
+
+    assert notes.indexes == (60, 64, 67, 72)
+    assert len(notes) == 4
+    assert 64 in notes
+    assert 65 not in notes
+
+    assert notes.to_pitch_class_set() == c_major_triad
+
+
+def test_midi_note_set_transpose():
+    notes = MidiNoteSet.from_indexes([0, 60, 127])
+
+    assert notes.transpose(1) == MidiNoteSet.from_indexes([1, 61])
+    assert notes.transpose(-1) == MidiNoteSet.from_indexes([59, 126])
+
+
+def test_midi_note_set_raise_invalid_index():
+    with raises(ValueError, match="Invalid MIDI index: 128, must be between 0 and 127"):
+        MidiNoteSet.from_indexes([128])
@@ -0,0 +1,59 @@
+import logging
+
+from beethoven.utils.trace import CATEGORIES, SEQUENCER, Tracer
+
+
+def test_tracer_categories_are_disabled_by_default():
+    tracer = Tracer()
+
+    assert tracer.enabled == []
+    assert not tracer[SEQUENCER].enabled
+    assert tracer.drainer is None
+
+
+def test_tracer_ring_buffer_keeps_latest_records():
+    tracer = Tracer(size=3)
+
+    for index in range(5):
+        tracer[SEQUENCER].record("send", index)
+
+    assert [record.values for record in tracer.drain()] == [(2,), (3,), (4,)]
+    assert tracer.drain() == []
+
+
+def test_tracer_enable_and_disable_categories():
+    tracer = Tracer()
+
+    tracer.enable(SEQUENCER, "player")
+
+    assert tracer.enabled == [SEQUENCER, "player"]
+    assert tracer.drainer.is_alive()
+
+    tracer.disable(SEQUENCER)
+
+    assert tracer.enabled == ["player"]
+    assert tracer.drainer is not None
+
+    tracer.disable()
+
+    assert tracer.enabled == []
+    assert tracer.drainer is None
+
+    tracer.enable()
+
+    assert tracer.enabled == list(CATEGORIES)
+
+    tracer.disable()
+
+
+def test_tracer_drainer_logs_records(caplog):
+    tracer = Tracer(interval=60)
+    tracer.enable(SEQUENCER)
+
+    with caplog.at_level(logging.DEBUG, logger="trace"):
+        tracer[SEQUENCER].record("dispatch", "C4", "note_on")
+        tracer.disable()
+
+    assert [(record.name, record.getMessage().split()[1:]) for record in caplog.records] == [
+        ("trace.sequencer", ["dispatch", "C4", "note_on"])
+    ]